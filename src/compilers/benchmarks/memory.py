@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+from pathlib import Path
+import tracemalloc
+
+from ..compyler.ast_checks.ast_check import AstCheck
+from ..compyler.ast_generator import AstGenerator
+from ..compyler.expressions.expression import Expression
+from ..compyler.statements.statement import Statement
+from ..compyler.tokenizer import Tokenizer
+from ..compyler.tokens.token import Token
+from ..compyler.types.type_applier import TypeApplier
+from ..compyler.types.type_resolver import TypeResolver
+from ..compyler.types.types import Types
+from ..compyler.utils.ast import AST
+from ..compyler.utils.logger import configure_logging
+from ..compyler.utils.stream import Stream
+
+repo_root: Path = Path(__file__).parents[3].resolve()
+
+
+def attributes(obj: object) -> list[object]:
+    """returns the attribute values of the object, from its __dict__ and/or its __slots__"""
+    values: list[object] = list(getattr(obj, "__dict__", {}).values())
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                values.append(getattr(obj, slot))
+    return values
+
+
+def count_nodes(obj: object, seen: set[int]) -> int:
+    """returns the number of statements and expressions reachable from the object"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, list | tuple):
+        return sum(count_nodes(item, seen) for item in obj)
+    if not isinstance(obj, Statement | Expression):
+        return 0
+    return 1 + sum(count_nodes(value, seen) for value in attributes(obj))
+
+
+def measure_tokens(file: Path) -> tuple[Stream[Token], int]:
+    """tokenizes the file, returns the tokens and the bytes allocated for the tokens"""
+    tracemalloc.start()
+    # the tokenizer (and the source it holds) is freed, only the tokens are kept
+    tokens: Stream[Token] = Tokenizer(file).tokenize()
+    allocated: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tokens, allocated
+
+
+def measure_ast(file: Path, tokens: Stream[Token]) -> tuple[AST, int]:
+    """generates and checks the AST of the typed tokens, returns the AST and the bytes allocated for the AST"""
+    types: Types = TypeResolver(tokens).resolve()
+    TypeApplier(file, types).apply(tokens)
+    tracemalloc.start()
+    ast: AST = AstGenerator(file, tokens, types).generate()
+    # the checks add the types to the expressions
+    AstCheck(ast).run()
+    allocated: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ast, allocated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="measures the memory usage per token and per AST node")
+    parser.add_argument("file", type=Path, nargs="?", default=repo_root / "examples" / "current_functionality.tim")
+    args: argparse.Namespace = parser.parse_args()
+    configure_logging(-1)
+
+    tokens, token_bytes = measure_tokens(args.file)
+    num_tokens: int = len(tokens)
+    ast, ast_bytes = measure_ast(args.file, tokens)
+    num_nodes: int = count_nodes(ast.statements.objects, set())
+
+    print(f"file:   {args.file}")
+    print(f"tokens: {num_tokens:>8d} {token_bytes / 1024:>10.1f} KiB {token_bytes / num_tokens:>8.1f} bytes/token")
+    print(f"nodes:  {num_nodes:>8d} {ast_bytes / 1024:>10.1f} KiB {ast_bytes / num_nodes:>8.1f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
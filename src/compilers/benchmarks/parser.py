@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from ..compyler.ast_generator import AstGenerator
+from ..compyler.tokenizer import Tokenizer
+from ..compyler.tokens.token import Token
+from ..compyler.types.type_applier import TypeApplier
+from ..compyler.types.type_resolver import TypeResolver
+from ..compyler.types.types import Types
+from ..compyler.utils.logger import configure_logging
+from ..compyler.utils.stream import Stream
+
+# the statements of a block, every kind of statement and expressions with all precedence levels
+BLOCK: str = """u8 value_{index} = 7 + 3 * (value_{index} - 1) / 2
+u1 check_{index} = value_{index} == 4 && !check_{index} || value_{index} < 2
+value_{index} += 1
+if value_{index} > 3:
+    println(value_{index})
+else:
+    print("value {{value_{index}}}")
+for u8 i = 0; i < value_{index}; i++:
+    if i == 2:
+        continue
+    while check_{index}:
+        break
+"""
+
+
+def statements(count: int) -> str:
+    """returns source code with the number of blocks of statements"""
+    return "".join(BLOCK.format(index=index) for index in range(count))
+
+
+def measure(folder: Path, count: int, repeat: int) -> tuple[float, int]:
+    """returns the best time [s] to parse a file with the number of blocks of statements, and the number of tokens"""
+    file: Path = folder / f"statements_{count}.tim"
+    file.write_text(statements(count))
+    tokens: Stream[Token] = Tokenizer(file).tokenize()
+    types: Types = TypeResolver(tokens).resolve()
+    TypeApplier(file, types).apply(tokens)
+    best: float = float("inf")
+    # like timeit, disable the garbage collector
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            AstGenerator(file, tokens, types).generate()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best, len(tokens)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="measures the time to parse the tokens to an AST")
+    parser.add_argument("counts", type=int, nargs="*", default=[100, 1000, 4000])
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of repetitions, the best is reported")
+    args: argparse.Namespace = parser.parse_args()
+    configure_logging(-1)
+
+    print(f"{'blocks':>8} {'tokens':>8} {'time [ms]':>10} {'per token [us]':>15}")
+    with tempfile.TemporaryDirectory() as folder:
+        for count in args.counts:
+            duration, num_tokens = measure(Path(folder), count, args.repeat)
+            print(f"{count:>8d} {num_tokens:>8d} {duration * 1000:>10.1f} {duration / num_tokens * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+import gc
+import time
+
+from ..compyler.utils.stream import Stream
+
+
+def measure(count: int) -> float:
+    """returns the time [s] of a pass over a stream of objects, replacing 4 objects with 1 every 8 objects"""
+    stream: Stream[int] = Stream()
+    stream.add(*range(count))
+    # like timeit, disable the garbage collector
+    gc.collect()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        for value in stream.iter():
+            if value % 8 == 0 and stream._index + 3 <= len(stream):  # pyright: ignore[reportPrivateUsage]
+                stream.replace(4, -value)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="measures the scaling of replacements in a stream pass")
+    parser.add_argument("counts", type=int, nargs="*", default=[10000, 40000, 160000, 640000])
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"{'objects':>8} {'time [ms]':>10} {'per object [ns]':>16}")
+    for count in args.counts:
+        duration: float = measure(count)
+        print(f"{count:>8d} {duration * 1000:>10.1f} {duration / count * 1e9:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
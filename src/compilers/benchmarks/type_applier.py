@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from ..compyler.tokenizer import Tokenizer
+from ..compyler.tokens.token import Token
+from ..compyler.types.type_applier import TypeApplier
+from ..compyler.types.type_resolver import TypeResolver
+from ..compyler.types.types import Types
+from ..compyler.utils.logger import configure_logging
+from ..compyler.utils.stream import Stream
+
+
+def list_declarations(count: int) -> str:
+    """returns source code with the number of list declarations, and some other statements in between"""
+    return "".join(
+        f"list[u{8 << (index % 4)}] values_{index}\nu8 value_{index} = {index % 256}\n" for index in range(count)
+    )
+
+
+def measure(folder: Path, count: int) -> float:
+    """returns the time [s] to apply the types to the tokens of a file with the number of list declarations"""
+    file: Path = folder / f"lists_{count}.tim"
+    file.write_text(list_declarations(count))
+    tokens: Stream[Token] = Tokenizer(file).tokenize()
+    types: Types = TypeResolver(tokens).resolve()
+    # like timeit, disable the garbage collector, its full collections over all tokens would hide the scaling
+    gc.collect()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        TypeApplier(file, types).apply(tokens)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="measures the scaling of the type applier with the number of lists")
+    parser.add_argument("counts", type=int, nargs="*", default=[1000, 2000, 4000, 8000, 16000])
+    args: argparse.Namespace = parser.parse_args()
+    configure_logging(-1)
+
+    print(f"{'lists':>8} {'time [ms]':>10} {'per list [us]':>14}")
+    with tempfile.TemporaryDirectory() as folder:
+        for count in args.counts:
+            duration: float = measure(Path(folder), count)
+            print(f"{count:>8d} {duration * 1000:>10.1f} {duration / count * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,171 +4,178 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+
 import argparse
-from os import system
 from pathlib import Path
+import time
 
-from .ast_generator import AstGenerator
-from .code_generator import CodeGenerator
-from .tokenizer import Tokenizer
-from .tokens.token import Token
-from .types.type_applier import TypeApplier
-from .types.type_resolver import TypeResolver
-from .types.types import Types
-from .utils.ast import AST
-from .utils.stream import Stream
-from .ast_checks.ast_check import AstCheck
-
+from .batch import compile_batch
+from .build import compile_file
+from .build import repo_root
+from .build import stdlib_folder
+from .build import templates_folder
+from .errors.tapl_error import TaplError
+from .utils.job_runner import JobRunner
+from .utils.logger import configure_logging
+from .utils.logger import logger
+from .utils.timings import Timings
 
-# get to the repo root folder, several levels up
-repo_root: Path = Path(__file__).parents[3].resolve()
-stdlib_folder: Path = repo_root / "src" / "stdlib"
-templates_folder: Path = repo_root / "src" / "templates"
+# the time between checks for changes of the watched files in watch mode [s]
+WATCH_INTERVAL: float = 0.25
 
 
-def argument_parser() -> Path:
+def argument_parser(arguments: list[str] | None = None) -> argparse.Namespace:
+    """returns the parsed arguments, from the command line when no arguments are provided"""
     parser = argparse.ArgumentParser()
-    parser.add_argument("file")
-    parsed_args = parser.parse_args()
-    return Path(parsed_args.file)
-
-
-def tokenize(file: Path) -> Stream[Token]:
-    print(f"calling the compiler with file '{file}'")
-    tokens: Stream[Token] = Tokenizer(file).tokenize()
-    print(tokens.objects)
-    return tokens
-
-
-def typing_passes(filename: Path, tokens: Stream[Token]) -> Types:
-    # resolve the types in the file
-    type_resolver: TypeResolver = TypeResolver(tokens)
-    types: Types = type_resolver.resolve()
-    # apply the types to the tokens in the stream (in place)
-    type_applier: TypeApplier = TypeApplier(filename, types)
-    type_applier.apply(tokens)
-    # return the processed tokens
-    return types
-
-
-def generate_ast(file: Path, tokens: Stream[Token], types: Types) -> AST:
-    ast: AST = AstGenerator(file, tokens, types).generate()
-    print(*ast.statements.objects, sep="\n")
-    return ast
-
-
-def check_ast(ast: AST) -> None:
-    """run several checks on the generated AST"""
-    AstCheck(ast).run()
-
-
-def create_build_folders() -> tuple[Path, Path]:
-    build_folder: Path = repo_root / "build" / "compyler"
-    header_folder: Path = build_folder / "tapl_headers"
-    # ensure the build and header folders exists
-    build_folder.mkdir(parents=True, exist_ok=True)
-    header_folder.mkdir(parents=True, exist_ok=True)
-    return build_folder, header_folder
-
-
-def generate_code(ast: AST, build_folder: Path, header_folder: Path, templates_folder: Path) -> Path:
-    main_c_file: Path = build_folder / "main.c"
-    CodeGenerator(ast, build_folder, header_folder, templates_folder).generate_c(main_c_file)
-    return main_c_file
-
-
-def copy_stdlib(header_folder: Path, stdlib_folder: Path) -> None:
-    # recursively copy all header files to the header folder
-    # using the neat Path.copy_into function, available since python 3.14
-    for header in stdlib_folder.glob("*.h"):
-        header.copy_into(header_folder)
-
-
-def format_files(folder: Path) -> None:
-    # recursively find all .c and .h files in the build folder and format all found files
-    for file_path in folder.rglob("*.[ch]"):
-        if file_path.is_file():
-            command: str = f"clang-format -i --fallback-style=none {file_path}"
-            print(command)
-            if error_code := system(command):
-                handle_error(f"clang-format failed to format {file_path} with error code {error_code}")
-
-
-def compile_c(c_file: Path, build_folder: Path) -> Path:
-    executable: Path = c_file.parent / "main"
-
-    # remove the old executable (if it exists)
-    command: str = f"rm -f {executable}"
-    print(command)
-    system(command)
-
-    # directly call the gcc compiler, passing the build folder as additional include path
-    command: str = f"gcc -O0 -g3 -I{build_folder} -o {executable} {c_file}"
-    print(command)
-    if error_code := system(command):
-        handle_error(f"gcc returned error code {error_code}")
-    return executable
-
-
-def run_executable(executable: Path):
-    print(executable)
-    system(executable)
-
-
-def handle_error(error_msg: str):
-    # lazy import the inspect and colors modules for error handling
-    import inspect
-    from inspect import FrameInfo
-
-    from .utils.colors import Colors
-
-    # try to get the line number of the function calling this function
-    stack: list[FrameInfo] = inspect.stack()
-    line: str = f"{stack[1].lineno}:" if len(stack) >= 2 else ""
-
-    # construct the filename and error message with colors
-    filename: str = f"\n{Colors.BOLD}{__file__}:{line} {Colors.RESET}"
-    error: str = f"{Colors.BOLD}{Colors.RED}internal compiler error: {Colors.RESET}"
-
-    # print the error and exit with failure
-    print(f"{filename}{error}{error_msg}!")
-    print(f"{Colors.BOLD}{Colors.MAGENTA}terminating...{Colors.RESET}")
-    exit(1)
+    parser.add_argument("files", type=Path, nargs="+", metavar="file", help="the .tim files and/or folders to compile")
+    parser.add_argument("-j", "--jobs", type=int, help="the number of files compiled in parallel (default: all cpus)")
+    parser.add_argument("--no-cache", action="store_true", help="always rebuild, even if the inputs are unchanged")
+    parser.add_argument("--watch", action="store_true", help="rebuild and run the file whenever it changes")
+    parser.add_argument(
+        "--tokenizer",
+        choices=["classic", "regex", "mapped"],
+        default="classic",
+        help="the tokenizer engine, the regex engine is faster but experimental, "
+        "the mapped engine memory maps the file and scans its bytes (for large files)",
+    )
+    # the storage of the tokens between the compiler phases
+    token_storage = parser.add_mutually_exclusive_group()
+    token_storage.add_argument(
+        "--streaming",
+        action="store_true",
+        help="tokenize lazily while generating the AST, instead of tokenizing the whole file first",
+    )
+    token_storage.add_argument(
+        "--compact",
+        action="store_true",
+        help="store the tokens in compact arrays, reduces the memory usage for large files",
+    )
+    parser.add_argument("--format", action="store_true", help="format the generated c-code with clang-format")
+    parser.add_argument(
+        "--separate-checks",
+        action="store_true",
+        help="check the AST with the separate scoping, typing and verification passes (for debugging)",
+    )
+    # options of the c compiler, the default is an unoptimized debug build
+    parser.add_argument("--cc", choices=["gcc", "clang"], default="gcc", help="the c compiler to use")
+    parser.add_argument("--release", action="store_true", help="optimized build (-O2) without debug information")
+    parser.add_argument("-O", choices=["0", "1", "2", "3", "s"], dest="optimization", help="the optimization level")
+    parser.add_argument("--march", help="the target architecture, e.g. --march=native")
+    parser.add_argument("--lto", action="store_true", help="enable link time optimization")
+    parser.add_argument("--pgo", action="store_true", help="profile-guided optimization, with a training run")
+    parser.add_argument(
+        "--pgo-input",
+        type=Path,
+        default=Path("/dev/null"),
+        metavar="INPUT",
+        help="the file passed on stdin to the pgo training run (default: no input)",
+    )
+    parser.add_argument("--timings", action="store_true", help="report wall/cpu time and peak memory per phase")
+    parser.add_argument("--profile", action="store_true", help="profile the compiler and write a .prof file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print warnings and errors")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="-v: print statements, -vv: also tokens")
+    args: argparse.Namespace = parser.parse_args(arguments)
+
+    # a batch only compiles the files, the options for running or inspecting a single compilation don't apply to it
+    if len(args.files) != 1 or args.files[0].is_dir():
+        for option in ["watch", "profile", "timings"]:
+            if getattr(args, option):
+                parser.error(f"--{option} can't be used with multiple files or folders")
+    return args
+
+
+def collect_files(paths: list[Path]) -> list[Path]:
+    """returns the files to compile, folders are searched (recursively) for .tim files"""
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.tim")) if path.is_dir() else [path])
+    return files
+
+
+def run_executable(executable: Path, runner: JobRunner):
+    # the executable is interactive, so its input and output aren't captured
+    runner.run([str(executable)], capture=False)
+
+
+def watched_files(file: Path) -> dict[Path, int | None]:
+    """returns the modification times of the file, the stdlib headers and the templates, None for missing files"""
+    mtimes: dict[Path, int | None] = {}
+    for path in [file, *stdlib_folder.glob("*.h"), *templates_folder.glob("*.h")]:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # editors can (temporarily) remove the file while saving
+            mtimes[path] = None
+    return mtimes
+
+
+def watch(file: Path, build_folder: Path, args: argparse.Namespace) -> None:
+    """compiles and runs the file, and does so again on every change of the file, the stdlib or the templates"""
+    while True:
+        # get the state before compiling, so changes made during the compilation also trigger a rebuild
+        mtimes: dict[Path, int | None] = watched_files(file)
+        timings: Timings = Timings(args.timings)
+        try:
+            with JobRunner() as runner:
+                executable: Path = compile_file(file, build_folder, args, timings, runner)
+                timings.report()
+                runner.report()
+                run_executable(executable, runner)
+        except TaplError as e:
+            print(e)
+        except SystemExit:
+            # the errors in the file are already printed, wait for the file to be fixed
+            pass
+
+        logger.info(f"watching '{file}' for changes, press ctrl+c to stop")
+        while watched_files(file) == mtimes:
+            time.sleep(WATCH_INTERVAL)
 
 
 def main():
-    # get the 'file' argument from the argument parser
-    file: Path = argument_parser()
-
-    # tokenize the provided file
-    tokens: Stream[Token] = tokenize(file)
-
-    # apply the two typing passes to the token stream
-    types: Types = typing_passes(file, tokens)
-
-    # generate an AST from the tokens
-    ast: AST = generate_ast(file, tokens, types)
-
-    # run several checks on the generated AST
-    check_ast(ast)
-
-    # formulate the path to output the c-code, and a subfolder for the headers
-    build_folder, header_folder = create_build_folders()
-
-    # generate c-code from the AST and write the source files in the build folder
-    c_file: Path = generate_code(ast, build_folder, header_folder, templates_folder)
-
-    # copy the files in the standard library to the header folder
-    copy_stdlib(header_folder, stdlib_folder)
-
-    # format the generated c-code files
-    format_files(build_folder)
-
-    # run the c compiler to compile the file
-    executable: Path = compile_c(c_file, build_folder)
-
-    # run the executable
-    run_executable(executable)
+    # get the 'files' argument and the options from the argument parser
+    args: argparse.Namespace = argument_parser()
+    configure_logging(-1 if args.quiet else args.verbose)
+
+    # compile multiple files (or folders) in parallel, without running them
+    files: list[Path] = collect_files(args.files)
+    if not files:
+        print(f"no .tim files found in {', '.join(str(path) for path in args.files)}")
+        exit(1)
+    if len(files) != 1 or args.files[0].is_dir():
+        exit(0 if compile_batch(files, args) else 1)
+
+    # compile a single file in the build folder and run it
+    file: Path = files[0]
+    build_folder: Path = repo_root / "build" / "compyler"
+    if args.watch:
+        try:
+            watch(file, build_folder, args)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    timings: Timings = Timings(args.timings)
+    with JobRunner() as runner:
+        if args.profile:
+            # lazy import the profiler, it's only needed when profiling
+            import cProfile
+
+            # run the compilation in the profiler and write the statistics next to the build output
+            profiler: cProfile.Profile = cProfile.Profile()
+            executable: Path = profiler.runcall(compile_file, file, build_folder, args, timings, runner)
+            profile_file: Path = executable.parent / "compyler.prof"
+            profiler.dump_stats(profile_file)
+            logger.info(f"profile written to '{profile_file}', inspect it with: python -m pstats {profile_file}")
+        else:
+            executable: Path = compile_file(file, build_folder, args, timings, runner)
+
+        # report the timings of the phases (if requested) and the exit codes and durations of the external jobs
+        timings.report()
+        runner.report()
+
+        # run the executable
+        run_executable(executable, runner)
 
 
 if __name__ == "__main__":
@@ -5,16 +5,24 @@
 # This file is part of compyler, a TAPL compiler.
 
 from ..utils.ast import AST
+from .check_pass import CheckPass
 from .scoping_pass import ScopingPass
 from .typing_pass import TypingPass
 
 
 class AstCheck:
-    def __init__(self, ast: AST):
+    def __init__(self, ast: AST, separate_passes: bool = False):
         self._ast: AST = ast
+        # run the passes separately instead of the single walk over the AST, to compare them when debugging
+        self._separate_passes: bool = separate_passes
 
     def run(self) -> None:
         """run several passes on the AST to perform a variety of checks on the statements"""
+        if not self._separate_passes:
+            # check the scopes, apply the types and check that all expressions have a type, in a single walk
+            CheckPass(self._ast).run()
+            return
+
         # check the variables defined in the scopes of the AST
         ScopingPass(self._ast).run()
         # check and apply types to the variables, including type 'upscaling'
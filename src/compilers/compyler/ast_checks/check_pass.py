@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from ..errors.tapl_error import TaplError
+from ..expressions.call_expression import CallExpression
+from ..expressions.expression import Expression
+from ..statements.statement import Statement
+from ..statements.var_decl_statement import VarDeclStatement
+from ..types.type import Type
+from .scoping_pass import ScopingPass
+from .typing_pass import TypingPass
+from ..utils.utils import Utils
+
+
+class CheckPass(TypingPass):
+    """the scoping pass, the typing pass and the type verification, in a single walk over the AST.
+
+    the typing pass already keeps track of the identifiers and functions in the scopes, like the scoping pass,
+    and the type of every expression is verified directly after it is typed, instead of in a separate walk.
+    """
+
+    def _parse_statement(self, statement: Statement) -> None:
+        match statement:
+            case VarDeclStatement():
+                # like the scoping pass, first check the initial value, a variable can't be used in its initial value
+                valid_initial_value: bool = False
+                if initial_value := statement.initial_value:
+                    try:
+                        self.parse_expression(initial_value)
+                        valid_initial_value = True
+                    except TaplError as e:
+                        # still declare the variable, otherwise its later uses are reported as unknown identifiers
+                        self._errors.append(e)
+                # then add the variable declaration to the scope
+                requested_type: Type = statement.type_token.type_
+                self._add_identifier(statement.name, requested_type)
+                # check that the type of the initial value and the requested type are valid
+                if initial_value and valid_initial_value:
+                    initial_value_type: Type = Utils.get_expression_type(initial_value)
+                    self._check_types(requested_type, initial_value_type, initial_value.source_location)
+            case _:
+                super()._parse_statement(statement)
+
+    def _report_errors(self) -> None:
+        """reports the errors of the scoping pass when there are any, otherwise the errors of the single walk"""
+        # the typing errors after a scoping error (e.g. of a redeclared identifier) are often caused by that error,
+        # so like the separate passes, only the scoping errors are reported then (this only runs on errors)
+        if self._errors:
+            ScopingPass(self._ast).run()
+        super()._report_errors()
+
+    def parse_expression(self, expression: Expression) -> None:
+        """parse an expression, and verify that it (and its inner expressions) got a type"""
+        super().parse_expression(expression)
+        self._verify_type(expression)
+        # the identifier expression of a call gets the type of the call, without being parsed itself
+        if isinstance(expression, CallExpression):
+            self._verify_type(expression.expression)
@@ -16,6 +16,8 @@ from ..statements.statement import Statement
 from ..tokens.identifier_token import IdentifierToken
 from ..types.type import Type
 from ..utils.ast import AST
+from ..utils.logger import logger
+from ..utils.logger import TRACE
 from ..utils.source_location import SourceLocation
 from .scope_wrapper import ScopeWrapper
 
@@ -42,7 +44,10 @@ class PassBase:
         # ensure that we have no scope stash left
         assert self._scope_wrapper_stash.empty, f"{error}, scope stash is not empty!"
 
-        # if we found errors, print them and exit with exit code 1
+        self._report_errors()
+
+    def _report_errors(self) -> None:
+        """if we found errors, print them and exit with exit code 1"""
         if self._errors:
             [print(e) for e in self._errors]
             exit(1)
@@ -96,7 +101,9 @@ class PassBase:
             yield
         finally:
             # no matter if there is an exception, leave the outer scope
-            print(f"leaving scope with identifiers: {{{', '.join(self._scope_wrapper.scope.identifiers.keys())}}}")
+            if logger.isEnabledFor(TRACE):
+                identifiers: str = ", ".join(self._scope_wrapper.scope.identifiers.keys())
+                logger.log(TRACE, f"leaving scope with identifiers: {{{identifiers}}}")
             self._scope_wrapper.remove_scope()
 
     @contextmanager
@@ -119,7 +126,9 @@ class PassBase:
             self._scope_wrapper: ScopeWrapper = self._scope_wrapper_stash
             # create a new empty scope stash
             self._scope_wrapper_stash = ScopeWrapper()
-            print(f"returning scope with identifiers: {{{', '.join(clean_scope.scope.all_identifiers)}}}")
+            if logger.isEnabledFor(TRACE):
+                identifiers: str = ", ".join(clean_scope.scope.all_identifiers)
+                logger.log(TRACE, f"returning scope with identifiers: {{{identifiers}}}")
 
     def ast_error(self, message: str, source_location: SourceLocation) -> NoReturn:
         """constructs and raises an AStError"""
@@ -41,10 +41,10 @@ from ..types.character_type import CharacterType
 from ..types.class_type import ClassType
 from ..types.list_type import ListType
 from ..types.numeric_type import NumericType
-from ..types.numeric_type_type import NumericTypeType
 from ..types.type import Type
 from ..types.types import Types
 from ..utils.ast import AST
+from ..utils.logger import logger
 from ..utils.source_location import SourceLocation
 from ..utils.utils import Utils
 from .scope_wrapper import ScopeWrapper
@@ -65,12 +65,20 @@ class TypingPass(PassBase):
         self._function_stack: list[Type] = []
         # store a stack of identifier types when they have inner identifiers
         self._identifier_stack: list[Type] = []
-        # add the stdlib functions to the global scope
+        # create the stdlib functions once, and add them to the global scope (and later to every class scope)
+        self._stdlib_functions: list[FunctionStatement] = self._create_stdlib_functions()
         self.add_stdlib_functions()
 
     def add_stdlib_functions(self) -> None:
-        # TODO: do this only once, not for every class scope
-        # add the functions from the standard library to the functions list
+        """add the functions from the standard library to the current scope"""
+        for function in self._stdlib_functions:
+            # add the function name to the surrounding scope
+            self._add_identifier(function.name, function.return_type.type_)
+            # add the function to the function list
+            self._scope_wrapper.scope.add_function(function.name.value, function)
+
+    def _create_stdlib_functions(self) -> list[FunctionStatement]:
+        """returns the function statements of the functions from the standard library"""
         dummy_location: SourceLocation = SourceLocation(0, 0)
         # add a bool type token
         bool_type: Type | None = self._types.get("bool")
@@ -92,20 +100,14 @@ class TypingPass(PassBase):
         read_file_function: FunctionStatement = FunctionStatement(bool_type_token, read_file_identifier)
         read_file_function.add_argument(string_type_token, filename_identifier)
         read_file_function.add_argument(list_char_type_token, list_identifier)
-        # add the function name to the surrounding scope
-        self._add_identifier(read_file_function.name, read_file_function.return_type.type_)
-        # add the function to the function list
-        self._scope_wrapper.scope.add_function(read_file_function.name.value, read_file_function)
 
         # add the write_file function from the standard library
         write_file_identifier: IdentifierToken = IdentifierToken(dummy_location, "write_file")
         write_file_function: FunctionStatement = FunctionStatement(bool_type_token, write_file_identifier)
         write_file_function.add_argument(string_type_token, filename_identifier)
         write_file_function.add_argument(list_char_type_token, list_identifier)
-        # add the function name to the surrounding scope
-        self._add_identifier(write_file_function.name, write_file_function.return_type.type_)
-        # add the function to the function list
-        self._scope_wrapper.scope.add_function(write_file_function.name.value, write_file_function)
+
+        return [read_file_function, write_file_function]
 
     def _parse_statement(self, statement: Statement) -> None:
         # TODO: refactor this and _parse_expression to a visitor pattern?
@@ -167,7 +169,7 @@ class TypingPass(PassBase):
                         # add the arguments to the newly created scope
                         for type_token, identifier_token in statement.arguments:
                             # set the type to be a reference
-                            type_token.type_.is_reference = True
+                            type_token.type_ = type_token.type_.as_reference()
                             # add the argument to the scope
                             self._add_identifier(identifier_token, type_token.type_)
                         # check the statements inside the function
@@ -432,23 +434,9 @@ class TypingPass(PassBase):
             self.ast_error(message, identifier_token.source_location)
 
     def _check_types(self, left: Type, right: Type, source_location: SourceLocation) -> Type:
-        # TODO: we should check the size of a base type if the other side is no base type with _check_number_token(...)
-        # check if they are both number types
-        if isinstance(left, NumericType) and isinstance(right, NumericType):
-            # check if there are two base types
-            if left.keyword == "base" and right.keyword == "base":
-                # return the base type as type
-                return left
-            if left.keyword == "base":
-                # return the right side, as left is a base type
-                return right
-            if right.keyword == "base":
-                # return the left side, as right is a base type
-                return left
-
-        # if both sides are not NumericType, the types must match exactly
-        if left.keyword == right.keyword:
-            return left
+        # look up the combined type of both sides, a base type takes the type of the other numeric type
+        if common_type := self._types.common_type(left, right):
+            return common_type
 
         # TODO: allow for a custom error message in this function
         # otherwise we have conflicting types, generate an error
@@ -467,21 +455,13 @@ class TypingPass(PassBase):
         assert type(requested_type) == NumericType
         assert type(expression.token) == NumberToken
 
-        # check the value of the provided NumberToken and the requested type
-        match requested_type.numeric_type_type:
-            case NumericTypeType.SIGNED:
-                # TODO: this will overflow in the non-python compiler
-                max_value: int = 2 ** (requested_type.num_bits - 1) - 1  # 0x7F~ -> 127~
-                min_value: int = -max_value - 1  # 0x80~ -> -128~
-            case NumericTypeType.UNSIGNED:
-                # TODO: this will overflow in the non-python compiler
-                max_value: int = 2 ** (requested_type.num_bits) - 1  # 0xFF~ -> 255~
-                min_value: int = 0  # 0x00~ -> 0
-            case NumericTypeType.FLOATING_POINT:
-                # nothing to check here
-                return requested_type
+        # check the value of the provided NumberToken and the precomputed range of the requested type
+        if requested_type.value_range is None:
+            # floating point, nothing to check here
+            return requested_type
 
         # signed/unsigned numbers must fit the num_bits
+        min_value, max_value = requested_type.value_range
         value: int = expression.token.value
         if value < min_value or value > max_value:
             message: str = f"can't assign '{value}' to '{requested_type.keyword}', "
@@ -560,10 +540,14 @@ class TypingPass(PassBase):
             case _:
                 assert False, f"internal compiler error, {type(statement)} not handled!"
 
-    def _check_expression(self, expression: Expression) -> None:
+    def _verify_type(self, expression: Expression) -> None:
+        """ensure that the expression has a type"""
         if expression.type_ == Type.unknown():
-            print(f"FAILURE: {expression}.type_ == Type.unknown()")
+            logger.error(f"FAILURE: {expression}.type_ == Type.unknown()")
         assert expression.type_ != Type.unknown()
+
+    def _check_expression(self, expression: Expression) -> None:
+        self._verify_type(expression)
         match expression:
             case BinaryExpression():
                 self._check_expression(expression.left)
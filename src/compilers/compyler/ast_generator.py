@@ -4,6 +4,8 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from collections.abc import Callable
+from collections.abc import Iterator
 from pathlib import Path
 from typing import NoReturn
 
@@ -44,14 +46,52 @@ from .types.list_type import ListType
 from .types.type import Type
 from .types.types import Types
 from .utils.ast import AST
+from .utils.lookahead_buffer import LookaheadBuffer
 from .utils.source_location import SourceLocation
 from .utils.stream import Stream
 
 
 class AstGenerator:
-    def __init__(self, filename: Path, token_stream: Stream[Token], types: Types):
-        self._token_stream: Stream[Token] = token_stream
-        self._tokens: list[Token] = token_stream.objects
+    # the binding power of the binary operators, a higher binding power binds stronger (higher precedence)
+    BINDING_POWERS: dict[TokenType, int] = {
+        TokenType.AND_AND: 1,
+        TokenType.OR_OR: 1,
+        TokenType.EQUAL_EQUAL: 2,
+        TokenType.GREATER: 2,
+        TokenType.GREATER_EQUAL: 2,
+        TokenType.LESS: 2,
+        TokenType.LESS_EQUAL: 2,
+        TokenType.NOT_EQUAL: 2,
+        TokenType.PLUS: 3,
+        TokenType.MINUS: 3,
+        TokenType.STAR: 4,
+        TokenType.SLASH: 4,
+    }
+
+    # the token types matched together
+    END_OF_LINE_TOKENS: frozenset[TokenType] = frozenset({TokenType.NEWLINE, TokenType.EOF})
+    INDENTATION_TOKENS: frozenset[TokenType] = frozenset({TokenType.INDENT, TokenType.DEDENT})
+    PRINT_TOKENS: frozenset[TokenType] = frozenset({TokenType.PRINT, TokenType.PRINTLN})
+    # the tokens that end a statement, and the tokens that continue the statement after them (a block or else)
+    SYNCHRONIZE_TOKENS: frozenset[TokenType] = frozenset({TokenType.NEWLINE, TokenType.DEDENT})
+    CONTINUATION_TOKENS: frozenset[TokenType] = frozenset({TokenType.INDENT, TokenType.ELSE})
+
+    # the expression types of the unary prefix operators
+    UNARY_EXPRESSION_TYPES: dict[TokenType, ExpressionType] = {
+        TokenType.NOT: ExpressionType.NOT,
+        TokenType.MINUS: ExpressionType.MINUS,
+        TokenType.INCREMENT: ExpressionType.PRE_INCREMENT,
+        TokenType.DECREMENT: ExpressionType.PRE_DECREMENT,
+    }
+
+    def __init__(self, filename: Path, tokens: Stream[Token] | Iterator[Token], types: Types):
+        # the tokens are either a (fully tokenized) stream, or a lazy iterator over the tokens
+        self._tokens: list[Token] | LookaheadBuffer[Token]
+        if isinstance(tokens, Stream):
+            self._tokens = tokens.objects
+        else:
+            self._tokens = LookaheadBuffer(tokens)
+        self._streaming: bool = isinstance(self._tokens, LookaheadBuffer)
         self._filename: Path = filename
         self._types: Types = types
 
@@ -61,39 +101,93 @@ class AstGenerator:
         self._loop_count: int = 0
         self._breakall_label: str = "breakall"
         self._class_type: ClassType | None = None
+        # store a list of errors, the parser recovers from an error and continues with the next statement
+        self._errors: list[TaplError] = []
+
+        # the parsers of the statements (other than the type statements), by the first token of the statement.
+        # the parsers return None when the statement isn't allowed here, then it's parsed as expression statement
+        self._statement_parsers: dict[TokenType, Callable[[], Statement | None]] = {
+            TokenType.RETURN: self.return_statement,
+            # temporary(!) print statement, printing an expression
+            # TODO: replace this temporary statement with a builtin function :)
+            TokenType.PRINT: self.print_statement,
+            TokenType.PRINTLN: self.print_statement,
+            TokenType.IF: self.if_statement,
+            TokenType.FOR: self.for_loop_statement,
+            TokenType.WHILE: self.while_loop_statement,
+            TokenType.CLASS: self.class_statement,
+            # if we're inside a loop, check for break, breakall, continue statements
+            TokenType.BREAK: self.loop_control_statement,
+            TokenType.BREAKALL: self.loop_control_statement,
+            TokenType.CONTINUE: self.loop_control_statement,
+        }
+
+        # the parsers of the primary expressions, by the first token of the expression
+        self._prefix_parsers: dict[TokenType, Callable[[Token], Expression]] = {
+            TokenType.FALSE: self._token_expression,
+            TokenType.NULL: self._token_expression,
+            TokenType.TRUE: self._token_expression,
+            TokenType.CHARACTER: self._token_expression,
+            TokenType.NUMBER: self._token_expression,
+            TokenType.STRING_START: self._string_expression,
+            TokenType.PAREN_OPEN: self._parenthesis_expression,
+            TokenType.NOT: self._unary_expression,
+            TokenType.MINUS: self._unary_expression,
+            TokenType.INCREMENT: self._pre_increment_expression,
+            TokenType.DECREMENT: self._pre_increment_expression,
+            TokenType.IDENTIFIER: self._identifier_primary,
+            TokenType.THIS: self._this_expression,
+        }
+
+    def _token_at(self, index: int) -> Token:
+        """returns the token at the index, raises an IndexError when there is no token at the index"""
+        return self._tokens[index]
 
     def current(self) -> Token:
         """returns the token at the current location"""
-        return self._tokens[self._current_index]
+        return self._token_at(self._current_index)
 
     def next(self, offset: int = 1) -> Token:
         """returns the token after the current location, or at the offset, if offset is provided"""
-        if self._current_index + offset > len(self._tokens):
+        try:
+            return self._token_at(self._current_index + offset)
+        except IndexError:
             self.ast_error(f"unexpected end-of-file, token at offset {offset} doesn't exist!")
-        return self._tokens[self._current_index + offset]
 
     def previous(self) -> Token:
         """returns the previous (consumed) token"""
         if self._current_index == 0:
             self.ast_error("can't call previous when no tokens have been consumed yet!")
-        return self._tokens[self._current_index - 1]
+        return self._token_at(self._current_index - 1)
 
     def is_at_end(self) -> bool:
         """check whether we are at the end of the token stream, or EOF token"""
         # check for end of token stream
-        if self._current_index >= len(self._tokens):
+        try:
+            return self.current().token_type == TokenType.EOF
+        except IndexError:
             return True
-        return self.current().token_type == TokenType.EOF
 
     def consume(self) -> Token:
         """consumes the token at the current location"""
         self._current_index += 1
-        if self._current_index > len(self._tokens):
+        try:
+            token: Token = self.previous()
+        except IndexError:
             self.ast_error("unexpected end-of-file, can't consume more tokens!")
-        return self.previous()
+        # when streaming, only the consumed token is kept for previous(), the tokens before it are released
+        if self._streaming:
+            self._tokens.release(self._current_index - 1)
+        return token
 
-    def match(self, *token_types: TokenType) -> Token | None:
+    def match(self, token_type: TokenType) -> Token | None:
         """returns the token if the provided token_type matches the current token"""
+        if self.current().token_type == token_type:
+            return self.consume()
+        return None
+
+    def match_any(self, token_types: frozenset[TokenType]) -> Token | None:
+        """returns the token if the current token matches one of the provided (precomputed) token_types"""
         if self.current().token_type in token_types:
             return self.consume()
         return None
@@ -111,7 +205,7 @@ class AstGenerator:
         if not must_end_with_newline:
             return
 
-        if not self.match(TokenType.NEWLINE, TokenType.EOF):
+        if not self.match_any(self.END_OF_LINE_TOKENS):
             self.ast_error(f"expected a newline or End-Of-File after {type_}, found '{self.current()}'!")
 
     def _has_indent(self) -> bool:
@@ -157,8 +251,14 @@ class AstGenerator:
         # capture all statements until we get a dedent
         statements: list[Statement] = []
         while not self.match(TokenType.DEDENT):
-            statement: Statement = self.statement()
-            statements.append(statement)
+            start_index: int = self._current_index
+            try:
+                statements.append(self.statement())
+            except TaplError as e:
+                # continue with the next statement in the block
+                self._recover(e, start_index)
+                if self.is_at_end():
+                    break
         return statements
 
     def assignment_statement(self, expression: Expression, must_end_with_newline: bool) -> AssignmentStatement | None:
@@ -352,7 +452,7 @@ class AstGenerator:
 
     def print_statement(self) -> PrintStatement | None:
         # early return if we don't have a print/println statement
-        token: Token | None = self.match(TokenType.PRINT, TokenType.PRINTLN)
+        token: Token | None = self.match_any(self.PRINT_TOKENS)
         if not token:
             return
 
@@ -377,7 +477,7 @@ class AstGenerator:
             self.ast_error(f"return statement is not allowed here!")
 
         # check if we have a newline
-        if self.match(TokenType.NEWLINE, TokenType.EOF):
+        if self.match_any(self.END_OF_LINE_TOKENS):
             # return the statement without value
             return ReturnStatement(token)
 
@@ -558,40 +658,14 @@ class AstGenerator:
         # construct everything we find in the class until we get to a dedent
         class_statement: ClassStatement = ClassStatement(class_type, source_location)
         while not self.match(TokenType.DEDENT):
-            # check for a var decl or function statement
-            if type_statement := self._type_statement(True):
-                if type(type_statement) == FunctionStatement:
-                    class_statement.functions.append(type_statement)
-                    continue
-                elif type(type_statement) == VarDeclStatement:
-                    class_statement.variables.append(type_statement)
-                    continue
-                elif type(type_statement) == ListStatement:
-                    class_statement.variables.append(type_statement)
-                    continue
-                else:
-                    message: str = f"expected FunctionStatement or VarDeclStatement, found '{type(type_statement)}'"
-                    raise AstError(message, self._filename, type_statement.source_location)
-
-            # check for a constructor
-            if constructor := self._constructor(name.type_):
-                if class_statement.constructor:
-                    message = f"found a {name} constructor while another constructor was already found!"
-                    raise AstError(message, self._filename, constructor.source_location)
-                class_statement.constructor = constructor
-                continue
-
-            # check for a destructor
-            if destructor := self._destructor(name.type_):
-                if class_statement.destructor:
-                    message = f"found a {name} destructor while another descructor was already found!"
-                    raise AstError(message, self._filename, destructor.source_location)
-                class_statement.destructor = destructor
-                continue
-
-            message: str = f"expected FunctionStatement, VarDeclStatement, Constructor or Destructor,"
-            message += f" found '{self.current()}'"
-            self.ast_error(message)
+            start_index: int = self._current_index
+            try:
+                self._class_member(class_statement, name)
+            except TaplError as e:
+                # continue with the next member of the class
+                self._recover(e, start_index)
+                if self.is_at_end():
+                    break
 
         # finished processing the class, we no longer allow parsing class-specific syntax
         self._class_type = None
@@ -599,6 +673,43 @@ class AstGenerator:
         # return the finished class statement
         return class_statement
 
+    def _class_member(self, class_statement: ClassStatement, name: TypeToken) -> None:
+        """parses a member of the class, and adds it to the class statement"""
+        # check for a var decl or function statement
+        if type_statement := self._type_statement(True):
+            if type(type_statement) == FunctionStatement:
+                class_statement.functions.append(type_statement)
+                return
+            elif type(type_statement) == VarDeclStatement:
+                class_statement.variables.append(type_statement)
+                return
+            elif type(type_statement) == ListStatement:
+                class_statement.variables.append(type_statement)
+                return
+            else:
+                message: str = f"expected FunctionStatement or VarDeclStatement, found '{type(type_statement)}'"
+                raise AstError(message, self._filename, type_statement.source_location)
+
+        # check for a constructor
+        if constructor := self._constructor(name.type_):
+            if class_statement.constructor:
+                message = f"found a {name} constructor while another constructor was already found!"
+                raise AstError(message, self._filename, constructor.source_location)
+            class_statement.constructor = constructor
+            return
+
+        # check for a destructor
+        if destructor := self._destructor(name.type_):
+            if class_statement.destructor:
+                message = f"found a {name} destructor while another descructor was already found!"
+                raise AstError(message, self._filename, destructor.source_location)
+            class_statement.destructor = destructor
+            return
+
+        message: str = f"expected FunctionStatement, VarDeclStatement, Constructor or Destructor,"
+        message += f" found '{self.current()}'"
+        self.ast_error(message)
+
     def loop_control_statement(self) -> Statement | None:
         # early return if we're not inside a loop
         if self._loop_count == 0:
@@ -623,38 +734,15 @@ class AstGenerator:
 
     def statement(self, must_end_with_newline: bool = True) -> Statement:
         """returns a statement of some kind"""
+        token_type: TokenType = self.current().token_type
         # check for a statement starting with a type
-        if statement := self._type_statement(must_end_with_newline):
-            return statement
-
-        # check for a return statement
-        if statement := self.return_statement():
-            return statement
-
-        # temporary(!) print statement, printing an expression
-        # TODO: replace this temporary statement with a builtin function :)
-        if statement := self.print_statement():
-            return statement
-
-        # check for an if statement
-        if statement := self.if_statement():
-            return statement
-
-        # check for a for-loop statement
-        if statement := self.for_loop_statement():
-            return statement
-
-        # check for a while-loop statement
-        if statement := self.while_loop_statement():
-            return statement
-
-        # check for a class 'statement'
-        if statement := self.class_statement():
-            return statement
-
-        # if we're inside a loop, check for break, breakall, continue statements
-        if statement := self.loop_control_statement():
-            return statement
+        if token_type == TokenType.TYPE:
+            if statement := self._type_statement(must_end_with_newline):
+                return statement
+        # otherwise look up the statement parser by the first token
+        elif statement_parser := self._statement_parsers.get(token_type):
+            if statement := statement_parser():
+                return statement
 
         # fall back to a bare expression statement
         expression: Expression = self.expression()
@@ -669,167 +757,105 @@ class AstGenerator:
 
     def expression(self) -> Expression:
         """returns an expression, starts parsing at the lowest precedence level"""
-        expression: Expression = self.boolean()
-        return expression
-
-    def boolean(self) -> Expression:
-        """returns a boolean expression, or a higher precedence level expression"""
-        expression: Expression = self.comparison()
-
-        and_or_tokens: tuple[TokenType, ...] = (TokenType.AND_AND, TokenType.OR_OR)
-        while token := self.match(*and_or_tokens):
-            # we found a boolean expression token, go up the precedence list to get another expression
-            right: Expression = self.comparison()
-            expression = BinaryExpression(expression, token, right)
-
-        # otherwise return the expression found at the beginning
-        return expression
+        return self._binary_expression(0)
 
-    def comparison(self) -> Expression:
-        """returns a comparison expression, or a higher precedence level expression"""
-        # go up the precedence list to get the left hand side expression
-        expression: Expression = self.additive()
-
-        boolean_expression_tokens: tuple[TokenType, ...] = (
-            TokenType.EQUAL_EQUAL,
-            TokenType.GREATER,
-            TokenType.GREATER_EQUAL,
-            TokenType.LESS,
-            TokenType.LESS_EQUAL,
-            TokenType.NOT_EQUAL,
-        )
-        while token := self.match(*boolean_expression_tokens):
-            # we found a comparison expression token, go up the precedence list to get another expression
-            right: Expression = self.additive()
-            expression = BinaryExpression(expression, token, right)
-
-        # otherwise return the expression found at the beginning
-        return expression
-
-    def additive(self) -> Expression:
-        """returns a PLUS/MINUS, or a higher precedence level expression"""
-        # go up the precedence list to get the left hand side expression
-        expression: Expression = self.multiplicative()
+    def _binary_expression(self, min_binding_power: int) -> Expression:
+        """returns an expression with the binary operators that bind stronger than min_binding_power.
 
-        while token := self.match(TokenType.PLUS, TokenType.MINUS):
-            # we found a plus/minus token, go up the precedence list to get another expression
-            right: Expression = self.multiplicative()
-            expression = BinaryExpression(expression, token, right)
-
-        # otherwise return the expression found in the beginning
-        return expression
-
-    def multiplicative(self) -> Expression:
-        """returns a STAR/SLASH, or a higher precedence level expression"""
-        # go up the precedence list to get the left hand side expression
+        this is a Pratt (precedence climbing) parser: the operators are looked up in the BINDING_POWERS table,
+        the right hand side of an operator only contains operators that bind stronger (left associative)
+        """
         expression: Expression = self.primary()
 
-        while token := self.match(TokenType.STAR, TokenType.SLASH):
-            # we found a star/slash token, go up the precedence list to get another expression
-            right: Expression = self.primary()
+        while self.BINDING_POWERS.get(self.current().token_type, 0) > min_binding_power:
+            # we found an operator that binds stronger, get the right hand side expression with its binding power
+            token: Token = self.consume()
+            right: Expression = self._binary_expression(self.BINDING_POWERS[token.token_type])
             expression = BinaryExpression(expression, token, right)
 
-        # otherwise return the expression found in the beginning
+        # otherwise return the expression found at the beginning
         return expression
 
     def primary(self) -> Expression:
         """returns a primary expression: primary keywords or character/number/string"""
-        # match the primary keywords
-        if token := self.match(TokenType.FALSE):
-            return TokenExpression(token.source_location, token)
-        if token := self.match(TokenType.NULL):
-            return TokenExpression(token.source_location, token)
-        if token := self.match(TokenType.TRUE):
-            return TokenExpression(token.source_location, token)
-
-        # match literal characters, numbers and strings
-        if token := self.match(TokenType.CHARACTER):
-            return TokenExpression(token.source_location, token)
-        if token := self.match(TokenType.NUMBER):
-            return TokenExpression(token.source_location, token)
-        if token := self.match(TokenType.STRING_START):
-            # start constructing a string expression
-            string_expression: StringExpression = StringExpression(token)
-            while token := self.consume():
-                # add the token to the string expression
-                string_expression.add_token(token)
-                # check for the end of the string, then we return
-                if token.token_type == TokenType.STRING_END:
-                    break
-                # check for a start of an expression
-                if token.token_type == TokenType.STRING_EXPR_START:
-                    string_expression.add_token(self.expression())
-            return string_expression
-
-        # match expressions between parenthesis
-        if paren_open := self.match(TokenType.PAREN_OPEN):
-            # check if this is a type casting
-            if type_ := self.match(TokenType.TYPE):
-                assert isinstance(type_, TypeToken)
-                # expect a closing parenthesis
-                self.expect(TokenType.PAREN_CLOSE)
-                # followed by a primary expression that is type casted
-                primary: Expression = self.primary()
-                # the SourceLocation is from paren_open till the primary expression
-                source_location: SourceLocation = paren_open.source_location + primary.source_location
-                return TypeCastExpression(source_location, type_, primary)
-
-            # otherwise it's a grouping expression
-            expression: Expression = self.expression()
-            message = f"expected closing parenthesis, but found '{self.current()}'!"
-            paren_close: Token = self.expect(TokenType.PAREN_CLOSE, message)
-            # the SourceLocation is from paren_open till paren_close and everything in between
-            source_location: SourceLocation = paren_open.source_location + paren_close.source_location
-            return UnaryExpression(source_location, ExpressionType.GROUPING, expression)
-
-        # match comparison not expression
-        if not_token := self.match(TokenType.NOT):
-            expression: Expression = self.primary()
-            source_location: SourceLocation = not_token.source_location + expression.source_location
-            return UnaryExpression(source_location, ExpressionType.NOT, expression)
-
-        # match unary minus expression
-        if minus_token := self.match(TokenType.MINUS):
-            expression: Expression = self.primary()
-            source_location: SourceLocation = minus_token.source_location + expression.source_location
-            return UnaryExpression(source_location, ExpressionType.MINUS, expression)
-
-        # match pre increment or decrement expression
-        if increment_token := self.match(TokenType.INCREMENT):
-            identifier: Token = self.expect(TokenType.IDENTIFIER)
-            expression: Expression = TokenExpression(identifier.source_location, identifier)
-            source_location: SourceLocation = increment_token.source_location + expression.source_location
-            return UnaryExpression(source_location, ExpressionType.PRE_INCREMENT, expression)
-        if decrement_token := self.match(TokenType.DECREMENT):
-            identifier: Token = self.expect(TokenType.IDENTIFIER)
-            expression: Expression = TokenExpression(identifier.source_location, identifier)
-            source_location: SourceLocation = decrement_token.source_location + expression.source_location
-            return UnaryExpression(source_location, ExpressionType.PRE_DECREMENT, expression)
-
-        # match an identifier
-        if token := self.match(TokenType.IDENTIFIER):
-            assert isinstance(token, IdentifierToken)
-            return self.identifier_expression(token)
-
-        # match a this-expression
-        if this := self.match(TokenType.THIS):
-            source_location: SourceLocation = this.source_location
-            # check that we're allowed to use this here
-            if self._class_type is None:
-                self.ast_error(f"found 'this' while not in a class!")
-            # we expect a dot after this
-            self.expect(TokenType.DOT)
-            # expect a nested identifier
-            identifier: Token = self.expect(TokenType.IDENTIFIER)
-            assert isinstance(identifier, IdentifierToken)
-            expression: Expression = self.identifier_expression(identifier)
-            source_location += expression.source_location
-            # construct and return the this-expression
-            return ThisExpression(source_location, expression)
+        # look up the parser of the primary expression by its first token
+        if prefix_parser := self._prefix_parsers.get(self.current().token_type):
+            return prefix_parser(self.consume())
 
         # otherwise we have an error, there must be an expression here
         self.ast_error(f"expected an expression, found '{self.current()}'!")
 
+    def _token_expression(self, token: Token) -> Expression:
+        """returns the primary keyword or the literal character/number"""
+        return TokenExpression(token.source_location, token)
+
+    def _string_expression(self, token: Token) -> Expression:
+        # start constructing a string expression
+        string_expression: StringExpression = StringExpression(token)
+        while token := self.consume():
+            # add the token to the string expression
+            string_expression.add_token(token)
+            # check for the end of the string, then we return
+            if token.token_type == TokenType.STRING_END:
+                break
+            # check for a start of an expression
+            if token.token_type == TokenType.STRING_EXPR_START:
+                string_expression.add_token(self.expression())
+        return string_expression
+
+    def _parenthesis_expression(self, paren_open: Token) -> Expression:
+        """returns a type casting or a grouping expression"""
+        # check if this is a type casting
+        if type_ := self.match(TokenType.TYPE):
+            assert isinstance(type_, TypeToken)
+            # expect a closing parenthesis
+            self.expect(TokenType.PAREN_CLOSE)
+            # followed by a primary expression that is type casted
+            primary: Expression = self.primary()
+            # the SourceLocation is from paren_open till the primary expression
+            source_location: SourceLocation = paren_open.source_location + primary.source_location
+            return TypeCastExpression(source_location, type_, primary)
+
+        # otherwise it's a grouping expression
+        expression: Expression = self.expression()
+        message = f"expected closing parenthesis, but found '{self.current()}'!"
+        paren_close: Token = self.expect(TokenType.PAREN_CLOSE, message)
+        # the SourceLocation is from paren_open till paren_close and everything in between
+        source_location: SourceLocation = paren_open.source_location + paren_close.source_location
+        return UnaryExpression(source_location, ExpressionType.GROUPING, expression)
+
+    def _unary_expression(self, token: Token) -> Expression:
+        """returns a comparison not or unary minus expression"""
+        expression: Expression = self.primary()
+        source_location: SourceLocation = token.source_location + expression.source_location
+        return UnaryExpression(source_location, self.UNARY_EXPRESSION_TYPES[token.token_type], expression)
+
+    def _pre_increment_expression(self, token: Token) -> Expression:
+        """returns a pre increment or decrement expression"""
+        identifier: Token = self.expect(TokenType.IDENTIFIER)
+        expression: Expression = TokenExpression(identifier.source_location, identifier)
+        source_location: SourceLocation = token.source_location + expression.source_location
+        return UnaryExpression(source_location, self.UNARY_EXPRESSION_TYPES[token.token_type], expression)
+
+    def _identifier_primary(self, token: Token) -> Expression:
+        assert isinstance(token, IdentifierToken)
+        return self.identifier_expression(token)
+
+    def _this_expression(self, this: Token) -> Expression:
+        source_location: SourceLocation = this.source_location
+        # check that we're allowed to use this here
+        if self._class_type is None:
+            self.ast_error(f"found 'this' while not in a class!")
+        # we expect a dot after this
+        self.expect(TokenType.DOT)
+        # expect a nested identifier
+        identifier: Token = self.expect(TokenType.IDENTIFIER)
+        assert isinstance(identifier, IdentifierToken)
+        expression: Expression = self.identifier_expression(identifier)
+        source_location += expression.source_location
+        # construct and return the this-expression
+        return ThisExpression(source_location, expression)
+
     def identifier_expression(self, token: IdentifierToken) -> Expression:
         expression: IdentifierExpression = IdentifierExpression(token.source_location, token)
 
@@ -898,28 +924,69 @@ class AstGenerator:
 
         raise AstError(message, self._filename, source_location)
 
+    def _recover(self, error: TaplError, start_index: int) -> None:
+        """stores the error, and skips the tokens until the start of the next statement (panic-mode recovery)"""
+        # a list token without type is an invalid list type, which is already reported by the type applier
+        if self.is_at_end() or self.current().token_type != TokenType.LIST:
+            self._errors.append(error)
+        # the statement with the error already ended, for example a duplicate constructor
+        if self._current_index > start_index and self.previous().token_type in self.SYNCHRONIZE_TOKENS:
+            return
+        self._synchronize()
+
+    def _synchronize(self) -> None:
+        """skips the tokens until the start of the next statement at the same indentation level.
+        the (nested) blocks of the statement with the error are skipped as well,
+        the dedent at the end of the enclosing block isn't consumed, so the block ends as usual.
+        """
+        depth: int = 0
+        while not self.is_at_end():
+            token_type: TokenType = self.current().token_type
+            if token_type == TokenType.DEDENT and depth == 0:
+                return
+            self.consume()
+            if token_type == TokenType.INDENT:
+                depth += 1
+                continue
+            if token_type == TokenType.DEDENT:
+                depth -= 1
+            # a block or else after the end of the statement is still part of the statement with the error
+            if depth == 0 and token_type in self.SYNCHRONIZE_TOKENS and not self.is_at_end():
+                if self.current().token_type not in self.CONTINUATION_TOKENS:
+                    return
+
     def generate(self) -> AST:
-        """parses the token stream to a list of statements, until EOF is reached"""
-        errors: list[TaplError] = []
+        """parses the token stream to a list of statements, until EOF is reached.
+        the parser recovers from errors, all errors are printed after the token stream is parsed.
+        """
         ast: AST = AST(self._filename, self._types)
-        while not self.is_at_end():
+        while True:
+            start_index: int = self._current_index
             try:
+                if self.is_at_end():
+                    break
                 ast.append(self.statement())
             except TaplError as e:
-                errors.append(e)
-                # continue until we get to a newline, indicating a new statement
-                while not self.match(TokenType.NEWLINE, TokenType.EOF):
-                    self.consume()
+                self._recover(e, start_index)
                 # check if we have consumed the EOF, then don't check for indent/dedent
                 if self.is_at_end():
                     break
-                # also consume the indent and dedent tokens if they are there
-                while self.match(TokenType.INDENT, TokenType.DEDENT):
+                # also consume the stray indent and dedent tokens if they are there
+                while self.match_any(self.INDENTATION_TOKENS):
                     pass
 
+        # when streaming, the errors of the type applier are raised after its last (EOF) token
+        if self._streaming:
+            try:
+                self._token_at(self._current_index + 1)
+            except IndexError:
+                pass
+            except TaplError as e:
+                self._errors.append(e)
+
         # if we found errors, print them and exit with exit code 1
-        if errors:
-            [print(e) for e in errors]
+        if self._errors:
+            [print(e) for e in self._errors]
             exit(1)
 
         return ast
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import time
+import traceback
+
+from .build import compile_file
+from .build import repo_root
+from .utils.job_runner import JobRunner
+from .utils.logger import configure_logging
+from .utils.timings import Timings
+
+
+def batch_build_folders(files: list[Path]) -> list[Path]:
+    """returns a build folder per file, named after the file with a number added for duplicate names"""
+    build_folders: list[Path] = []
+    used_names: set[str] = set()
+    for file in files:
+        name: str = file.stem
+        number: int = 2
+        while name in used_names:
+            name = f"{file.stem}_{number}"
+            number += 1
+        used_names.add(name)
+        build_folders.append(repo_root / "build" / "compyler" / "batch" / name)
+    return build_folders
+
+
+# the worker processes import this function by name, it can't be in the __main__ module of the package,
+# as that module isn't imported again in the worker processes (e.g. with the forkserver start method)
+def compile_batch_file(file: Path, build_folder: Path, args: argparse.Namespace) -> tuple[bool, float, str]:
+    """compiles a file of a batch in a worker process, returns whether it succeeded, the duration and the output"""
+    start: float = time.perf_counter()
+    # capture the output, so the output of the files compiled in parallel isn't interleaved
+    output: io.StringIO = io.StringIO()
+    with redirect_stdout(output):
+        configure_logging(-1 if args.quiet else args.verbose)
+        try:
+            with JobRunner() as runner:
+                compile_file(file, build_folder, args, Timings(False), runner)
+            success: bool = True
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            # the compiler exits on errors in the file, any other exception is an internal compiler error
+            if not isinstance(e, SystemExit):
+                traceback.print_exc(file=output)
+            success: bool = False
+    return success, time.perf_counter() - start, output.getvalue()
+
+
+def compile_batch(files: list[Path], args: argparse.Namespace) -> bool:
+    """compiles the files in parallel, each in its own build folder, and prints a summary of the results"""
+    # lazy import the colors module for the summary
+    from .utils.colors import Colors
+
+    build_folders: list[Path] = batch_build_folders(files)
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures: list[Future[tuple[bool, float, str]]] = [
+            executor.submit(compile_batch_file, file, build_folder, args)
+            for file, build_folder in zip(files, build_folders)
+        ]
+        results: list[tuple[bool, float, str]] = [future.result() for future in futures]
+
+    # print the output of the failed files, followed by a table with the results of all files
+    for file, (success, _, output) in zip(files, results):
+        if not success:
+            print(f"{Colors.BOLD}{file}:{Colors.RESET}\n{output}")
+    name_width: int = max(len(str(file)) for file in files)
+    print(f"{'file':<{name_width}} {'result':>6} {'time [ms]':>10}  build folder")
+    for file, build_folder, (success, duration, _) in zip(files, build_folders, results):
+        result: str = f"{Colors.GREEN}    ok{Colors.RESET}" if success else f"{Colors.RED}failed{Colors.RESET}"
+        print(f"{str(file):<{name_width}} {result} {duration * 1000:>10.2f}  {build_folder.relative_to(repo_root)}")
+    failures: int = sum(not success for success, _, _ in results)
+    print(f"{len(files) - failures} of {len(files)} files compiled successfully")
+    return failures == 0
@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+
+import argparse
+from collections.abc import Iterator
+from concurrent.futures import Future
+import hashlib
+import logging
+from pathlib import Path
+import shutil
+
+from .ast_checks.ast_check import AstCheck
+from .ast_generator import AstGenerator
+from .code_generator import CodeGenerator
+from .errors.ast_error import AstError
+from .mapped_tokenizer import MappedTokenizer
+from .regex_tokenizer import RegexTokenizer
+from .tokenizer import Tokenizer
+from .tokens.compact_tokens import CompactTokens
+from .tokens.token import Token
+from .types.type_applier import TypeApplier
+from .types.type_resolver import TypeResolver
+from .types.types import Types
+from .utils.ast import AST
+from .utils.ast_cache import AstCache
+from .utils.build_cache import BuildCache
+from .utils.file_cache import file_cache
+from .utils.format_cache import FormatCache
+from .utils.job_runner import JobResult
+from .utils.job_runner import JobRunner
+from .utils.logger import logger
+from .utils.logger import logging_disabled
+from .utils.logger import TRACE
+from .utils.stream import Stream
+from .utils.timings import Timings
+
+# get to the repo root folder, several levels up
+repo_root: Path = Path(__file__).parents[3].resolve()
+compyler_folder: Path = Path(__file__).parent.resolve()
+stdlib_folder: Path = repo_root / "src" / "stdlib"
+templates_folder: Path = repo_root / "src" / "templates"
+
+
+def create_tokenizer(file: Path, engine: str) -> Tokenizer:
+    match engine:
+        case "regex":
+            return RegexTokenizer(file)
+        case "mapped":
+            # the byte offsets of the mapped tokenizer are only the character offsets of ascii files with '\n' line
+            # endings, otherwise the diagnostics would point to the wrong lines, so fall back to the classic tokenizer
+            if MappedTokenizer.supports(file):
+                return MappedTokenizer(file)
+            logger.info(f"'{file}' isn't ascii with '\\n' line endings, using the classic tokenizer instead")
+            return Tokenizer(file)
+        case _:
+            return Tokenizer(file)
+
+
+def tokenize(file: Path, engine: str) -> Stream[Token]:
+    logger.info(f"calling the compiler with file '{file}'")
+    tokens: Stream[Token] = create_tokenizer(file, engine).tokenize()
+    # the repr of the tokens is only constructed when the message is logged
+    logger.log(TRACE, "%s", tokens.objects)
+    return tokens
+
+
+def typing_passes(filename: Path, tokens: Stream[Token]) -> Types:
+    # resolve the types in the file
+    type_resolver: TypeResolver = TypeResolver(tokens)
+    types: Types = type_resolver.resolve()
+    # apply the types to the tokens in the stream (in place)
+    type_applier: TypeApplier = TypeApplier(filename, types)
+    try:
+        type_applier.apply(tokens)
+    except AstError as e:
+        # all errors of the pass are raised together, print them and exit with exit code 1
+        print(e)
+        exit(1)
+    # return the processed tokens
+    return types
+
+
+def tokenize_compact(file: Path, engine: str) -> CompactTokens:
+    logger.info(f"calling the compiler with file '{file}'")
+    # the tokens are stored in the compact storage while they're tokenized
+    tokens: CompactTokens = CompactTokens.from_tokens(create_tokenizer(file, engine).iter_tokens())
+    # the repr of the tokens is only constructed when the message is logged
+    logger.log(TRACE, "%s", tokens)
+    return tokens
+
+
+def compact_typing_passes(filename: Path, tokens: CompactTokens) -> tuple[Types, CompactTokens]:
+    """apply the two typing passes to the compact tokens, returns the types and the tokens with the types applied"""
+    types: Types = TypeResolver(tokens).resolve()
+    try:
+        return types, TypeApplier(filename, types).apply_compact(tokens)
+    except AstError as e:
+        # all errors of the pass are raised together, print them and exit with exit code 1
+        print(e)
+        exit(1)
+
+
+def streaming_typing_pass(file: Path, engine: str) -> Types:
+    """resolve the types in a first pass over the lazily tokenized file, without storing the tokens"""
+    logger.info(f"calling the compiler with file '{file}'")
+    # the errors of the tokenizer are logged when the file is tokenized again to generate the AST
+    with logging_disabled():
+        return TypeResolver(create_tokenizer(file, engine).iter_tokens()).resolve()
+
+
+def stream_tokens(file: Path, engine: str, types: Types) -> Iterator[Token]:
+    """returns a lazy iterator over the tokens of the file, with the types applied"""
+    return TypeApplier(file, types).apply_iter(create_tokenizer(file, engine).iter_tokens())
+
+
+def generate_ast(file: Path, tokens: Stream[Token] | Iterator[Token], types: Types) -> AST:
+    ast: AST = AstGenerator(file, tokens, types).generate()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n".join(str(statement) for statement in ast.statements.objects))
+    return ast
+
+
+def check_ast(ast: AST, separate_passes: bool) -> None:
+    """run several checks on the generated AST"""
+    AstCheck(ast, separate_passes).run()
+
+
+def create_build_folders(build_folder: Path) -> Path:
+    header_folder: Path = build_folder / "tapl_headers"
+    # ensure the build and header folders exists
+    build_folder.mkdir(parents=True, exist_ok=True)
+    header_folder.mkdir(parents=True, exist_ok=True)
+    return header_folder
+
+
+def generate_code(ast: AST, build_folder: Path, header_folder: Path, templates_folder: Path) -> Path:
+    main_c_file: Path = build_folder / "main.c"
+    CodeGenerator(ast, build_folder, header_folder, templates_folder).generate_c(main_c_file)
+    return main_c_file
+
+
+def copy_stdlib(header_folder: Path, stdlib_folder: Path) -> None:
+    # copy all header files to the header folder, the headers are read from memory and only written if changed
+    for header in stdlib_folder.glob("*.h"):
+        file_cache.write_bytes(header_folder / header.name, file_cache.read_bytes(header))
+
+
+def format_files(
+    folder: Path, runner: JobRunner
+) -> tuple[list[tuple[Path, bytes, bytes | Path]], Future[JobResult] | None]:
+    """starts formatting all .c and .h files in the folder, the files are only changed by write_formatted_files
+
+    returns per file its content and the formatted content (when cached) or the staged copy that's being formatted,
+    and the job formatting the staged copies (if any)
+    """
+    format_cache: FormatCache = FormatCache(folder, repo_root / ".clang-format")
+    # the copies are staged inside the build folder, so clang-format finds the style file of the repo
+    staging_folder: Path = folder / FormatCache.CACHE_FOLDER / "staging"
+    shutil.rmtree(staging_folder, ignore_errors=True)
+    staging_folder.mkdir(parents=True)
+
+    format_jobs: list[tuple[Path, bytes, bytes | Path]] = []
+    for file_path in folder.rglob("*.[ch]"):
+        if file_path.is_file() and staging_folder not in file_path.parents:
+            # take the files that have been formatted before from the cache, only format the others
+            content: bytes = file_path.read_bytes()
+            formatted: bytes | Path | None = format_cache.lookup(content)
+            if formatted is None:
+                # format a copy, the c compiler might be reading the file in the meantime
+                formatted = staging_folder / f"{len(format_jobs)}_{file_path.name}"
+                formatted.write_bytes(content)
+            format_jobs.append((file_path, content, formatted))
+
+    # format all staged copies with a single clang-format invocation
+    staged_files: list[str] = [str(formatted) for _, _, formatted in format_jobs if isinstance(formatted, Path)]
+    if not staged_files:
+        return format_jobs, None
+    return format_jobs, runner.submit(["clang-format", "-i", "--fallback-style=none", *staged_files])
+
+
+def write_formatted_files(
+    folder: Path, format_jobs: list[tuple[Path, bytes, bytes | Path]], format_job: Future[JobResult] | None
+) -> None:
+    """waits for the format job, and writes and caches the formatted files"""
+    if format_job and (result := format_job.result()).returncode:
+        handle_error(f"clang-format failed with error code {result.returncode}: {result.errors}")
+
+    format_cache: FormatCache = FormatCache(folder, repo_root / ".clang-format")
+    for file_path, content, formatted in format_jobs:
+        if isinstance(formatted, Path):
+            # store the result of the formatting for the next build
+            formatted = formatted.read_bytes()
+            format_cache.store(content, formatted)
+        if formatted != content:
+            file_path.write_bytes(formatted)
+
+
+def c_compiler_flags(args: argparse.Namespace) -> list[str]:
+    """returns the flags passed to the c compiler, besides the include path and in/output files"""
+    # release builds are optimized and without debug information, debug builds the other way around
+    optimization: str = args.optimization or ("2" if args.release else "0")
+    flags: list[str] = [f"-O{optimization}"]
+    if not args.release:
+        flags.append("-g3")
+    if args.march:
+        flags.append(f"-march={args.march}")
+    if args.lto:
+        flags.append("-flto")
+    return flags
+
+
+def compile_c(c_file: Path, build_folder: Path, cc: str, flags: list[str], runner: JobRunner) -> Path:
+    executable: Path = c_file.parent / "main"
+
+    # remove the old executable (if it exists)
+    executable.unlink(missing_ok=True)
+
+    # directly call the c compiler, passing the build folder as additional include path
+    result: JobResult = runner.run([cc, *flags, f"-I{build_folder}", "-o", str(executable), str(c_file)])
+    # show the diagnostics of the c compiler, these are warnings when the compilation succeeded
+    if result.errors:
+        logger.warning(result.errors.rstrip())
+    if result.returncode:
+        handle_error(f"{cc} returned error code {result.returncode}")
+    return executable
+
+
+def compyler_options(args: argparse.Namespace) -> list[str]:
+    """returns the options of the compyler that change the build output, besides the c compiler flags"""
+    options: list[str] = [f"--cc={args.cc}"]
+    if args.format:
+        options.append("--format")
+    if args.pgo:
+        # the training input determines the profile, so its content is part of the options
+        training_input: bytes = args.pgo_input.read_bytes() if args.pgo_input.is_file() else b""
+        options.append(f"--pgo={hashlib.sha256(training_input).hexdigest()}")
+    return options
+
+
+def compile_c_pgo(
+    c_file: Path, build_folder: Path, cc: str, flags: list[str], training_input: Path, runner: JobRunner
+) -> Path:
+    """compiles the c file with profile-guided optimization: instrument, train, and recompile with the profile"""
+    # start with an empty profile folder, stale profiles of a previous build don't match the new code
+    profile_folder: Path = build_folder / "pgo"
+    shutil.rmtree(profile_folder, ignore_errors=True)
+    profile_folder.mkdir(parents=True)
+
+    # build the instrumented executable, that writes the profile to the profile folder
+    executable: Path = compile_c(c_file, build_folder, cc, flags + [f"-fprofile-generate={profile_folder}"], runner)
+
+    # run the training, the (captured) output of the executable is not of interest
+    result: JobResult = runner.run([str(executable)], stdin=training_input)
+    if result.returncode:
+        handle_error(f"the pgo training run returned error code {result.returncode}")
+
+    # gcc reads the profile folder directly, clang needs the raw profiles merged into a single profile first
+    profile: Path = profile_folder
+    if cc == "clang":
+        profile = profile_folder / "default.profdata"
+        raw_profiles: list[str] = [str(raw_profile) for raw_profile in profile_folder.glob("*.profraw")]
+        result: JobResult = runner.run(["llvm-profdata", "merge", f"-output={profile}", *raw_profiles])
+        if result.returncode:
+            handle_error(f"llvm-profdata returned error code {result.returncode}: {result.errors}")
+
+    # rebuild the executable optimized with the profile
+    return compile_c(c_file, build_folder, cc, flags + [f"-fprofile-use={profile}"], runner)
+
+
+def handle_error(error_msg: str):
+    # lazy import the inspect and colors modules for error handling
+    import inspect
+    from inspect import FrameInfo
+
+    from .utils.colors import Colors
+
+    # try to get the line number of the function calling this function
+    stack: list[FrameInfo] = inspect.stack()
+    line: str = f"{stack[1].lineno}:" if len(stack) >= 2 else ""
+
+    # construct the filename and error message with colors
+    filename: str = f"\n{Colors.BOLD}{__file__}:{line} {Colors.RESET}"
+    error: str = f"{Colors.BOLD}{Colors.RED}internal compiler error: {Colors.RESET}"
+
+    # print the error and exit with failure
+    print(f"{filename}{error}{error_msg}!")
+    print(f"{Colors.BOLD}{Colors.MAGENTA}terminating...{Colors.RESET}")
+    exit(1)
+
+
+def front_end(file: Path, args: argparse.Namespace, timings: Timings) -> AST:
+    """runs the phases from the source file to the checked AST, returns the checked AST"""
+    if args.streaming:
+        # resolve the types in a first pass, then tokenize and apply the types while generating the AST
+        with timings.phase("typing_passes"):
+            types: Types = streaming_typing_pass(file, args.tokenizer)
+        with timings.phase("generate_ast"):
+            ast: AST = generate_ast(file, stream_tokens(file, args.tokenizer, types), types)
+    elif args.compact:
+        # tokenize into the compact storage, and only construct the tokens again while generating the AST
+        with timings.phase("tokenize"):
+            compact_tokens: CompactTokens = tokenize_compact(file, args.tokenizer)
+        with timings.phase("typing_passes"):
+            types, compact_tokens = compact_typing_passes(file, compact_tokens)
+        with timings.phase("generate_ast"):
+            ast: AST = generate_ast(file, compact_tokens.iter(), types)
+    else:
+        # tokenize the provided file
+        with timings.phase("tokenize"):
+            tokens: Stream[Token] = tokenize(file, args.tokenizer)
+
+        # apply the two typing passes to the token stream
+        with timings.phase("typing_passes"):
+            types: Types = typing_passes(file, tokens)
+
+        # generate an AST from the tokens
+        with timings.phase("generate_ast"):
+            ast: AST = generate_ast(file, tokens, types)
+
+    # run several checks on the generated AST
+    with timings.phase("check_ast"):
+        check_ast(ast, args.separate_checks)
+
+    return ast
+
+
+def compile_file(file: Path, build_folder: Path, args: argparse.Namespace, timings: Timings, runner: JobRunner) -> Path:
+    """compiles the file to an executable in the build folder, returns the path to the executable"""
+    # create the build folder to output the c-code, and a subfolder for the headers
+    header_folder: Path = create_build_folders(build_folder)
+
+    # skip straight to the executable if none of the build inputs changed since the last build
+    flags: list[str] = c_compiler_flags(args)
+    options: list[str] = compyler_options(args)
+    with timings.phase("build_cache"):
+        key: str = BuildCache.compute_key(file, compyler_folder, templates_folder, stdlib_folder, flags, options)
+        build_cache: BuildCache = BuildCache(build_folder, key)
+        up_to_date: bool = not args.no_cache and build_cache.is_up_to_date(build_folder / "main")
+    if up_to_date:
+        logger.info(f"'{file}' and the compiler are unchanged since the last build, skipping compilation")
+        return build_folder / "main"
+    # the build folder is about to be overwritten, so the stored key is no longer valid
+    build_cache.invalidate()
+
+    # load the checked AST from the cache when the file and the compiler are unchanged, otherwise run the front end
+    with timings.phase("ast_cache"):
+        ast_cache: AstCache = AstCache(build_folder, AstCache.compute_key(file, compyler_folder))
+        cached_ast: AST | None = None if args.no_cache else ast_cache.load(file)
+    if cached_ast is not None:
+        logger.info(f"'{file}' and the compiler are unchanged, loaded the checked AST from the cache")
+        ast: AST = cached_ast
+    else:
+        ast: AST = front_end(file, args, timings)
+        # store the checked AST before generating the code, as the code generator changes some of the nodes
+        with timings.phase("store_ast"):
+            ast_cache.store(ast)
+
+    # generate c-code from the AST and write the source files in the build folder
+    with timings.phase("generate_code"):
+        c_file: Path = generate_code(ast, build_folder, header_folder, templates_folder)
+
+    # copy the files in the standard library to the header folder
+    with timings.phase("copy_stdlib"):
+        copy_stdlib(header_folder, stdlib_folder)
+
+    # run the c compiler to compile the file, with a training run in between for profile-guided optimization
+    with timings.phase("compile_c"):
+        # the generated c-code is already indented, only format it with clang-format when requested
+        # the formatting runs concurrently with the c compiler, which compiles the generated c-code as emitted
+        if args.format:
+            format_jobs, format_job = format_files(build_folder, runner)
+        if args.pgo:
+            executable: Path = compile_c_pgo(c_file, build_folder, args.cc, flags, args.pgo_input, runner)
+        else:
+            executable: Path = compile_c(c_file, build_folder, args.cc, flags, runner)
+
+    # write the formatted files, after the c compiler is done reading them
+    if args.format:
+        with timings.phase("format_files"):
+            write_formatted_files(build_folder, format_jobs, format_job)
+
+    # the build succeeded, store its key for the next build
+    build_cache.store()
+
+    return executable
@@ -9,6 +9,8 @@ from pathlib import Path
 from .utils.ast import AST
 from .statements.class_statement import ClassStatement
 from .statements.function_statement import FunctionStatement
+from .utils.c_emitter import CEmitter
+from .utils.file_cache import file_cache
 
 
 class CodeGenerator:
@@ -22,29 +24,30 @@ class CodeGenerator:
         # also generate the typedefs for all builtin basic types
         self._ast.types.generate_c_headers(self._header_folder, self._templates_folder)
 
-        class_c_definitions: list[str] = []
-        function_c_declarations: list[str] = []
-        function_c_definitions: list[str] = []
-        main_c_lines: list[str] = []
+        # the emitters indent the generated code, the main code is inside the body of the main function
+        class_c_definitions: CEmitter = CEmitter()
+        function_c_declarations: CEmitter = CEmitter()
+        function_c_definitions: CEmitter = CEmitter()
+        main_c_lines: CEmitter = CEmitter(indent_level=1)
 
         # compile the statements in the AST to code
         for statement in self._ast.statements.objects:
             if isinstance(statement, ClassStatement):
-                class_c_definitions.append(f"{statement.c_code()}\n")
+                class_c_definitions.emit(statement.c_code())
             elif isinstance(statement, FunctionStatement):
-                function_c_declarations.append(f"{statement.c_declaration()}\n")
-                function_c_definitions.append(f"{statement.c_code()}\n")
+                function_c_declarations.emit(statement.c_declaration())
+                function_c_definitions.emit(statement.c_code())
             else:
-                main_c_lines.append(f"{statement.c_code()}\n")
+                main_c_lines.emit(statement.c_code())
 
         # write the classes to the classes c file
-        self._write_classes_c(class_c_definitions)
+        self._write_classes_c(class_c_definitions.lines)
 
         # write the functions to the functions c file
-        self._write_functions_c(function_c_declarations, function_c_definitions)
+        self._write_functions_c(function_c_declarations.lines, function_c_definitions.lines)
 
         # write the main c file with the code
-        self._write_main_c_file(main_c_lines, main_c_file)
+        self._write_main_c_file(main_c_lines.lines, main_c_file)
 
     def _write_classes_c(self, definitions: list[str]):
         classes_c_file: Path = self._header_folder / "classes.h"
@@ -61,9 +64,7 @@ class CodeGenerator:
             "// classes declarations\n",
         ]
 
-        with open(classes_c_file, "w") as f:
-            f.writelines(initial_lines)
-            f.writelines(definitions)
+        file_cache.write_text(classes_c_file, "".join(initial_lines + definitions))
 
     def _write_functions_c(self, declarations: list[str], definitions: list[str]):
         functions_c_file: Path = self._header_folder / "functions.h"
@@ -84,11 +85,7 @@ class CodeGenerator:
             "// function definitions\n",
         ]
 
-        with open(functions_c_file, "w") as f:
-            f.writelines(initial_lines)
-            f.writelines(declarations)
-            f.writelines(definition_lines)
-            f.writelines(definitions)
+        file_cache.write_text(functions_c_file, "".join(initial_lines + declarations + definition_lines + definitions))
 
     def _write_main_c_file(self, code_lines: list[str], c_file: Path) -> None:
         initial_lines: list[str] = [
@@ -105,7 +102,4 @@ class CodeGenerator:
             "int main(int argc, char** argv) {\n",
         ]
 
-        with open(c_file, "w") as f:
-            f.writelines(initial_lines)
-            f.writelines(code_lines)
-            f.write("}\n")
+        file_cache.write_text(c_file, "".join(initial_lines + code_lines + ["}\n"]))
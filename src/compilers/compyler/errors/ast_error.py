@@ -8,30 +8,65 @@ from pathlib import Path
 
 from .tapl_error import TaplError
 from ..utils.colors import Colors
+from ..utils.source_file import SourceFile
+from ..utils.source_file import source_files
 from ..utils.source_location import SourceLocation
-from ..utils.utils import Utils
 
 
 class AstError(TaplError):
+    """an error in the source code, the error message is formatted when the error is printed"""
+
     def __init__(self, message: str, filename: Path, source_location: SourceLocation | None):
+        super().__init__(message)
+        self.message: str = message
+        self.filename: Path = filename
+        self.source_location: SourceLocation | None = source_location
+        self._formatted: str | None = None
+
+    def _source_line(self) -> tuple[int, str]:
+        """returns the line number and source code line of the error, from the (shared) source file"""
+        no_source: str = f"<no source code line available>"
+        # initial check if a valid SourceLocation is passed
+        if not self.source_location:
+            return -1, no_source
+        try:
+            source_file: SourceFile = source_files.get(self.filename)
+        except OSError:
+            return -1, no_source
+
+        # get the line of the SourceLocation start, -1 when it's outside of the file
+        line: int = source_file.line_number(self.source_location.start)
+        if line < 0:
+            return line, no_source
+
+        # check if the line number exists in the file, return the correct line or error
+        source_line: str | None = source_file.line(line)
+        if source_line is None:
+            error = f"[ internal compiler error! (line {line} not found in source) ]"
+            return line, f"{Colors.BOLD}{Colors.RED}{error}{Colors.RESET} {no_source}"
+        return line, source_line
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = self._format()
+        return self._formatted
+
+    def _format(self) -> str:
         # extract the source code line and line number from the file
-        line: int = Utils.get_source_line_number(filename, source_location)
-        source_line: str = Utils.get_source_line(filename, line)
+        line, source_line = self._source_line()
 
         # check for internal compiler error (no SourceLocation)
-        if not source_location:
+        if not self.source_location:
             error: str = f"[ internal compiler error! (no source location found) ]"
             error: str = f"{Colors.BOLD}{Colors.RED}{error}{Colors.RESET}"
             source_line = f"{error} {source_line}"
 
         # construct the separate sections of the error message
         newline: str = f"{Colors.RESET}\n"
-        file_path: str = f"{Colors.BOLD}{filename}:{line}:{Colors.RESET}"
+        file_path: str = f"{Colors.BOLD}{self.filename}:{line}:{Colors.RESET}"
         error: str = f"{Colors.BOLD}{Colors.RED}error:{Colors.RESET}"
 
         # construct the error message itself
-        error_str: str = f"{newline}{file_path} {error} {message}\n"
+        error_str: str = f"{newline}{file_path} {error} {self.message}\n"
         error_str += f"{line:>4d} | {source_line}"
-
-        # pass it to the base class
-        super().__init__(error_str)
+        return error_str
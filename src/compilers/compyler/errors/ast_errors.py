@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from .ast_error import AstError
+
+
+class AstErrors(AstError):
+    """multiple errors in the source code, which are reported together"""
+
+    def __init__(self, errors: list[AstError]):
+        # the first error is the location of the errors
+        super().__init__(errors[0].message, errors[0].filename, errors[0].source_location)
+        self.errors: list[AstError] = errors
+
+    def _format(self) -> str:
+        return "\n".join(str(error) for error in self.errors)
@@ -11,6 +11,8 @@ from ..utils.source_location import SourceLocation
 
 
 class BinaryExpression(TokenExpression):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Expression, token: Token, right: Expression):
         source_location: SourceLocation = left.source_location + token.source_location + right.source_location
         super().__init__(source_location, token)
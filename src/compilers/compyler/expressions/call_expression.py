@@ -12,6 +12,8 @@ from ..utils.source_location import SourceLocation
 
 
 class CallExpression(Expression):
+    __slots__ = ("expression", "class_type", "arguments", "call_consumed")
+
     def __init__(
         self,
         source_location: SourceLocation,
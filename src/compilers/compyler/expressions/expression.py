@@ -4,13 +4,13 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
-from copy import deepcopy
-
 from ..types.type import Type
 from ..utils.source_location import SourceLocation
 
 
 class Expression:
+    __slots__ = ("source_location", "_internal_type_ref_")
+
     def __init__(self, source_location: SourceLocation):
         self.source_location: SourceLocation = source_location
         self._internal_type_ref_: Type = Type.unknown()
@@ -21,8 +21,8 @@ class Expression:
 
     @type_.setter
     def type_(self, type_: Type) -> None:
-        # always store a copy of the type
-        self._internal_type_ref_ = deepcopy(type_)
+        # the types are shared, the type is stored as is
+        self._internal_type_ref_ = type_
 
     def c_code(self) -> str:
         assert False, f"we can't generate code for a {type(self)}!"
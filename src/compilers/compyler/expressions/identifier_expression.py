@@ -12,6 +12,8 @@ from ..utils.source_location import SourceLocation
 
 
 class IdentifierExpression(Expression):
+    __slots__ = ("identifier_token", "inner_expression", "class_type", "list_type")
+
     def __init__(self, source_location: SourceLocation, identifier_token: IdentifierToken):
         super().__init__(source_location)
         self.identifier_token: IdentifierToken = identifier_token
@@ -13,6 +13,8 @@ from ..utils.utils import Utils
 
 
 class StringExpression(Expression):
+    __slots__ = ("string_elements", "line_end")
+
     def __init__(self, string_start: Token):
         source_location: SourceLocation = string_start.source_location
         super().__init__(source_location)
@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ThisExpression(Expression):
+    __slots__ = ("inner_expression",)
+
     def __init__(self, source_location: SourceLocation, inner_expression: Expression):
         super().__init__(source_location)
         self.inner_expression: Expression = inner_expression
@@ -15,6 +15,8 @@ from ..utils.source_location import SourceLocation
 
 
 class TokenExpression(Expression):
+    __slots__ = ("token",)
+
     def __init__(self, source_location: SourceLocation, token: Token):
         super().__init__(source_location)
         self.token: Token = token
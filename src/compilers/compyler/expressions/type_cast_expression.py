@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class TypeCastExpression(Expression):
+    __slots__ = ("cast_to", "expression")
+
     def __init__(self, source_location: SourceLocation, cast_to: TypeToken, expression: Expression):
         super().__init__(source_location)
         self.cast_to: TypeToken = cast_to
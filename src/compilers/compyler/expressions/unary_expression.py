@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class UnaryExpression(Expression):
+    __slots__ = ("expression_type", "expression")
+
     def __init__(self, source_location: SourceLocation, expression_type: ExpressionType, expression: Expression):
         super().__init__(source_location)
         self.expression_type: ExpressionType = expression_type
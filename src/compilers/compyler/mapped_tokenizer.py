@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from pathlib import Path
+import re
+
+from .regex_tokenizer import RegexTokenizer
+from .tokenizer import Tokenizer
+from .tokens.comment_token import CommentToken
+from .tokens.string_chars_token import StringCharsToken
+from .tokens.token_type import TokenType
+from .utils.logger import logger
+from .utils.mapped_source import MappedSource
+from .utils.source_location import SourceLocation
+
+
+class MappedTokenizer(Tokenizer):
+    """tokenizer that memory maps the file and scans its bytes, instead of reading and decoding the whole file.
+
+    identifiers, numbers, strings and comments are scanned as byte runs, keywords are looked up without copying,
+    and only the identifiers, strings and comments that become tokens are decoded.
+    the source locations are byte offsets, which are the same as the character offsets for ascii sources
+    with '\n' line endings (the file isn't read in text mode, so '\r\n' isn't translated).
+    the diagnostics look up the source locations in the text of the file, use supports() to check the file first.
+    """
+
+    # the keywords as bytes, so they can be looked up with a slice of the file
+    KEYWORDS: dict[bytes, TokenType] = {
+        keyword.encode(): token_type for keyword, token_type in RegexTokenizer.KEYWORDS.items()
+    }
+
+    # the patterns of the remainder of a lexeme, these always match (possibly empty)
+    IDENTIFIER_CHARS: re.Pattern[bytes] = re.compile(rb"[A-Za-z0-9_]*")
+    DIGITS: re.Pattern[bytes] = re.compile(rb"[0-9]*")
+    STRING_CHARS: re.Pattern[bytes] = re.compile(rb'[^"{\n]*')
+
+    @staticmethod
+    def supports(file: Path) -> bool:
+        """returns whether the byte offsets of the file are its character offsets (ascii with '\n' line endings)"""
+        source: MappedSource = MappedSource(file)
+        try:
+            return source.is_ascii_lf()
+        finally:
+            source.close()
+
+    def _load_file(self, file: Path) -> None:
+        """memory map the file, the file is paged in by the operating system while it's tokenized"""
+        self._source: MappedSource = MappedSource(file)
+        self._file_size: int = len(self._source)
+
+    def _tokenize_step(self) -> bool:
+        """tokenize the next token(s), returns False when the end of the file is reached"""
+        if super()._tokenize_step():
+            return True
+        # the whole file is tokenized, the memory map isn't needed anymore
+        self._source.close()
+        return False
+
+    def _get_char(self, consume: bool, offset: int = 0) -> str | None:
+        """utility function to combine _next and _consume"""
+        if self._current_index + offset >= self._file_size:
+            return None
+        character: str = self._source[self._current_index + offset]
+        if consume:
+            self._current_index += 1 + offset
+        return character
+
+    def _add_identifier(self, first_alpha: str) -> None:
+        # the first character is already consumed, consume the rest of the identifier
+        start: int = self._current_index - 1
+        self._current_index = self._source.match_end(self.IDENTIFIER_CHARS, self._current_index)
+        # keywords are looked up without copying or decoding the identifier
+        if keyword := self.KEYWORDS.get(self._source.slice(start, self._current_index)):
+            return self._add_token_of_length(keyword)
+        self._add_identifier_token(self._source.decode(start, self._current_index))
+
+    def _add_number(self, first_char: str) -> None:
+        # binary and hexadecimal numbers are handled by the tokenizer
+        if first_char == "0" and self._get_char(consume=False) in ["b", "x"]:
+            return super()._add_number(first_char)
+        # the first digit is already consumed, consume the rest of the number
+        start: int = self._current_index - 1
+        self._current_index = self._source.match_end(self.DIGITS, self._current_index)
+        value: int = int(bytes(self._source.slice(start, self._current_index)))
+        self._add_number_token(value, start, self._current_index - start)
+
+    def _add_string_chars(self) -> None:
+        # consume all chars until a closing quote, string var start or newline is encountered
+        start: int = self._current_index
+        self._current_index = self._source.match_end(self.STRING_CHARS, start)
+        string: str = self._source.decode(start, self._current_index)
+        match self._get_char(consume=False):
+            case '"':
+                # add the string, then consume and add the closing quote
+                self._add_string_chars_token(string, start)
+                self._current_index += 1
+                self._add_token(TokenType.STRING_END)
+            case TokenType.BRACE_OPEN.value:
+                # add the string, then consume and add the string var start token
+                self._add_string_chars_token(string, start)
+                self._current_index += 1
+                self._add_token(TokenType.STRING_EXPR_START)
+                # transition to string var parsing mode
+                self._string_var_parsing = True
+            case _:
+                # a newline or the end of the file, the string is unterminated
+                logger.error(f'unterminated string "{string}"!')
+                self._add_token(TokenType.ERROR, start, self._current_index - start)
+
+    def _add_inline_comment(self) -> None:
+        # the comment ends before the '\n' (which is processed by the tokenizer) or at the end of the file
+        start: int = self._current_index - 2
+        end: int = self._source.find(b"\n", self._current_index)
+        self._current_index = self._file_size if end == -1 else end
+        self._add_comment_slice_token(TokenType.INLINE_COMMENT, start)
+
+    def _add_block_comment(self) -> None:
+        start: int = self._current_index - 2
+        end: int = self._source.find(b"*/", self._current_index)
+        if end == -1:
+            # unterminated block comment
+            self._current_index = self._file_size
+            logger.error(f'unterminated block comment "{self._source.decode(start, self._file_size)}"!')
+            self._add_token(TokenType.ERROR, start, self._file_size - start)
+            return
+        self._current_index = end + 2
+        self._add_comment_slice_token(TokenType.BLOCK_COMMENT, start)
+
+    def _add_string_chars_token(self, value: str, start: int) -> None:
+        """adds the string chars from start until the current position, the length is in bytes"""
+        source_location: SourceLocation = SourceLocation(start, self._current_index - start)
+        self._tokens.add(StringCharsToken(source_location, value))
+
+    def _add_comment_slice_token(self, token_type: TokenType, start: int) -> None:
+        """adds the comment from start until the current position to the discarded tokens"""
+        source_location: SourceLocation = SourceLocation(start, self._current_index - start)
+        value: str = self._source.decode(start, self._current_index)
+        self._discarded_tokens.add(CommentToken(token_type, source_location, value))
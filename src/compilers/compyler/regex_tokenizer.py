@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import re
+
+from .tokenizer import Tokenizer
+from .tokens.token_type import TokenType
+
+
+class RegexTokenizer(Tokenizer):
+    """tokenizer that consumes whole identifiers, numbers, operators and whitespace runs with a single regex match.
+
+    everything the regex doesn't match (strings, characters, comments, '}', '/', binary and hexadecimal numbers,
+    tabs and unknown characters) falls back to the character based tokenizing of the Tokenizer,
+    so both produce the same token stream.
+    """
+
+    # the keywords, looked up after matching an identifier
+    KEYWORDS: dict[str, TokenType] = {
+        token_type.value: token_type
+        for token_type in [
+            TokenType.BREAK,
+            TokenType.BREAKALL,
+            TokenType.CLASS,
+            TokenType.CONTINUE,
+            TokenType.ELSE,
+            TokenType.FALSE,
+            TokenType.FOR,
+            TokenType.IF,
+            TokenType.LIST,
+            TokenType.NULL,
+            TokenType.PRINT,
+            TokenType.PRINTLN,
+            TokenType.RETURN,
+            TokenType.SUPER,
+            TokenType.THIS,
+            TokenType.TRUE,
+            TokenType.WHILE,
+        ]
+    }
+
+    # the operators that don't need special handling, '}' (string expressions) and '/' (comments) are excluded
+    OPERATORS: dict[str, TokenType] = {
+        token_type.value: token_type
+        for token_type in [
+            TokenType.BRACE_OPEN,
+            TokenType.BRACKET_CLOSE,
+            TokenType.BRACKET_OPEN,
+            TokenType.COLON,
+            TokenType.COMMA,
+            TokenType.DOT,
+            TokenType.PAREN_CLOSE,
+            TokenType.PAREN_OPEN,
+            TokenType.SEMICOLON,
+            TokenType.TILDE,
+            TokenType.EQUAL,
+            TokenType.EQUAL_EQUAL,
+            TokenType.GREATER,
+            TokenType.GREATER_EQUAL,
+            TokenType.LESS,
+            TokenType.LESS_EQUAL,
+            TokenType.MINUS,
+            TokenType.MINUS_EQUAL,
+            TokenType.NOT,
+            TokenType.NOT_EQUAL,
+            TokenType.PLUS,
+            TokenType.PLUS_EQUAL,
+            TokenType.STAR,
+            TokenType.STAR_EQUAL,
+            TokenType.INCREMENT,
+            TokenType.DECREMENT,
+            TokenType.AND,
+            TokenType.AND_AND,
+            TokenType.OR,
+            TokenType.OR_OR,
+        ]
+    }
+
+    # the master regex, the operators are sorted on length to match the longest operator first
+    # numbers starting with 0b or 0x aren't matched, those are binary or hexadecimal numbers
+    OPERATOR_PATTERN: str = "|".join(re.escape(operator) for operator in sorted(OPERATORS, key=len, reverse=True))
+    TOKEN_PATTERN: re.Pattern[str] = re.compile(
+        "|".join(
+            [
+                r"(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)",
+                r"(?P<number>(?!0[bx])[0-9]+)",
+                f"(?P<operator>{OPERATOR_PATTERN})",
+                r"(?P<whitespace>[ \r]+)",
+                r"(?P<newline>\n)",
+            ]
+        )
+    )
+
+    def _tokenize_step(self) -> bool:
+        """tokenize the next token(s), returns False when the end of the file is reached"""
+        if self._at_start_of_line:
+            # if there are any following empty lines, consume them
+            self._consume_empty_lines()
+            # process indent/dedent from spaces at start of line
+            self._add_indent_dedent()
+
+        token_match: re.Match[str] | None = self.TOKEN_PATTERN.match(self._file_characters, self._current_index)
+        if token_match is None:
+            # fall back to tokenizing the next character, until the end of the file is reached
+            char: str | None = self._next()
+            if not self._tokenize_char(char):
+                return False
+            # after \n we're at start of line, we can expect indent/dedent here
+            self._at_start_of_line = char == "\n"
+            return True
+
+        # consume the whole match, and add the token(s) for the matched group
+        self._current_index = token_match.end()
+        self._at_start_of_line = False
+        value: str = token_match.group()
+        match token_match.lastgroup:
+            case "identifier":
+                if keyword := self.KEYWORDS.get(value):
+                    self._add_token_of_length(keyword)
+                else:
+                    self._add_identifier_token(value)
+            case "number":
+                self._add_number_token(int(value), token_match.start(), len(value))
+            case "operator":
+                self._add_token_of_length(self.OPERATORS[value])
+            case "newline":
+                self._add_newline(token_match.start())
+                self._at_start_of_line = True
+            # whitespace runs are skipped
+        return True
@@ -14,6 +14,8 @@ from ..utils.source_location import SourceLocation
 
 
 class AssignmentStatement(Statement):
+    __slots__ = ("expression", "assignment_token", "value")
+
     @classmethod
     def is_assignment_form_token(cls, token: Token) -> bool:
         return token.token_type and token.token_type in {
@@ -9,6 +9,8 @@ from ..utils.source_location import SourceLocation
 
 
 class BreakallStatement(Statement):
+    __slots__ = ("breakall_label",)
+
     def __init__(self, source_location: SourceLocation, breakall_label: str):
         super().__init__(source_location)
 
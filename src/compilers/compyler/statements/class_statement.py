@@ -15,6 +15,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ClassStatement(Statement):
+    __slots__ = ("class_type", "variables", "functions", "constructor", "destructor")
+
     def __init__(self, class_type: ClassType, source_location: SourceLocation):
         super().__init__(source_location)
         self.class_type: ClassType = class_type
@@ -35,7 +37,7 @@ class ClassStatement(Statement):
 
         # add all variables
         for variable in self.variables:
-            code += f"{variable.c_code()}"
+            code += f"{variable.c_code()}\n"
 
         # end with the closing bracket
         code += f"}};\n"
@@ -54,7 +56,7 @@ class ClassStatement(Statement):
 
         # add the methods to the class
         for method in self.functions:
-            code += f"{method.c_code()}"
+            code += f"{method.c_code()}\n"
 
         return code
 
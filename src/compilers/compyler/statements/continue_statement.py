@@ -9,6 +9,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ContinueStatement(Statement):
+    __slots__ = ()
+
     def __init__(self, source_location: SourceLocation):
         super().__init__(source_location)
 
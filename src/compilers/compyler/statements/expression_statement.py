@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ExpressionStatement(Statement):
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expression):
         source_location: SourceLocation = expression.source_location
         super().__init__(source_location)
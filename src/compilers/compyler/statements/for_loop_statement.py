@@ -16,6 +16,8 @@ class ForLoopStatement(Statement):
     for(init; check; loop) {statements}
     """
 
+    __slots__ = ("breakall_label", "init", "check", "loop", "statements")
+
     def __init__(
         self,
         token: Token,
@@ -12,6 +12,8 @@ from ..utils.source_location import SourceLocation
 
 
 class FunctionStatement(Statement):
+    __slots__ = ("return_type", "name", "class_type", "arguments", "statements")
+
     def __init__(self, return_type: TypeToken, name: IdentifierToken, class_type: ClassType | None = None):
         # store the initial source location, where arguments are added later
         source_location: SourceLocation = return_type.source_location + name.source_location
@@ -11,6 +11,8 @@ from ..utils.source_location import SourceLocation
 
 
 class IfStatement(Statement):
+    __slots__ = ("expression", "statements", "else_if_statement_blocks", "else_statements")
+
     def __init__(self, token: Token, expression: Expression, statements: list[Statement]):
         # formulate the source location of the expression and statements
         source_location: SourceLocation = token.source_location + expression.source_location
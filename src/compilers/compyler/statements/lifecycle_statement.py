@@ -13,6 +13,8 @@ from ..utils.source_location import SourceLocation
 
 
 class LifecycleStatement(Statement):
+    __slots__ = ("statement_type", "type_", "arguments", "statements")
+
     def __init__(self, statement_type: LifecycleStatementType, type_: Type, source_location: SourceLocation):
         super().__init__(source_location)
         self.statement_type: LifecycleStatementType = statement_type
@@ -45,7 +47,7 @@ class LifecycleStatement(Statement):
         code += ", ".join(arguments)
 
         # add the closing parenthesis and opening bracket
-        code += f"){{"
+        code += f") {{\n"
 
         # add the statements in the lifecycle statement
         for statement in self.statements:
@@ -12,6 +12,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ListStatement(Statement):
+    __slots__ = ("list_type", "name")
+
     def __init__(self, type_token: TypeToken, name: IdentifierToken):
         # formulate the source location from the list statement from list till name
         source_location: SourceLocation = type_token.source_location + name.source_location
@@ -25,7 +27,7 @@ class ListStatement(Statement):
     def c_code(self) -> str:
         list_base: str = self.list_type.c_code()
         # create the list declaration
-        code: str = f"{list_base} {self.name};"
+        code: str = f"{list_base} {self.name};\n"
         # call the constructor of the list
         code += f"{list_base}_constructor(&{self.name});"
         return code
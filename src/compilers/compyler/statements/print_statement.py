@@ -14,6 +14,8 @@ from ..utils.utils import Utils
 
 
 class PrintStatement(Statement):
+    __slots__ = ("line_end", "value")
+
     def __init__(self, token: Token, value: Expression):
         source_location: SourceLocation = token.source_location + value.source_location
         super().__init__(source_location)
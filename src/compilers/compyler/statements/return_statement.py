@@ -11,6 +11,8 @@ from ..utils.source_location import SourceLocation
 
 
 class ReturnStatement(Statement):
+    __slots__ = ("value",)
+
     def __init__(self, token: Token, value: Expression | None = None):
         # formulate the source location of the return statement
         source_location: SourceLocation = token.source_location
@@ -8,6 +8,8 @@ from ..utils.source_location import SourceLocation
 
 
 class Statement:
+    __slots__ = ("source_location",)
+
     def __init__(self, source_location: SourceLocation):
         self.source_location: SourceLocation = source_location
 
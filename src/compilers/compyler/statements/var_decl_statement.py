@@ -12,6 +12,8 @@ from ..utils.source_location import SourceLocation
 
 
 class VarDeclStatement(Statement):
+    __slots__ = ("type_token", "name", "initial_value")
+
     def __init__(self, type_token: TypeToken, name: IdentifierToken, initial_value: Expression | None = None):
         # formulate the source location from the type name and initial value, if passed
         source_location: SourceLocation = type_token.source_location + name.source_location
@@ -4,6 +4,7 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from .tokens.token_type import TokenType
@@ -13,6 +14,8 @@ from .tokens.identifier_token import IdentifierToken
 from .tokens.number_token import NumberToken
 from .tokens.string_chars_token import StringCharsToken
 from .tokens.token import Token
+from .utils.logger import logger
+from .utils.source_file import source_files
 from .utils.source_location import SourceLocation
 from .utils.stream import Stream
 
@@ -21,11 +24,8 @@ class Tokenizer:
     INDENT_SPACES: int = 4
 
     def __init__(self, file: Path):
-        print(f'tokenizing file: "{file}"')
-        # for this compiler files will be small enough to load entirely into a string in memory
-        with open(file) as f:
-            self._file_characters: str = "".join(f.readlines())
-        self._file_size: int = len(self._file_characters)
+        logger.info(f'tokenizing file: "{file}"')
+        self._load_file(file)
 
         # some variables to store the state of the tokenizer
         self._current_index: int = 0
@@ -39,141 +39,177 @@ class Tokenizer:
         # the discarded tokens from the tokenizer (comments, additional newlines, etc)
         self._discarded_tokens: Stream[Token] = Stream()
 
+    def _load_file(self, file: Path) -> None:
+        """load the file, sets the characters and size of the file"""
+        # for this compiler files will be small enough to load entirely into a string in memory,
+        # the source file is shared with the diagnostics of the later phases
+        self._file_characters: str = source_files.get(file).text
+        self._file_size: int = len(self._file_characters)
+
     def tokenize(self) -> Stream[Token]:
         """tokenize the file and return a token stream"""
-        # infinite loop until we reach the end of file
-        while True:
-            if self._at_start_of_line:
-                # if there are any following empty lines, consume them
-                self._consume_empty_lines()
-                # process indent/dedent from spaces at start of line
-                self._add_indent_dedent()
-
-            # switch-case for the next character
-            match char := self._next():
-                # match all single-character tokens
-                case TokenType.BRACE_CLOSE.value:
-                    # check if we're in string var parsing mode
-                    if self._string_var_parsing:
-                        # add the string var end token
-                        self._add_token(TokenType.STRING_EXPR_END)
-                        # reset the flag (as it can be set again in the add string chars)
-                        self._string_var_parsing = False
-                        # continue parsing string chars
-                        self._add_string_chars()
-                    else:
-                        self._add_token_of_length(TokenType.BRACE_CLOSE)
-                case TokenType.BRACE_OPEN.value:
-                    self._add_token_of_length(TokenType.BRACE_OPEN)
-                case TokenType.BRACKET_CLOSE.value:
-                    self._add_token_of_length(TokenType.BRACKET_CLOSE)
-                case TokenType.BRACKET_OPEN.value:
-                    self._add_token_of_length(TokenType.BRACKET_OPEN)
-                case TokenType.COLON.value:
-                    self._add_token_of_length(TokenType.COLON)
-                case TokenType.COMMA.value:
-                    self._add_token_of_length(TokenType.COMMA)
-                case TokenType.DOT.value:
-                    self._add_token_of_length(TokenType.DOT)
-                case TokenType.PAREN_CLOSE.value:
-                    self._add_token_of_length(TokenType.PAREN_CLOSE)
-                case TokenType.PAREN_OPEN.value:
-                    self._add_token_of_length(TokenType.PAREN_OPEN)
-                case TokenType.SEMICOLON.value:
-                    self._add_token_of_length(TokenType.SEMICOLON)
-                case TokenType.TILDE.value:
-                    self._add_token_of_length(TokenType.TILDE)
-                # match all single- or double-character tokens
-                case TokenType.EQUAL.value:
-                    if self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.EQUAL_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.EQUAL)
-                case TokenType.GREATER.value:
-                    if self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.GREATER_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.GREATER)
-                case TokenType.LESS.value:
-                    if self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.LESS_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.LESS)
-                case TokenType.MINUS.value:
-                    if self._consume(TokenType.MINUS.value):
-                        self._add_token_of_length(TokenType.DECREMENT)
-                    elif self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.MINUS_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.MINUS)
-                case TokenType.NOT.value:
-                    if self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.NOT_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.NOT)
-                case TokenType.PLUS.value:
-                    if self._consume(TokenType.PLUS.value):
-                        self._add_token_of_length(TokenType.INCREMENT)
-                    elif self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.PLUS_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.PLUS)
-                case TokenType.SLASH.value:
-                    if self._consume(TokenType.SLASH.value):
-                        self._add_inline_comment()
-                    elif self._consume(TokenType.STAR.value):
-                        self._add_block_comment()
-                    elif self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.SLASH_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.SLASH)
-                case TokenType.STAR.value:
-                    if self._consume(TokenType.EQUAL.value):
-                        self._add_token_of_length(TokenType.STAR_EQUAL)
-                    else:
-                        self._add_token_of_length(TokenType.STAR)
-                case TokenType.AND.value:
-                    if self._consume(TokenType.AND.value):
-                        self._add_token_of_length(TokenType.AND_AND)
-                    else:
-                        self._add_token_of_length(TokenType.AND)
-                case TokenType.OR.value:
-                    if self._consume(TokenType.OR.value):
-                        self._add_token_of_length(TokenType.OR_OR)
-                    else:
-                        self._add_token_of_length(TokenType.OR)
-                # match special EOF case, we parsed the whole file
-                case None:
-                    self._add_token(TokenType.EOF)
-                    break
-                # match characters, numbers and strings
-                case "'":
-                    self._add_character()
-                case digit if self._isdigit(char):
-                    # first match a digit, as identifiers can't start with a digit
-                    self._add_number(digit)
-                case '"':
-                    self._start_string()
-                case identifier_char if self._is_identifier_char(char):
-                    self._add_identifier(identifier_char)
-                # match whitespaces
-                case " ":
-                    pass
-                case "\n":
-                    self._add_newline(self._current_index - 1)
-                case "\r":
-                    # why use carriage return..
-                    pass
-                case "\t":
-                    print("error: dammit, we use spaces not tabs!")
-                    self._add_token(TokenType.ERROR)
-                case _:
-                    print(f"unknown character '{char}', skipped...")
-                    self._add_token(TokenType.ERROR)
-            # after \n we're at start of line, we can expect indent/dedent here
-            self._at_start_of_line = char == "\n"
+        # loop until we reach the end of file
+        while self._tokenize_step():
+            pass
         return self._tokens
 
+    def iter_tokens(self) -> Iterator[Token]:
+        """tokenize the file lazily, yielding the tokens while the file is tokenized.
+
+        only the last token is kept in the token stream (to discard additional newlines),
+        and the discarded tokens aren't kept at all, so the memory usage doesn't grow with the file size
+        """
+        tokens: list[Token] = self._tokens.objects
+        tokenizing: bool = True
+        while tokenizing:
+            # the token kept from the previous step is already yielded
+            yielded: int = len(tokens)
+            tokenizing = self._tokenize_step()
+            yield from tokens[yielded:]
+            del tokens[:-1]
+            self._discarded_tokens.objects.clear()
+
+    def _tokenize_step(self) -> bool:
+        """tokenize the next token(s), returns False when the end of the file is reached"""
+        if self._at_start_of_line:
+            # if there are any following empty lines, consume them
+            self._consume_empty_lines()
+            # process indent/dedent from spaces at start of line
+            self._add_indent_dedent()
+
+        # tokenize the next character, until the end of the file is reached
+        char: str | None = self._next()
+        if not self._tokenize_char(char):
+            return False
+        # after \n we're at start of line, we can expect indent/dedent here
+        self._at_start_of_line = char == "\n"
+        return True
+
+    def _tokenize_char(self, char: str | None) -> bool:
+        """tokenize the (consumed) character, and the characters following it, returns False at the end of the file"""
+        # switch-case for the character
+        match char:
+            # match all single-character tokens
+            case TokenType.BRACE_CLOSE.value:
+                # check if we're in string var parsing mode
+                if self._string_var_parsing:
+                    # add the string var end token
+                    self._add_token(TokenType.STRING_EXPR_END)
+                    # reset the flag (as it can be set again in the add string chars)
+                    self._string_var_parsing = False
+                    # continue parsing string chars
+                    self._add_string_chars()
+                else:
+                    self._add_token_of_length(TokenType.BRACE_CLOSE)
+            case TokenType.BRACE_OPEN.value:
+                self._add_token_of_length(TokenType.BRACE_OPEN)
+            case TokenType.BRACKET_CLOSE.value:
+                self._add_token_of_length(TokenType.BRACKET_CLOSE)
+            case TokenType.BRACKET_OPEN.value:
+                self._add_token_of_length(TokenType.BRACKET_OPEN)
+            case TokenType.COLON.value:
+                self._add_token_of_length(TokenType.COLON)
+            case TokenType.COMMA.value:
+                self._add_token_of_length(TokenType.COMMA)
+            case TokenType.DOT.value:
+                self._add_token_of_length(TokenType.DOT)
+            case TokenType.PAREN_CLOSE.value:
+                self._add_token_of_length(TokenType.PAREN_CLOSE)
+            case TokenType.PAREN_OPEN.value:
+                self._add_token_of_length(TokenType.PAREN_OPEN)
+            case TokenType.SEMICOLON.value:
+                self._add_token_of_length(TokenType.SEMICOLON)
+            case TokenType.TILDE.value:
+                self._add_token_of_length(TokenType.TILDE)
+            # match all single- or double-character tokens
+            case TokenType.EQUAL.value:
+                if self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.EQUAL_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.EQUAL)
+            case TokenType.GREATER.value:
+                if self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.GREATER_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.GREATER)
+            case TokenType.LESS.value:
+                if self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.LESS_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.LESS)
+            case TokenType.MINUS.value:
+                if self._consume(TokenType.MINUS.value):
+                    self._add_token_of_length(TokenType.DECREMENT)
+                elif self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.MINUS_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.MINUS)
+            case TokenType.NOT.value:
+                if self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.NOT_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.NOT)
+            case TokenType.PLUS.value:
+                if self._consume(TokenType.PLUS.value):
+                    self._add_token_of_length(TokenType.INCREMENT)
+                elif self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.PLUS_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.PLUS)
+            case TokenType.SLASH.value:
+                if self._consume(TokenType.SLASH.value):
+                    self._add_inline_comment()
+                elif self._consume(TokenType.STAR.value):
+                    self._add_block_comment()
+                elif self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.SLASH_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.SLASH)
+            case TokenType.STAR.value:
+                if self._consume(TokenType.EQUAL.value):
+                    self._add_token_of_length(TokenType.STAR_EQUAL)
+                else:
+                    self._add_token_of_length(TokenType.STAR)
+            case TokenType.AND.value:
+                if self._consume(TokenType.AND.value):
+                    self._add_token_of_length(TokenType.AND_AND)
+                else:
+                    self._add_token_of_length(TokenType.AND)
+            case TokenType.OR.value:
+                if self._consume(TokenType.OR.value):
+                    self._add_token_of_length(TokenType.OR_OR)
+                else:
+                    self._add_token_of_length(TokenType.OR)
+            # match special EOF case, we parsed the whole file
+            case None:
+                self._add_token(TokenType.EOF)
+                return False
+            # match characters, numbers and strings
+            case "'":
+                self._add_character()
+            case digit if self._isdigit(char):
+                # first match a digit, as identifiers can't start with a digit
+                self._add_number(digit)
+            case '"':
+                self._start_string()
+            case identifier_char if self._is_identifier_char(char):
+                self._add_identifier(identifier_char)
+            # match whitespaces
+            case " ":
+                pass
+            case "\n":
+                self._add_newline(self._current_index - 1)
+            case "\r":
+                # why use carriage return..
+                pass
+            case "\t":
+                logger.error("error: dammit, we use spaces not tabs!")
+                self._add_token(TokenType.ERROR)
+            case _:
+                logger.error(f"unknown character '{char}', skipped...")
+                self._add_token(TokenType.ERROR)
+        return True
+
     def _next(self) -> str | None:
         """consume and return the next character in the file"""
         return self._get_char(consume=True)
@@ -280,7 +316,7 @@ class Tokenizer:
         length: int = len(binary_str)
         start: int = self._current_index - length
         if length == 2:
-            print(f'invalid binary value "{binary_str}"!')
+            logger.error(f'invalid binary value "{binary_str}"!')
             self._add_token(TokenType.ERROR, start, length)
         else:
             self._add_number_token(int(binary_str, 2), start, length)
@@ -298,7 +334,7 @@ class Tokenizer:
         length: int = len(hexadecimal_str)
         start: int = self._current_index - length
         if len(hexadecimal_str) == 2:
-            print(f'invalid hexadecimal value "{hexadecimal_str}"!')
+            logger.error(f'invalid hexadecimal value "{hexadecimal_str}"!')
             self._add_token(TokenType.ERROR, start, length)
         else:
             self._add_number_token(int(hexadecimal_str, 16), start, length)
@@ -307,14 +343,14 @@ class Tokenizer:
         # the opening quote is already consumed, add the character itself
         character: str | None = self._next()
         if not character:
-            print("unterminated character!")
+            logger.error("unterminated character!")
             return self._add_token(TokenType.ERROR, self._current_index - 1, 1)
 
         if character == "\\":
             # handle escape sequences
             escape_char: str | None = self._next()
             if not escape_char or escape_char not in ["n", "r", "t", "'", "\\"]:  # valid escape sequences
-                print(f"unknown escape sequence '{character}{escape_char}'!")
+                logger.error(f"unknown escape sequence '{character}{escape_char}'!")
                 return self._add_token(TokenType.ERROR, self._current_index - 2, 2)
             character = character + escape_char
 
@@ -324,9 +360,9 @@ class Tokenizer:
             return self._add_character_token(character, self._current_index - 3, 3)
         # handle the errors: no character and invalid character
         if not closing_quote:
-            print("unterminated character!")
+            logger.error("unterminated character!")
             return self._add_token(TokenType.ERROR, self._current_index - 2, 2)
-        print("expected ''' after character")
+        logger.error("expected ''' after character")
         return self._add_token(TokenType.ERROR, self._current_index - 3, 3)
 
     def _add_number(self, first_char: str) -> None:
@@ -393,7 +429,7 @@ class Tokenizer:
             if char == "\n":
                 length: int = len(string)
                 start: int = self._current_index - length
-                print(f'unterminated string "{string}"!')
+                logger.error(f'unterminated string "{string}"!')
                 self._add_token(TokenType.ERROR, start, length)
                 return
             # append to the string and consume the character
@@ -402,7 +438,7 @@ class Tokenizer:
         # also handle the empty file case
         length: int = len(string)
         start: int = self._current_index - length
-        print(f'unterminated string "{string}"!')
+        logger.error(f'unterminated string "{string}"!')
         self._add_token(TokenType.ERROR, start, length)
         return
 
@@ -475,7 +511,7 @@ class Tokenizer:
                 self._line += 1
         else:
             # unterminated block comment
-            print(f'unterminated block comment "{comment_text}"!')
+            logger.error(f'unterminated block comment "{comment_text}"!')
             length: int = len(comment_text)
             start: int = self._current_index - length
             self._add_token(TokenType.ERROR, start, length)
@@ -536,7 +572,7 @@ class Tokenizer:
         start: int = self._current_index - spaces
 
         if spaces % self.INDENT_SPACES != 0:
-            print(f"indentations must be a multiple of {self.INDENT_SPACES} spaces!")
+            logger.error(f"indentations must be a multiple of {self.INDENT_SPACES} spaces!")
             self._add_token(TokenType.ERROR, start, spaces)
 
         indent: int = spaces // self.INDENT_SPACES
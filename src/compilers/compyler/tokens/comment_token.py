@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class CommentToken(Token):
+    __slots__ = ("value",)
+
     def __init__(self, token_type: TokenType, source_location: SourceLocation, value: str):
         super().__init__(token_type, source_location)
         # store the additional properties in the class
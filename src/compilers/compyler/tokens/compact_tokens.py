@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from .character_token import CharacterToken
+from .comment_token import CommentToken
+from .identifier_token import IdentifierToken
+from .number_token import NumberToken
+from .string_chars_token import StringCharsToken
+from .token import Token
+from .token_type import TokenType
+from .type_token import TypeToken
+from ..types.type import Type
+from ..utils.source_location import SourceLocation
+
+# the values stored in the tokens: identifiers, strings, characters, comments, numbers and types
+TokenValue = str | int | Type
+
+
+class CompactTokens:
+    """compact, struct-of-arrays storage of a token stream.
+
+    instead of a Python object (with a SourceLocation object) per token, the token type, start and length of
+    the tokens are stored in array('I') columns. the values of the tokens are interned in a side table,
+    and the values column stores the index in this table (0 for tokens without a value).
+    Token objects are only constructed when a token is indexed, the passes over the tokens use the columns.
+    """
+
+    # the token types, the kinds column stores the index of the token type in this list
+    TOKEN_TYPES: list[TokenType] = list(TokenType)
+    KINDS: dict[TokenType, int] = {token_type: kind for kind, token_type in enumerate(TOKEN_TYPES)}
+
+    def __init__(self):
+        self._kinds: array[int] = array("I")
+        self._starts: array[int] = array("I")
+        self._lengths: array[int] = array("I")
+        self._values: array[int] = array("I")
+        # the interned values, with the value index per value (types are interned by their keyword)
+        self._value_table: list[TokenValue | None] = [None]
+        self._value_indices: dict[TokenValue, int] = {}
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Token]) -> "CompactTokens":
+        """returns the compact storage of the tokens, the tokens can be a (lazy) iterable"""
+        compact_tokens: CompactTokens = cls()
+        for token in tokens:
+            compact_tokens.add(token)
+        return compact_tokens
+
+    def add(self, token: Token) -> None:
+        """add the token, only its token type, source location and value are stored"""
+        value: TokenValue | None = None
+        match token:
+            case IdentifierToken() | NumberToken() | CharacterToken() | StringCharsToken() | CommentToken():
+                value = token.value
+            case TypeToken():
+                value = token.type_
+            case _:
+                pass
+        self.append(token.token_type, token.source_location.start, token.source_location.length, value)
+
+    def append(self, token_type: TokenType, start: int, length: int, value: TokenValue | None = None) -> None:
+        """append a token with the token type, start, length and (optional) value"""
+        self._kinds.append(self.KINDS[token_type])
+        self._starts.append(start)
+        self._lengths.append(length)
+        self._values.append(0 if value is None else self._intern(value))
+
+    def copy(self) -> "CompactTokens":
+        """returns a copy of the compact tokens, the columns are copied and the value table is shared"""
+        compact_tokens: CompactTokens = CompactTokens()
+        compact_tokens._kinds = array("I", self._kinds)
+        compact_tokens._starts = array("I", self._starts)
+        compact_tokens._lengths = array("I", self._lengths)
+        compact_tokens._values = array("I", self._values)
+        compact_tokens._value_table = self._value_table
+        compact_tokens._value_indices = self._value_indices
+        return compact_tokens
+
+    def set_type(self, index: int, type_: Type) -> None:
+        """replaces the token at the index with a type token of the type, at the same source location"""
+        self._kinds[index] = self.KINDS[TokenType.TYPE]
+        self._values[index] = self._intern(type_)
+
+    def replace(self, replacements: list[tuple[int, int, Type]]) -> None:
+        """replaces [count] tokens from the index with a type token of the type, spanning the replaced tokens.
+        the replacements are (index, count, type) tuples, sorted on index and not overlapping
+        """
+        if not replacements:
+            return
+        columns: list[array[int]] = [self._kinds, self._starts, self._lengths, self._values]
+        replaced: list[array[int]] = [array("I") for _ in columns]
+        previous_end: int = 0
+        for index, count, type_ in replacements:
+            end: int = index + count
+            # copy the tokens before the replaced tokens, then add the replacement
+            for column, replaced_column in zip(columns, replaced):
+                replaced_column.extend(column[previous_end:index])
+            start: int = self._starts[index]
+            replaced[0].append(self.KINDS[TokenType.TYPE])
+            replaced[1].append(start)
+            replaced[2].append(self._starts[end - 1] + self._lengths[end - 1] - start)
+            replaced[3].append(self._intern(type_))
+            previous_end = end
+        for column, replaced_column in zip(columns, replaced):
+            replaced_column.extend(column[previous_end:])
+        self._kinds, self._starts, self._lengths, self._values = replaced
+
+    def _intern(self, value: TokenValue) -> int:
+        """returns the index of the value in the value table, the value is added when it's not present yet"""
+        index: int | None = self._value_indices.get(value)
+        if index is None:
+            index = len(self._value_table)
+            self._value_table.append(value)
+            self._value_indices[value] = index
+        return index
+
+    def token_type(self, index: int) -> TokenType:
+        return self.TOKEN_TYPES[self._kinds[index]]
+
+    def value_index(self, index: int) -> int:
+        """returns the index of the value of the token in the value table, the same values have the same index"""
+        return self._values[index]
+
+    def value(self, index: int) -> TokenValue | None:
+        return self._value_table[self._values[index]]
+
+    def source_location(self, index: int) -> SourceLocation:
+        return SourceLocation(self._starts[index], self._lengths[index])
+
+    def kinds(self) -> array[int]:
+        """returns the kinds column, for fast scans over the token types (see KINDS)"""
+        return self._kinds
+
+    def __getitem__(self, index: int) -> Token:
+        """constructs the token at the index, raises an IndexError past the end"""
+        token_type: TokenType = self.TOKEN_TYPES[self._kinds[index]]
+        source_location: SourceLocation = SourceLocation(self._starts[index], self._lengths[index])
+        value: TokenValue | None = self._value_table[self._values[index]]
+        match token_type:
+            case TokenType.IDENTIFIER:
+                assert isinstance(value, str)
+                return IdentifierToken(source_location, value)
+            case TokenType.NUMBER:
+                assert isinstance(value, int)
+                return NumberToken(source_location, value)
+            case TokenType.CHARACTER:
+                assert isinstance(value, str)
+                return CharacterToken(source_location, value)
+            case TokenType.STRING_CHARS:
+                assert isinstance(value, str)
+                return StringCharsToken(source_location, value)
+            case TokenType.INLINE_COMMENT | TokenType.BLOCK_COMMENT:
+                assert isinstance(value, str)
+                return CommentToken(token_type, source_location, value)
+            case TokenType.TYPE:
+                # the types are shared, every type token refers to the interned type
+                assert isinstance(value, Type)
+                return TypeToken(source_location, value)
+            case _:
+                return Token(token_type, source_location)
+
+    def iter(self) -> Iterator[Token]:
+        """returns a lazy iterator over the tokens, the tokens are constructed while iterating"""
+        for index in range(len(self._kinds)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __repr__(self) -> str:
+        return repr(list(self.iter()))
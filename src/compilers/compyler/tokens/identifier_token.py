@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class IdentifierToken(Token):
+    __slots__ = ("value",)
+
     def __init__(self, source_location: SourceLocation, value: str):
         super().__init__(TokenType.IDENTIFIER, source_location)
         # store the additional properties in the class
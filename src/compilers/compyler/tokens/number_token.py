@@ -10,6 +10,8 @@ from ..utils.source_location import SourceLocation
 
 
 class NumberToken(Token):
+    __slots__ = ("value",)
+
     def __init__(self, source_location: SourceLocation, value: int):
         super().__init__(TokenType.NUMBER, source_location)
         # store the additional properties in the class
@@ -9,6 +9,8 @@ from ..utils.source_location import SourceLocation
 
 
 class Token:
+    __slots__ = ("token_type", "source_location")
+
     def __init__(self, token_type: TokenType, source_location: SourceLocation):
         self.token_type: TokenType = token_type
         self.source_location: SourceLocation = source_location
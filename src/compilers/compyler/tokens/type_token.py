@@ -11,6 +11,8 @@ from ..utils.source_location import SourceLocation
 
 
 class TypeToken(Token):
+    __slots__ = ("type_",)
+
     def __init__(self, source_location: SourceLocation, type_: Type):
         super().__init__(TokenType.TYPE, source_location)
         # store the additional properties in the class
@@ -10,6 +10,8 @@ from .type import Type
 
 
 class CharacterType(Type):
+    __slots__ = ("inner_type",)
+
     def __init__(self):
         keyword: str = "char"
         super().__init__(keyword)
@@ -8,6 +8,8 @@ from .type import Type
 
 
 class ClassType(Type):
+    __slots__ = ()
+
     def __init__(self, keyword: str, syntactic_sugar: list[str] = [], underlying_type: str | None = None):
         # create a simple super class for this class type
         super().__init__(keyword, syntactic_sugar, underlying_type)
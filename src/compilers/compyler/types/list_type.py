@@ -8,6 +8,8 @@ from .type import Type
 
 
 class ListType(Type):
+    __slots__ = ("inner_type",)
+
     def __init__(self, inner_type: Type):
         # create a simple type interface of this list type
         keyword: str = f"list[{inner_type.keyword}]"
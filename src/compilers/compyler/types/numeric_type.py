@@ -9,6 +9,8 @@ from .numeric_type_type import NumericTypeType
 
 
 class NumericType(Type):
+    __slots__ = ("_promotions", "_promotion_set", "numeric_type_type", "num_bits", "value_range")
+
     def __init__(
         self,
         keyword: str,
@@ -19,12 +21,28 @@ class NumericType(Type):
     ):
         super().__init__(keyword, syntactic_sugar=syntactic_sugar, underlying_type=underlying_type)
         self._promotions: list[Type] = []
+        self._promotion_set: set[Type] = set()
         self.numeric_type_type: NumericTypeType = numeric_type_type
         self.num_bits: int = num_bits
+        # the [min, max] values of the type, None for floating point types
+        self.value_range: tuple[int, int] | None = self._value_range()
+
+    def _value_range(self) -> tuple[int, int] | None:
+        match self.numeric_type_type:
+            case NumericTypeType.SIGNED:
+                # TODO: this will overflow in the non-python compiler
+                max_value: int = 2 ** (self.num_bits - 1) - 1  # 0x7F~ -> 127~
+                return -max_value - 1, max_value  # 0x80~ -> -128~
+            case NumericTypeType.UNSIGNED:
+                # TODO: this will overflow in the non-python compiler
+                return 0, 2 ** (self.num_bits) - 1  # 0x00~ -> 0, 0xFF~ -> 255~
+            case NumericTypeType.FLOATING_POINT:
+                return None
 
     def add_promotions(self, *promotions: "Type") -> None:
         """add promotions to which this type can promote to"""
         self._promotions.extend(promotions)
+        self._promotion_set.update(promotions)
 
     def get_promotions(self) -> list["Type"]:
         """get the list of promotions of this type"""
@@ -32,4 +50,4 @@ class NumericType(Type):
 
     def can_promote_to(self, other: "Type") -> bool:
         """check if this type can be promoted (or is of same type) as other"""
-        return other == self or other in self.get_promotions()
+        return other == self or other in self._promotion_set
@@ -4,8 +4,16 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from copy import copy
+
 
 class Type:
+    """a type of the language, the types are interned: every type exists once and is shared (it's immutable).
+    the reference variant of a type (for function arguments) is a separate, also shared, Type
+    """
+
+    __slots__ = ("keyword", "syntactic_sugar", "underlying_type", "is_reference", "type_id", "_reference_type")
+
     _unknown: Type | None = None
 
     def __init__(self, keyword: str, syntactic_sugar: list[str] = [], underlying_type: str | None = None):
@@ -13,6 +21,9 @@ class Type:
         self.syntactic_sugar: list[str] = syntactic_sugar
         self.underlying_type: str | None = underlying_type
         self.is_reference: bool = False
+        # the id of the type in the Types collection, -1 when the type isn't added to a collection
+        self.type_id: int = -1
+        self._reference_type: Type | None = None
 
     @classmethod
     def unknown(cls):
@@ -23,6 +34,16 @@ class Type:
         # return the created unknown Type
         return cls._unknown
 
+    def as_reference(self) -> "Type":
+        """returns the reference variant of this type, which is created once"""
+        if self._reference_type is None:
+            # the reference variant is a shallow copy, so it is of the same class and shares the other types
+            reference_type: Type = copy(self)
+            reference_type.is_reference = True
+            reference_type._reference_type = reference_type
+            self._reference_type = reference_type
+        return self._reference_type
+
     def reference(self) -> str:
         return f"*" if self.is_reference else f""
 
@@ -52,5 +73,9 @@ class Type:
 
         return self.keyword == other.keyword
 
+    def __hash__(self) -> int:
+        """the hash is consistent with equality, so (reference variants of) equal types have the same hash"""
+        return hash(self.keyword)
+
     def __str__(self) -> str:
         return f"{self.keyword}"
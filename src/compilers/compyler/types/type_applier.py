@@ -4,16 +4,22 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import NoReturn
 
 from ..errors.ast_error import AstError
+from ..errors.ast_errors import AstErrors
+from ..tokens.compact_tokens import CompactTokens
+from ..tokens.compact_tokens import TokenValue
 from ..tokens.identifier_token import IdentifierToken
 from ..tokens.token import Token
 from ..tokens.type_token import TypeToken
 from ..tokens.token_type import TokenType
 from .types import Types
 from .list_type import ListType
+from .type import Type
+from ..utils.lookahead_buffer import LookaheadBuffer
 from ..utils.source_location import SourceLocation
 from ..utils.stream import Stream
 
@@ -22,50 +28,145 @@ class TypeApplier:
     def __init__(self, filename: Path, types: Types):
         self._filename: Path = filename
         self._types: Types = types
+        # store a list of errors during the pass, they're raised together after all tokens are processed
+        self._errors: list[AstError] = []
 
     def apply(self, tokens: Stream[Token]) -> Stream[Token]:
         """loop through the provided token stream.
-        replace the IdentifierToken that is a type with a TypeToken.
-        modifies the token stream inplace, and returns a reference to the stream.
+        replace the IdentifierToken that is a type with a TypeToken, and the list types with a TypeToken.
+        the tokens are replaced in a single linear pass, which replaces the objects of the stream (in place),
+        and returns a reference to the stream.
+        the pass continues after errors, all errors are raised together (as AstErrors) after the pass.
         """
-        # TODO: make this pass continue to resolve all tokens and show the error(s) afterward
-
-        # find a type IdentifierToken
-        # consume the token and add a TypeToken
-        # loop through the tokens to find the types
-        for token in tokens.iter():
-            if isinstance(token, IdentifierToken):
-                # check that the identifier corresponds with a type
-                if var_type := self._types.get(token.value):
-                    # found the type of the IdentifierToken, construct the TypeToken
-                    type_token: TypeToken = TypeToken(token.source_location, var_type)
-
-                    # replace the IdentifierToken with a TypeToken
-                    tokens.replace(1, type_token)
-
-        # TODO: this multi-pass approach can probably be optimized
-        # second pass to find and convert the list types to TypeTokens
-        for token in tokens.iter():
+        tokens.objects = list(self._apply_types(tokens.objects))
+        return tokens
+
+    def apply_iter(self, tokens: Iterator[Token]) -> Iterator[Token]:
+        """lazily apply the types to the tokens of the provided iterator, the streaming version of apply.
+        yields the tokens, with the IdentifierTokens that are a type and the list types replaced by TypeTokens.
+        the errors are raised when the token after the EOF token is requested, so the consumer gets all tokens first.
+        """
+        # a small lookahead over the tokens to find the list types
+        return self._apply_types(LookaheadBuffer(tokens))
+
+    def _apply_types(self, tokens: list[Token] | LookaheadBuffer[Token]) -> Iterator[Token]:
+        """yields the tokens, with the IdentifierTokens that are a type and the list types replaced by TypeTokens"""
+        self._errors = []
+        index: int = 0
+        while True:
+            try:
+                token: Token = self._apply_identifier_type(tokens[index])
+            except IndexError:
+                # all tokens are processed
+                self._raise_errors()
+                return
+
             if token.token_type == TokenType.LIST:
-                # a list should have a type token between brackets
-                self.expect(tokens.iter_next(), TokenType.BRACKET_OPEN)
-                element_type: Token = self.expect(tokens.iter_next(1), TokenType.TYPE)
-                assert isinstance(element_type, TypeToken)
-                bracket_close: Token = self.expect(tokens.iter_next(2), TokenType.BRACKET_CLOSE)
+                try:
+                    type_token: TypeToken = self._list_type(tokens, index, token)
+                except AstError as e:
+                    # continue with the token after the list, the error is raised after all tokens are processed
+                    self._errors.append(e)
+                    yield token
+                    index += 1
+                else:
+                    yield type_token
+                    index += 4
+            else:
+                yield token
+                index += 1
+            # the lazy tokens before the index aren't needed anymore
+            if isinstance(tokens, LookaheadBuffer):
+                tokens.release(index)
 
-                # add (if not already existing) the list type with this element type
-                list_type: ListType = self._types.add_list_type(element_type.type_)
+    def _list_type(self, tokens: list[Token] | LookaheadBuffer[Token], index: int, token: Token) -> TypeToken:
+        """returns the TypeToken of the list type starting at the index, raises AstError if it's invalid"""
+        # a list should have a type token between brackets
+        self.expect(self._lookahead(tokens, index + 1, token), TokenType.BRACKET_OPEN)
+        element_type: Token = self._apply_identifier_type(self._lookahead(tokens, index + 2, token))
+        self.expect(element_type, TokenType.TYPE)
+        assert isinstance(element_type, TypeToken)
+        bracket_close: Token = self.expect(self._lookahead(tokens, index + 3, token), TokenType.BRACKET_CLOSE)
 
-                # construct the source_location
-                source_location: SourceLocation = token.source_location + bracket_close.source_location
+        # add (if not already existing) the list type with this element type
+        list_type: ListType = self._types.add_list_type(element_type.type_)
 
-                # added the list type to the types, construct the TypeToken
-                type_token: TypeToken = TypeToken(source_location, list_type)
+        # replace the list with type token between brackets tokens with a TypeToken
+        source_location: SourceLocation = token.source_location + bracket_close.source_location
+        return TypeToken(source_location, list_type)
 
-                # replace the list with type token between brackets tokens with a TypeToken
-                tokens.replace(4, type_token)
+    def apply_compact(self, tokens: CompactTokens) -> CompactTokens:
+        """apply the types to the compact tokens, the compact version of apply.
+        returns new compact tokens, with the identifiers that are a type and the list types replaced by types.
+        """
+        self._errors = []
+        applied: CompactTokens = tokens.copy()
+        # the type of every distinct identifier value is only looked up once
+        identifier_types: dict[int, Type | None] = {}
+        identifier_kind: int = CompactTokens.KINDS[TokenType.IDENTIFIER]
+        list_kind: int = CompactTokens.KINDS[TokenType.LIST]
 
-        return tokens
+        # replace the identifiers that are a type, in place, and find the list types
+        list_indices: list[int] = []
+        for index, kind in enumerate(tokens.kinds()):
+            if kind == identifier_kind:
+                if var_type := self._identifier_type(tokens, index, identifier_types):
+                    applied.set_type(index, var_type)
+            elif kind == list_kind:
+                list_indices.append(index)
+
+        # replace the list with type token between brackets tokens with a type, in a single pass over the tokens
+        list_types: list[tuple[int, int, Type]] = []
+        for index in list_indices:
+            try:
+                # a list should have a type token between brackets
+                self._expect_compact(applied, index, 1, TokenType.BRACKET_OPEN)
+                self._expect_compact(applied, index, 2, TokenType.TYPE)
+                self._expect_compact(applied, index, 3, TokenType.BRACKET_CLOSE)
+            except AstError as e:
+                # continue with the next list, the errors are raised after all lists are processed
+                self._errors.append(e)
+                continue
+            element_type: TokenValue | None = applied.value(index + 2)
+            assert isinstance(element_type, Type)
+            # add (if not already existing) the list type with this element type
+            list_types.append((index, 4, self._types.add_list_type(element_type)))
+        self._raise_errors()
+        applied.replace(list_types)
+        return applied
+
+    def _identifier_type(
+        self, tokens: CompactTokens, index: int, identifier_types: dict[int, Type | None]
+    ) -> Type | None:
+        """returns the type of the compact identifier token, None if the identifier isn't a type"""
+        value_index: int = tokens.value_index(index)
+        if value_index not in identifier_types:
+            value: TokenValue | None = tokens.value(index)
+            assert isinstance(value, str)
+            identifier_types[value_index] = self._types.get(value)
+        return identifier_types[value_index]
+
+    def _expect_compact(self, tokens: CompactTokens, index: int, offset: int, token_type: TokenType) -> None:
+        """expects the compact token at the index plus offset to be of token_type, raises AstError otherwise"""
+        if index + offset >= len(tokens):
+            self.ast_error("unexpected end-of-file in list type!", tokens.source_location(index))
+        if tokens.token_type(index + offset) != token_type:
+            self.expect(tokens[index + offset], token_type)
+
+    def _apply_identifier_type(self, token: Token) -> Token:
+        """returns a TypeToken if the token is an IdentifierToken that is a type, otherwise the token itself"""
+        if isinstance(token, IdentifierToken):
+            # check that the identifier corresponds with a type
+            if var_type := self._types.get(token.value):
+                return TypeToken(token.source_location, var_type)
+        return token
+
+    def _lookahead(self, tokens: list[Token] | LookaheadBuffer[Token], index: int, token: Token) -> Token:
+        """returns the token at the index, raises AstError at the end of the tokens"""
+        try:
+            return tokens[index]
+        except IndexError:
+            self.ast_error("unexpected end-of-file in list type!", token.source_location)
 
     def expect(self, token: Token, token_type: TokenType) -> Token:
         """expects the token to be of token_type, return token if match, raises AstError otherwise"""
@@ -73,6 +174,13 @@ class TypeApplier:
             self.ast_error(f"expected '{token_type}' but found {token.token_type}'!", token.source_location)
         return token
 
+    def _raise_errors(self) -> None:
+        """raises the errors found during the pass, multiple errors are raised together"""
+        if len(self._errors) == 1:
+            raise self._errors[0]
+        if self._errors:
+            raise AstErrors(self._errors)
+
     def ast_error(self, message: str, source_location: SourceLocation) -> NoReturn:
         """constructs and raises an AstError"""
         raise AstError(message, self._filename, source_location)
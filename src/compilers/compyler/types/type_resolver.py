@@ -4,33 +4,49 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from array import array
+from collections.abc import Iterator
+
+from ..tokens.compact_tokens import CompactTokens
+from ..tokens.compact_tokens import TokenValue
 from ..tokens.identifier_token import IdentifierToken
 from ..tokens.token import Token
 from ..tokens.token_type import TokenType
 from .types import Types
 from ..utils.stream import Stream
-from ..utils.stream import StreamError
 
 
 class TypeResolver:
-    def __init__(self, tokens: Stream[Token]):
-        self._tokens: Stream[Token] = tokens
+    def __init__(self, tokens: Stream[Token] | Iterator[Token] | CompactTokens):
+        self._tokens: Stream[Token] | Iterator[Token] | CompactTokens = tokens
 
     def resolve(self) -> Types:
-        """resolve all types in the provided token stream.
+        """resolve all types in the provided token stream (or lazy iterator over the tokens, or compact tokens).
         returns the builtin types and the resolved types from the tokens stream
         """
         types: Types = Types()
+        if isinstance(self._tokens, CompactTokens):
+            return self._resolve_compact(types, self._tokens)
+        tokens: Iterator[Token] = self._tokens.iter() if isinstance(self._tokens, Stream) else self._tokens
 
         # loop through the tokens to find class declarations and extract the types
-        try:
-            for token in self._tokens.iter():
-                if token.token_type == TokenType.CLASS:
-                    class_name: Token = self._tokens.iter_next()
-                    if isinstance(class_name, IdentifierToken):
-                        types.add_class_type(class_name.value)
-        except StreamError:
-            # iterating past the end of the stream, invalid code: don't care
-            pass
+        previous_token: Token | None = None
+        for token in tokens:
+            if previous_token and previous_token.token_type == TokenType.CLASS:
+                if isinstance(token, IdentifierToken):
+                    types.add_class_type(token.value)
+            previous_token = token
+
+        return types
 
+    def _resolve_compact(self, types: Types, tokens: CompactTokens) -> Types:
+        """resolve the types by scanning the token types of the compact tokens, without constructing the tokens"""
+        class_kind: int = CompactTokens.KINDS[TokenType.CLASS]
+        identifier_kind: int = CompactTokens.KINDS[TokenType.IDENTIFIER]
+        kinds: array[int] = tokens.kinds()
+        for index in range(len(kinds) - 1):
+            if kinds[index] == class_kind and kinds[index + 1] == identifier_kind:
+                value: TokenValue | None = tokens.value(index + 1)
+                assert isinstance(value, str)
+                types.add_class_type(value)
         return types
@@ -4,7 +4,6 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
-from copy import deepcopy
 from pathlib import Path
 
 from .character_type import CharacterType
@@ -13,11 +12,15 @@ from .list_type import ListType
 from .numeric_type import NumericType
 from .numeric_type_type import NumericTypeType
 from .type import Type
+from ..utils.file_cache import file_cache
 
 
 class Types:
     def __init__(self):
+        # the combined type of every pair of builtin types, indexed by type id (None when they can't be combined)
+        self._common_types: list[list[Type | None]] = []
         self._types: dict[str, Type] = self.builtin_types()
+        self._num_type_ids: int = len(self._common_types)
 
         # make sure also the list[char] exists for the file stdlib functions
         self.add_list_type(self._types["char"])
@@ -46,7 +49,8 @@ class Types:
             Type("string"),
         ]
         types: dict[str, Type] = {}
-        for type_ in types_list:
+        for type_id, type_ in enumerate(types_list):
+            type_.type_id = type_id
             for keyword in type_.all_keywords:
                 assert keyword not in types
                 types[keyword] = type_
@@ -77,8 +81,41 @@ class Types:
         assert type(f32) == NumericType
         f32.add_promotions(types["f64"])
 
+        # precompute the combined types of the builtin types
+        self._common_types = [[self._combine(left, right) for right in types_list] for left in types_list]
+
         return types
 
+    def _combine(self, left: Type, right: Type) -> Type | None:
+        """returns the type of combining the left and right type, None when they can't be used together"""
+        # TODO: we should check the size of a base type if the other side is no base type
+        # a base type (non-determined integer value) takes the type of the other numeric type
+        if isinstance(left, NumericType) and isinstance(right, NumericType):
+            if right.keyword == "base":
+                return left
+            if left.keyword == "base":
+                return right
+        # otherwise the types must match exactly
+        return left if left == right else None
+
+    def common_type(self, left: Type, right: Type) -> Type | None:
+        """returns the type of combining the left and right type, None when they can't be used together.
+        the builtin types are looked up in the precomputed table, the other types must be equal
+        """
+        if 0 <= left.type_id < len(self._common_types) and 0 <= right.type_id < len(self._common_types):
+            common_type: Type | None = self._common_types[left.type_id][right.type_id]
+            # return the provided type, which can be the reference variant of the interned type
+            if common_type is None:
+                return None
+            return left if common_type == left else right
+        return left if left == right else None
+
+    def _add_type(self, keyword: str, type_: Type) -> None:
+        """add the type to the collection, with a new type id"""
+        type_.type_id = self._num_type_ids
+        self._num_type_ids += 1
+        self._types[keyword] = type_
+
     def add(self, keyword: str) -> Type:
         """add a new type to the Types collection,
         does nothing when the type is already present in the collection,
@@ -87,8 +124,7 @@ class Types:
         # check if the type is already in the collection
         if keyword not in self._types:
             # create the Type, and add the keyword:Type to the collection
-            type_ = Type(keyword)
-            self._types[keyword] = type_
+            self._add_type(keyword, Type(keyword))
 
         # return the existing or newly created type
         return self[keyword]
@@ -101,8 +137,7 @@ class Types:
         # check if the type is already in the collection
         if keyword not in self._types:
             # create the Type, and add the keyword:Type to the collection
-            type_ = ClassType(keyword)
-            self._types[keyword] = type_
+            self._add_type(keyword, ClassType(keyword))
 
         # return the existing or newly created class type
         class_type: Type = self[keyword]
@@ -119,21 +154,20 @@ class Types:
         # check if the type is already in the collection
         if keyword not in self._types:
             # create the Type, and add the keyword:Type to the collection
-            new_list_type = ListType(inner_type)
-            self._types[keyword] = new_list_type
+            self._add_type(keyword, ListType(inner_type))
 
         # return the existing or newly created list type
         list_type: Type = self[keyword]
         assert isinstance(list_type, ListType)
         return list_type
 
+    def added_types(self) -> list[Type]:
+        """returns the types added to the collection after the builtin types, in the order they were added"""
+        return [type_ for type_ in self._types.values() if type_.type_id >= len(self._common_types)]
+
     def get(self, keyword: str) -> Type | None:
-        """returns the Type with the provided keyword, None if not present"""
-        type_: Type | None = self._types.get(keyword)
-        if type_:
-            # always return a copy, as types can be modified
-            type_ = deepcopy(type_)
-        return type_
+        """returns the (shared) Type with the provided keyword, None if not present"""
+        return self._types.get(keyword)
 
     def __getitem__(self, keyword: str) -> Type:
         keyword_type: Type | None = self.get(keyword)
@@ -163,10 +197,9 @@ class Types:
                 if type_.underlying_type != type_.keyword:
                     c_code.append(f"typedef {type_.underlying_type} {type_.keyword};\n")
 
-        # write the content to the file
+        # write the content to the file (if changed)
         types_header: Path = header_folder / "types.h"
-        with open(types_header, "w") as f:
-            f.writelines(c_code)
+        file_cache.write_text(types_header, "".join(c_code))
 
     def _generate_list_type_header(self, header_folder: Path, templates_folder: Path) -> None:
         # add the strings to be added to the types header
@@ -185,15 +218,13 @@ class Types:
         # for every list type, add the filled in template to the source lines
         for type_ in self._types.values():
             if isinstance(type_, ListType):
-                # read the lines from the template
-                with open(templates_folder / "list.h") as f:
-                    lines: list[str] = f.readlines()
+                # read the lines from the template (from memory if it's unchanged)
+                lines: list[str] = file_cache.read_text(templates_folder / "list.h").splitlines(keepends=True)
                 # replace the "TYPE" text with the actual internal type of the ListType
                 list_type: str = type_.inner_type.keyword
                 lines = [line.replace("TYPE", list_type) for line in lines]
                 c_code.extend(lines)
 
-        # write the content to the file
+        # write the content to the file (if changed)
         list_header: Path = header_folder / "list.h"
-        with open(list_header, "w") as f:
-            f.writelines(c_code)
+        file_cache.write_text(list_header, "".join(c_code))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import hashlib
+from pathlib import Path
+
+from .ast import AST
+from .ast_serializer import AstSerializer
+from .file_cache import file_cache
+
+
+class AstCache:
+    """content-addressed cache of the checked AST of the source files, stored in the build folder.
+
+    maps the hash of a source file (and of the compyler sources, which define the AST) to its serialized AST,
+    so the tokenizer, the typing passes, the AST generator and the AST checks don't run again for an unchanged
+    file, for example when only the c compiler flags changed.
+    """
+
+    CACHE_FOLDER: str = ".ast_cache"
+
+    def __init__(self, build_folder: Path, key: str):
+        self._entry: Path = build_folder / self.CACHE_FOLDER / key
+        self.key: str = key
+
+    @classmethod
+    def compute_key(cls, file: Path, compyler_folder: Path) -> str:
+        """returns the hex digest of the hash over the source file and the compyler sources"""
+        sha256 = hashlib.sha256(file_cache.read_bytes(file))
+        # any change in the compiler can change the AST, or the classes of its nodes
+        for source in sorted(compyler_folder.rglob("*.py")):
+            sha256.update(f"\0{source.relative_to(compyler_folder)}\0".encode() + file_cache.read_bytes(source))
+        return sha256.hexdigest()
+
+    def load(self, file: Path) -> AST | None:
+        """returns the cached AST of the file, None when the AST isn't cached (or can't be loaded)"""
+        try:
+            return AstSerializer().loads(self._entry.read_bytes(), file)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, ast: AST) -> None:
+        """stores the AST, to be called after the AST is checked"""
+        self._entry.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so a parallel build never reads a partially written entry
+        temporary: Path = self._entry.with_suffix(".tmp")
+        temporary.write_bytes(AstSerializer().dumps(ast))
+        temporary.replace(self._entry)
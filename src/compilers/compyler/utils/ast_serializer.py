@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from enum import Enum
+import marshal
+from pathlib import Path
+
+from .ast import AST
+from ..expressions.binary_expression import BinaryExpression
+from ..expressions.call_expression import CallExpression
+from ..expressions.expression_type import ExpressionType
+from ..expressions.identifier_expression import IdentifierExpression
+from ..expressions.string_expression import StringExpression
+from ..expressions.this_expression import ThisExpression
+from ..expressions.token_expression import TokenExpression
+from ..expressions.type_cast_expression import TypeCastExpression
+from ..expressions.unary_expression import UnaryExpression
+from .source_location import SourceLocation
+from ..statements.assignment_statement import AssignmentStatement
+from ..statements.break_statement import BreakStatement
+from ..statements.breakall_statement import BreakallStatement
+from ..statements.class_statement import ClassStatement
+from ..statements.continue_statement import ContinueStatement
+from ..statements.expression_statement import ExpressionStatement
+from ..statements.for_loop_statement import ForLoopStatement
+from ..statements.function_statement import FunctionStatement
+from ..statements.if_statement import IfStatement
+from ..statements.lifecycle_statement import LifecycleStatement
+from ..statements.lifecycle_statement_type import LifecycleStatementType
+from ..statements.list_statement import ListStatement
+from ..statements.print_statement import PrintStatement
+from ..statements.return_statement import ReturnStatement
+from ..statements.var_decl_statement import VarDeclStatement
+from ..tokens.character_token import CharacterToken
+from ..tokens.comment_token import CommentToken
+from ..tokens.identifier_token import IdentifierToken
+from ..tokens.number_token import NumberToken
+from ..tokens.string_chars_token import StringCharsToken
+from ..tokens.token import Token
+from ..tokens.token_type import TokenType
+from ..tokens.type_token import TypeToken
+from ..types.class_type import ClassType
+from ..types.list_type import ListType
+from ..types.type import Type
+from ..types.types import Types
+
+# the values in the serialized AST, nodes are tuples of their tag and the values of their slots
+SerializedValue = None | bool | int | str | list["SerializedValue"] | tuple["SerializedValue", ...]
+
+
+class AstSerializer:
+    """compact binary serialization of a (checked) AST, based on marshal.
+
+    the AST is converted to nested tuples and lists of plain values, no object graphs are pickled.
+    a node is stored as a tuple of the tag of its class and the values of its slots,
+    a type is stored by its keyword (the types added to the Types collection are stored once, up front).
+    loading only constructs the nodes again, without running any of the phases of the compiler.
+    """
+
+    # the version of the format, stored in the data to not load data of another version of the format
+    VERSION: int = 1
+
+    # the classes of the nodes in the AST, the tag of a node is the index of its class in this list
+    NODE_CLASSES: list[type] = [
+        # statements
+        AssignmentStatement,
+        BreakStatement,
+        BreakallStatement,
+        ClassStatement,
+        ContinueStatement,
+        ExpressionStatement,
+        ForLoopStatement,
+        FunctionStatement,
+        IfStatement,
+        LifecycleStatement,
+        ListStatement,
+        PrintStatement,
+        ReturnStatement,
+        VarDeclStatement,
+        # expressions
+        BinaryExpression,
+        CallExpression,
+        IdentifierExpression,
+        StringExpression,
+        ThisExpression,
+        TokenExpression,
+        TypeCastExpression,
+        UnaryExpression,
+        # tokens
+        CharacterToken,
+        CommentToken,
+        IdentifierToken,
+        NumberToken,
+        StringCharsToken,
+        Token,
+        TypeToken,
+    ]
+    NODE_TAGS: dict[type, int] = {node_class: tag for tag, node_class in enumerate(NODE_CLASSES)}
+    # the enums in the AST, stored by the index of their class and the name of the member
+    ENUM_CLASSES: list[type[Enum]] = [ExpressionType, LifecycleStatementType, TokenType]
+    ENUM_TAGS: dict[type[Enum], int] = {enum_class: tag for tag, enum_class in enumerate(ENUM_CLASSES)}
+
+    # the tags of the other values, negative to not overlap with the node tags
+    TUPLE: int = -1
+    SOURCE_LOCATION: int = -2
+    TYPE: int = -3
+    ENUM: int = -4
+
+    def __init__(self):
+        # the slots of the node classes, including the slots of their base classes, by tag
+        self._slots: list[tuple[str, ...]] = [self._class_slots(node_class) for node_class in self.NODE_CLASSES]
+        # the types of the AST that is loaded
+        self._types: Types = Types()
+
+    @staticmethod
+    def _class_slots(node_class: type) -> tuple[str, ...]:
+        """returns the slots of the class and its base classes, the slots of the base classes first"""
+        slots: list[str] = []
+        for cls in reversed(node_class.__mro__):
+            slots.extend(cls.__dict__.get("__slots__", ()))
+        return tuple(slots)
+
+    def dumps(self, ast: AST) -> bytes:
+        """returns the serialized AST"""
+        # the types are stored in the order they were added, so they get the same type ids when they're loaded
+        types: list[tuple[str, str]] = []
+        for type_ in ast.types.added_types():
+            if isinstance(type_, ListType):
+                types.append(("list", type_.inner_type.keyword))
+            elif isinstance(type_, ClassType):
+                types.append(("class", type_.keyword))
+            else:
+                assert type(type_) == Type, f"internal compiler error, can't serialize type '{type(type_)}'!"
+                types.append(("type", type_.keyword))
+        statements: list[SerializedValue] = [self._encode(statement) for statement in ast.statements.objects]
+        return marshal.dumps((self.VERSION, types, statements))
+
+    def _encode(self, value: object) -> SerializedValue:
+        """returns the value, converted to plain values that can be marshalled"""
+        match value:
+            case None | bool() | int() | str():
+                return value
+            case list():
+                return [self._encode(item) for item in value]
+            case tuple():
+                return (self.TUPLE, *(self._encode(item) for item in value))
+            case SourceLocation():
+                return (self.SOURCE_LOCATION, value.start, value.length)
+            case Type():
+                return (self.TYPE, value.keyword, value.is_reference)
+            case Enum():
+                return (self.ENUM, self.ENUM_TAGS[type(value)], value.name)
+            case _:
+                tag: int | None = self.NODE_TAGS.get(type(value))
+                assert tag is not None, f"internal compiler error, can't serialize '{type(value)}'!"
+                return (tag, *(self._encode(getattr(value, slot)) for slot in self._slots[tag]))
+
+    def loads(self, data: bytes, filename: Path) -> AST:
+        """returns the AST of the serialized data, raises ValueError when the data isn't a serialized AST"""
+        try:
+            version, types, statements = marshal.loads(data)
+        except (EOFError, TypeError, ValueError) as e:
+            raise ValueError(f"invalid serialized AST: {e}")
+        if version != self.VERSION:
+            raise ValueError(f"serialized AST of version {version}, expected version {self.VERSION}")
+
+        # add the types in the same order as they were added to the types of the serialized AST
+        self._types = Types()
+        for kind, keyword in types:
+            match kind:
+                case "list":
+                    self._types.add_list_type(self._types[keyword])
+                case "class":
+                    self._types.add_class_type(keyword)
+                case _:
+                    self._types.add(keyword)
+
+        ast: AST = AST(filename, self._types)
+        ast.append(*(self._decode(statement) for statement in statements))
+        return ast
+
+    def _decode(self, value: SerializedValue) -> object:
+        """returns the value of the plain (marshalled) value, the nodes are constructed again"""
+        if type(value) is list:
+            return [self._decode(item) for item in value]
+        if type(value) is not tuple:
+            return value
+        tag: SerializedValue = value[0]
+        assert isinstance(tag, int)
+        if tag >= 0:
+            # construct the node without calling its constructor, then set its slots
+            node_class: type = self.NODE_CLASSES[tag]
+            node: object = node_class.__new__(node_class)
+            for slot, item in zip(self._slots[tag], value[1:]):
+                setattr(node, slot, self._decode(item))
+            return node
+        match tag:
+            case self.TUPLE:
+                return tuple(self._decode(item) for item in value[1:])
+            case self.SOURCE_LOCATION:
+                start, length = value[1:]
+                assert isinstance(start, int) and isinstance(length, int)
+                return SourceLocation(start, length)
+            case self.TYPE:
+                keyword, is_reference = value[1:]
+                assert isinstance(keyword, str)
+                return self._type(keyword, bool(is_reference))
+            case self.ENUM:
+                enum_tag, name = value[1:]
+                assert isinstance(enum_tag, int) and isinstance(name, str)
+                return self.ENUM_CLASSES[enum_tag][name]
+            case _:
+                raise ValueError(f"invalid serialized AST, unknown tag {tag}")
+
+    def _type(self, keyword: str, is_reference: bool) -> Type:
+        """returns the (shared) type with the keyword, or its reference variant"""
+        type_: Type | None = self._types.get(keyword)
+        if type_ is None:
+            # the only type that isn't in the types is the unknown type
+            if keyword != Type.unknown().keyword:
+                raise ValueError(f"invalid serialized AST, unknown type '{keyword}'")
+            type_ = Type.unknown()
+        return type_.as_reference() if is_reference else type_
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import hashlib
+from pathlib import Path
+
+from .file_cache import file_cache
+
+
+class BuildCache:
+    """cache of the last successful build in a build folder.
+
+    the build is keyed on a content hash of everything that influences the executable:
+    the source file, the compyler sources, the templates, the stdlib headers, the c compiler flags
+    and the options of the compyler that change the generated files.
+    when the key of the last successful build matches, the whole compilation can be skipped.
+    """
+
+    KEY_FILE: str = "build_cache.key"
+
+    def __init__(self, build_folder: Path, key: str):
+        self._key_file: Path = build_folder / self.KEY_FILE
+        self.key: str = key
+
+    @classmethod
+    def compute_key(
+        cls,
+        file: Path,
+        compyler_folder: Path,
+        templates_folder: Path,
+        stdlib_folder: Path,
+        flags: list[str],
+        options: list[str] | None = None,
+    ) -> str:
+        """returns the hex digest of the hash over all inputs of a build"""
+        sha256 = hashlib.sha256()
+
+        # hash the source file itself
+        sha256.update(cls._file_entry(file.resolve()))
+
+        # hash the compyler sources, any change in the compiler invalidates the cache
+        for source in sorted(compyler_folder.rglob("*.py")):
+            sha256.update(cls._file_entry(source, compyler_folder))
+
+        # hash the templates and the stdlib headers that end up in the build folder
+        for header in sorted(templates_folder.glob("*.h")):
+            sha256.update(cls._file_entry(header, templates_folder))
+        for header in sorted(stdlib_folder.glob("*.h")):
+            sha256.update(cls._file_entry(header, stdlib_folder))
+
+        # hash the c compiler flags, separated by a character that can't be in a flag
+        sha256.update("\0".join(flags).encode())
+
+        # hash the compyler options, after a separator so they can't be confused with the flags
+        sha256.update(b"\0\0" + "\0".join(options or []).encode())
+
+        return sha256.hexdigest()
+
+    @classmethod
+    def _file_entry(cls, file: Path, relative_to: Path | None = None) -> bytes:
+        """returns the bytes to hash for a file: its (relative) name and content"""
+        # include the name of the file, so renaming a file also changes the key
+        name: Path = file.relative_to(relative_to) if relative_to else file
+        return f"{name}\0".encode() + file_cache.read_bytes(file) + b"\0"
+
+    def is_up_to_date(self, executable: Path) -> bool:
+        """returns whether the executable is built from the inputs matching the key"""
+        if not executable.is_file() or not self._key_file.is_file():
+            return False
+        return self._key_file.read_text() == self.key
+
+    def invalidate(self) -> None:
+        """removes the stored key, the build folder is about to be overwritten"""
+        self._key_file.unlink(missing_ok=True)
+
+    def store(self) -> None:
+        """stores the key, to be called after a successful build"""
+        self._key_file.write_text(self.key)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+
+class CEmitter:
+    """emits c-code lines indented on the nesting of the braces in the code.
+
+    the c_code() of the statements places every (nested) statement on its own line,
+    this class indents these lines, so the generated c-code is readable without running clang-format.
+    """
+
+    INDENT: str = " " * 4
+
+    def __init__(self, indent_level: int = 0):
+        self._indent_level: int = indent_level
+        self._lines: list[str] = []
+
+    def emit(self, code: str) -> "CEmitter":
+        """add the (possibly multi-line) code, indenting every line to its nesting level"""
+        for line in code.split("\n"):
+            line = line.strip()
+            # don't indent empty lines and preprocessor directives
+            if not line or line.startswith("#"):
+                self._lines.append(f"{line}\n")
+                continue
+
+            # lines starting with a closing brace belong to the outer nesting level
+            opening, closing = self._count_braces(line)
+            leading_closing: int = len(line) - len(line.lstrip("}"))
+            indent_level: int = max(self._indent_level - leading_closing, 0)
+            self._lines.append(f"{self.INDENT * indent_level}{line}\n")
+
+            # update the nesting level for the next lines
+            self._indent_level = max(self._indent_level + opening - closing, 0)
+        return self
+
+    @property
+    def lines(self) -> list[str]:
+        """returns the emitted lines, including line terminators"""
+        return self._lines
+
+    def _count_braces(self, line: str) -> tuple[int, int]:
+        """returns the number of opening and closing braces, outside of literals and comments"""
+        opening: int = 0
+        closing: int = 0
+        quote: str | None = None
+        index: int = 0
+        while index < len(line):
+            char: str = line[index]
+            if quote:
+                # inside a string or character literal, skip escaped characters and look for the closing quote
+                if char == "\\":
+                    index += 1
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif line.startswith("//", index):
+                # the rest of the line is a comment
+                break
+            elif char == "{":
+                opening += 1
+            elif char == "}":
+                closing += 1
+            index += 1
+        return opening, closing
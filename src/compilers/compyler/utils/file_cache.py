@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from os import stat_result
+from pathlib import Path
+
+
+class FileCache:
+    """in-memory cache of the files read and written by the compiler.
+
+    files are read again only when their modification time or size changed, and files are only written
+    when their content differs from the content on disk. this mostly pays off in watch mode,
+    where the stdlib headers, templates and unchanged generated files are reused between builds.
+    """
+
+    def __init__(self):
+        # the content of the files, together with the modification time and size of the file when it was read/written
+        self._files: dict[Path, tuple[int, int, bytes]] = {}
+
+    @staticmethod
+    def _stat_key(stat: stat_result) -> tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def _cached(self, path: Path) -> bytes | None:
+        """returns the cached content of the file, if the file didn't change since it was cached"""
+        if path not in self._files:
+            return None
+        try:
+            stat: stat_result = path.stat()
+        except FileNotFoundError:
+            return None
+        mtime, size, content = self._files[path]
+        return content if (mtime, size) == self._stat_key(stat) else None
+
+    def read_bytes(self, path: Path) -> bytes:
+        """returns the content of the file, from memory if it didn't change"""
+        content: bytes | None = self._cached(path)
+        if content is None:
+            content = path.read_bytes()
+            self._files[path] = (*self._stat_key(path.stat()), content)
+        return content
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode()
+
+    def write_bytes(self, path: Path, content: bytes) -> bool:
+        """writes the content to the file if it's different from the content of the file, returns if it's written"""
+        if self._cached(path) == content:
+            return False
+        path.write_bytes(content)
+        self._files[path] = (*self._stat_key(path.stat()), content)
+        return True
+
+    def write_text(self, path: Path, content: str) -> bool:
+        return self.write_bytes(path, content.encode())
+
+
+# the file cache of the compiler, shared by all phases
+file_cache: FileCache = FileCache()
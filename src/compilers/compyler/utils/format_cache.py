@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import hashlib
+from pathlib import Path
+
+
+class FormatCache:
+    """content-addressed cache of clang-format results, stored in the build folder.
+
+    maps the hash of the (unformatted) content of a file to its formatted content,
+    so files that are regenerated or copied with the same content don't need to be formatted again.
+    """
+
+    CACHE_FOLDER: str = ".format_cache"
+
+    def __init__(self, build_folder: Path, style_file: Path):
+        self._folder: Path = build_folder / self.CACHE_FOLDER
+        self._folder.mkdir(parents=True, exist_ok=True)
+        # the style is part of the key, changing the style invalidates the cached results
+        self._style: bytes = style_file.read_bytes() if style_file.is_file() else b""
+
+    def _entry(self, content: bytes) -> Path:
+        """returns the path of the cache entry of the content, entries have no extension to not be formatted"""
+        return self._folder / hashlib.sha256(self._style + b"\0" + content).hexdigest()
+
+    def lookup(self, content: bytes) -> bytes | None:
+        """returns the formatted content when the content has been formatted before, None otherwise"""
+        entry: Path = self._entry(content)
+        if entry.is_file():
+            return entry.read_bytes()
+        return None
+
+    def store(self, content: bytes, formatted: bytes) -> None:
+        """stores the formatted content of the content"""
+        self._entry(content).write_bytes(formatted)
+        # formatting is idempotent, so an already formatted file also doesn't need to be formatted again
+        self._entry(formatted).write_bytes(formatted)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+import subprocess
+import time
+
+from .logger import logger
+
+
+@dataclass
+class JobResult:
+    """the result of a finished job: the command, its exit code, its duration [s] and its captured stdout/stderr"""
+
+    command: list[str]
+    returncode: int
+    duration: float
+    output: str | None
+    errors: str | None
+
+    def __str__(self) -> str:
+        return " ".join(self.command)
+
+
+class JobRunner:
+    """runs external commands (without a shell) on a thread pool, so independent jobs can run concurrently.
+
+    the threads only wait for the processes, so the jobs run in parallel despite the GIL.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results: list[JobResult] = []
+
+    def __enter__(self) -> "JobRunner":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._executor.shutdown()
+
+    def submit(self, command: list[str], capture: bool = True, stdin: Path | None = None) -> Future[JobResult]:
+        """start the command in the background, its stdout and stderr are captured unless disabled"""
+        logger.info(" ".join(command))
+        return self._executor.submit(self._run, command, capture, stdin)
+
+    def run(self, command: list[str], capture: bool = True, stdin: Path | None = None) -> JobResult:
+        """run the command and wait for it to finish"""
+        return self.submit(command, capture, stdin).result()
+
+    def _run(self, command: list[str], capture: bool, stdin: Path | None) -> JobResult:
+        start: float = time.perf_counter()
+        try:
+            # captured jobs aren't interactive, only uncaptured jobs (the executable) inherit the stdin of the compiler
+            default_input: int | None = subprocess.DEVNULL if capture else None
+            with open(stdin, "rb") if stdin else nullcontext(default_input) as input_file:
+                process: subprocess.CompletedProcess = subprocess.run(
+                    command,
+                    stdin=input_file,
+                    stdout=subprocess.PIPE if capture else None,
+                    stderr=subprocess.PIPE if capture else None,
+                    text=capture,
+                    errors="replace" if capture else None,
+                )
+            returncode, output, errors = process.returncode, process.stdout, process.stderr
+        except OSError as e:
+            # e.g. the executable or the stdin file doesn't exist, report it like a failed command
+            returncode, output, errors = 127, None, str(e)
+
+        result: JobResult = JobResult(command, returncode, time.perf_counter() - start, output, errors)
+        self.results.append(result)
+        return result
+
+    def report(self) -> None:
+        """log the exit code and duration of all finished jobs"""
+        for result in self.results:
+            logger.debug(f"[{result.returncode:>3}] {result.duration * 1000:>10.2f} ms  {result}")
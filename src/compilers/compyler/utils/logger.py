@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from contextlib import contextmanager
+import logging
+import sys
+from typing import Generator
+
+
+# custom log level below DEBUG, for dumps of the internal compiler state (tokens, scopes)
+TRACE: int = 5
+logging.addLevelName(TRACE, "TRACE")
+
+# the logger of the compiler, the messages are only constructed when the level is enabled
+logger: logging.Logger = logging.getLogger("compyler")
+
+
+def configure_logging(verbosity: int) -> None:
+    """configure the compiler logger from the verbosity:
+
+    -1: quiet, only warnings and errors
+     0: default, progress of the compiler
+     1: verbose, also the generated statements
+     2: very verbose, also the tokens and scopes
+    """
+    levels: dict[int, int] = {-1: logging.WARNING, 0: logging.INFO, 1: logging.DEBUG, 2: TRACE}
+    level: int = levels[max(-1, min(verbosity, 2))]
+
+    # print the bare messages to stdout, like the rest of the compiler output
+    handler: logging.StreamHandler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.handlers = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+@contextmanager
+def logging_disabled() -> Generator[None]:
+    """disables the compiler logger within the 'with' statement, e.g. when the same errors will be logged again"""
+    disabled: bool = logger.disabled
+    logger.disabled = True
+    try:
+        yield
+    finally:
+        logger.disabled = disabled
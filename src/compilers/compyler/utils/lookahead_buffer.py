@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from collections import deque
+from collections.abc import Iterator
+
+
+class LookaheadBuffer[T]:
+    """buffers the objects of a (lazy) iterator, so they can be indexed like a list.
+
+    objects are only taken from the iterator when they are indexed,
+    and objects before the released index are removed from the buffer.
+    this keeps the memory usage bounded to the lookahead (and history) of the consumer.
+    """
+
+    def __init__(self, iterator: Iterator[T]):
+        self._iterator: Iterator[T] = iterator
+        self._buffer: deque[T] = deque()
+        # the index of the first object in the buffer
+        self._start: int = 0
+        self._exhausted: bool = False
+
+    def __getitem__(self, index: int) -> T:
+        """returns the object at the index, raises an IndexError past the end or for released objects"""
+        if index < self._start:
+            raise IndexError(f"object {index} is already released!")
+        # take objects from the iterator until the object at the index is buffered
+        while index - self._start >= len(self._buffer):
+            if self._exhausted:
+                raise IndexError(f"object {index} is past the end of the iterator!")
+            try:
+                self._buffer.append(next(self._iterator))
+            except StopIteration:
+                self._exhausted = True
+        return self._buffer[index - self._start]
+
+    def release(self, index: int) -> None:
+        """removes the objects before the index from the buffer"""
+        while self._start < index and self._buffer:
+            self._buffer.popleft()
+            self._start += 1
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import mmap
+from pathlib import Path
+import re
+
+
+class MappedSource:
+    """read-only, memory mapped view of a source file.
+
+    the file isn't read or decoded up front, the operating system pages it in when it's scanned.
+    indexing returns the byte at the index as a character, and offsets are byte offsets into the file
+    (the same as the character offsets for ascii sources). only the lexemes that are kept are decoded.
+    """
+
+    # the bytes that make the byte offsets differ from the character offsets of the text (read in text mode)
+    NON_ASCII_OR_CR: re.Pattern[bytes] = re.compile(rb"[\r\x80-\xff]")
+
+    def __init__(self, file: Path):
+        with open(file, "rb") as f:
+            # an empty file can't be memory mapped
+            self._mmap: mmap.mmap | None = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if f.read(1) else None
+        self._view: memoryview = memoryview(self._mmap if self._mmap else b"")
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self._view[index])
+
+    def byte(self, index: int) -> int:
+        return self._view[index]
+
+    def slice(self, start: int, end: int) -> memoryview:
+        """returns the bytes between start and end, without copying them"""
+        return self._view[start:end]
+
+    def decode(self, start: int, end: int) -> str:
+        """decodes the bytes between start and end"""
+        return str(self._view[start:end], "utf-8", "replace")
+
+    def match_end(self, pattern: re.Pattern[bytes], start: int) -> int:
+        """returns the end of the match of the (always matching) pattern at start"""
+        pattern_match: re.Match[bytes] | None = pattern.match(self._view, start)
+        assert pattern_match, "internal compiler error, the pattern must always match!"
+        return pattern_match.end()
+
+    def find(self, sub: bytes, start: int) -> int:
+        """returns the offset of sub after start, or -1 if not found"""
+        return self._mmap.find(sub, start) if self._mmap else -1
+
+    def is_ascii_lf(self) -> bool:
+        """returns whether the file is ascii with '\n' line endings, so the byte offsets are the character offsets"""
+        return self.NON_ASCII_OR_CR.search(self._view) is None
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap:
+            self._mmap.close()
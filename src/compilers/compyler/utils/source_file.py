@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from array import array
+from bisect import bisect_right
+from os import stat_result
+from pathlib import Path
+
+
+class SourceFile:
+    """the text of a source file, with an index of the offsets where the lines start.
+
+    the line of an offset is looked up with a binary search in the line starts (O(log n)),
+    instead of counting the newlines in the file for every lookup.
+    """
+
+    def __init__(self, path: Path, text: str):
+        self.path: Path = path
+        self.text: str = text
+        # the line starts are only needed for diagnostics, they're created on the first lookup
+        self._line_starts: array[int] | None = None
+
+    @property
+    def line_starts(self) -> array[int]:
+        """returns the offsets of the start of every line"""
+        if self._line_starts is None:
+            line_starts: array[int] = array("Q", [0])
+            index: int = self.text.find("\n")
+            while index != -1:
+                line_starts.append(index + 1)
+                index = self.text.find("\n", index + 1)
+            self._line_starts = line_starts
+        return self._line_starts
+
+    @property
+    def num_lines(self) -> int:
+        """returns the number of lines, a newline at the end of the file doesn't start a new line"""
+        if not self.text or self.text.endswith("\n"):
+            return len(self.line_starts) - 1
+        return len(self.line_starts)
+
+    def line_number(self, offset: int) -> int:
+        """returns the (1-based) line number of the offset, -1 when the offset is outside of the file"""
+        if offset < 0 or offset > len(self.text):
+            return -1
+        return bisect_right(self.line_starts, offset)
+
+    def column(self, offset: int) -> int:
+        """returns the (1-based) column of the offset, -1 when the offset is outside of the file"""
+        line: int = self.line_number(offset)
+        if line == -1:
+            return -1
+        return offset - self.line_starts[line - 1] + 1
+
+    def line(self, line: int) -> str | None:
+        """returns the line (without newline), None when the line doesn't exist"""
+        if line < 1 or line > self.num_lines:
+            return None
+        line_starts: array[int] = self.line_starts
+        end: int = line_starts[line] - 1 if line < len(line_starts) else len(self.text)
+        return self.text[line_starts[line - 1] : end]
+
+
+class SourceFiles:
+    """the source files of the compiler, shared by the tokenizer and the diagnostics of all phases.
+
+    a file is read again only when its modification time or size changed (like the file cache).
+    """
+
+    def __init__(self):
+        self._files: dict[Path, tuple[int, int, SourceFile]] = {}
+
+    def get(self, path: Path) -> SourceFile:
+        """returns the source file, the file is read (in text mode) when it isn't cached or when it changed"""
+        stat: stat_result = path.stat()
+        cached: tuple[int, int, SourceFile] | None = self._files.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with open(path) as f:
+            source_file: SourceFile = SourceFile(path, f.read())
+        self._files[path] = (stat.st_mtime_ns, stat.st_size, source_file)
+        return source_file
+
+
+# the source files of the compiler, shared by all phases
+source_files: SourceFiles = SourceFiles()
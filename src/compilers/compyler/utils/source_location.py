@@ -4,19 +4,19 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
+from dataclasses import dataclass
 
+
+@dataclass(frozen=True, slots=True)
 class SourceLocation:
-    def __init__(self, start: int, length: int):
-        self.start: int = start
-        self.length: int = length
+    """the location of a token, expression or statement in the source file: start offset and length.
 
-    def __eq__(self, other: object) -> bool:
-        # it must be the same type of object
-        if type(other) != SourceLocation:
-            return False
+    source locations are immutable, so they can be shared between the tokens and the AST nodes.
+    two source locations are equal when they have the same start and length.
+    """
 
-        # of the start and length is the same, it's the same SourceLocation
-        return self.start == other.start and self.length == other.length
+    start: int
+    length: int
 
     def __add__(self, other: "SourceLocation") -> "SourceLocation":
         """add another SourceLocation, returns a new SourceLocation with the greedy sum of both"""
@@ -17,20 +17,41 @@ class Stream[T]:
     the object after the last returned iterator object can be requested.
     objects in the iterator can be replaced with other objects.
     while the iterator is running, objects can be added or replaced.
+
+    the objects are stored in a gap buffer: a list with a gap of unused entries at the position of the last
+    replacement. the gap moves along with the iterator, so a replacement only moves the objects between
+    the previous and the current replacement, instead of all objects after it (O(1) amortized during a pass).
     """
 
     def __init__(self):
-        self.objects: list[T] = []
+        self._buffer: list[T] = []
+        # the gap in the buffer, the entries in the gap are unused (stale references)
+        self._gap_start: int = 0
+        self._gap_end: int = 0
         self._index: int = 0
 
+    @property
+    def objects(self) -> list[T]:
+        """the objects in the stream, as a list that can be used (and modified) directly.
+        the gap is closed first, the list is only valid until the next replacement of multiple objects
+        """
+        self._close_gap()
+        return self._buffer
+
+    @objects.setter
+    def objects(self, objects: list[T]) -> None:
+        self._buffer = objects
+        self._gap_start = self._gap_end = 0
+
     def add(self, *objs: T) -> "Stream[T]":
         """extend the stream with the objects provided"""
-        self.objects.extend(objs)
+        # the objects after the gap are at the end of the buffer, so the objects can be appended to the buffer
+        self._buffer.extend(objs)
         return self
 
     def last(self) -> T | None:
-        if self.objects:
-            return self.objects[-1]
+        if len(self):
+            return self._get(len(self) - 1)
         return None
 
     def iter(self) -> Iterator[T]:
@@ -39,9 +60,9 @@ class Stream[T]:
         note that the internal state of the iterators from this function are shared!
         """
         self._index = 0
-        while self._index < len(self.objects):
+        while self._index < len(self):
             self._index += 1
-            yield self.objects[self._index - 1]
+            yield self._get(self._index - 1)
 
     def iter_next(self, offset: int = 0) -> T:
         """returns the object with offset after the last object returned by the iterator,
@@ -49,8 +70,8 @@ class Stream[T]:
         raises a StreamError if there is no next object
         """
         position: int = self._index + offset
-        if position < len(self.objects):
-            return self.objects[position]
+        if position < len(self):
+            return self._get(position)
         raise StreamError("outside of stream's objects!")
 
     def replace(self, count: int, replacement: T) -> None:
@@ -64,24 +85,60 @@ class Stream[T]:
         # sanity check the instance's index
         if self._index == 0:
             raise StreamError("invalid state of the iterator!")
-        if self._index > len(self.objects) + 1:
+        if self._index > len(self) + 1:
             raise StreamError("iterator is outside of stream's objects!")
 
         # speed up the edge case where count is 1, replace the object
         if count == 1:
-            self.objects[self._index - 1] = replacement
+            self._buffer[self._physical_index(self._index - 1)] = replacement
             return
 
-        # other cases, delete count objects (when nonzero count)
-        if count != 0:
-            # check that we can delete count objects
-            if self._index + count - 1 > len(self.objects):
-                raise StreamError("can't replace this many objects")
-            # success, delete the objects
-            del self.objects[self._index - 1 : self._index - 1 + count]
-        # and add replacement
-        self.objects.insert(self._index - 1, replacement)
+        # other cases, check that we can delete count objects (when nonzero count)
+        if count != 0 and self._index + count - 1 > len(self):
+            raise StreamError("can't replace this many objects")
+        # move the gap to the replaced objects, delete them by adding them to the gap
+        self._move_gap(self._index - 1)
+        self._gap_end += count
+        # and add replacement at the start of the gap
+        if self._gap_start == self._gap_end:
+            self._grow_gap(replacement)
+        self._buffer[self._gap_start] = replacement
+        self._gap_start += 1
+
+    def _physical_index(self, position: int) -> int:
+        """returns the index in the buffer of the object at the position in the stream"""
+        return position if position < self._gap_start else position + self._gap_end - self._gap_start
+
+    def _get(self, position: int) -> T:
+        return self._buffer[self._physical_index(position)]
+
+    def _move_gap(self, position: int) -> None:
+        """move the gap to the position in the stream, moves the objects between the gap and the position"""
+        gap_size: int = self._gap_end - self._gap_start
+        if gap_size == 0:
+            self._gap_start = self._gap_end = position
+        elif position < self._gap_start:
+            # move the objects before the gap to after the gap
+            self._buffer[position + gap_size : self._gap_end] = self._buffer[position : self._gap_start]
+            self._gap_start, self._gap_end = position, position + gap_size
+        elif position > self._gap_start:
+            # move the objects after the gap to before the gap
+            moved: int = position - self._gap_start
+            self._buffer[self._gap_start : position] = self._buffer[self._gap_end : self._gap_end + moved]
+            self._gap_start, self._gap_end = position, self._gap_end + moved
+
+    def _grow_gap(self, filler: T) -> None:
+        """grow the (empty) gap relative to the size of the buffer, so growing is O(1) amortized"""
+        size: int = max(16, len(self._buffer) // 8)
+        self._buffer[self._gap_start : self._gap_start] = [filler] * size
+        self._gap_end += size
+
+    def _close_gap(self) -> None:
+        """remove the gap from the buffer, so the buffer only contains the objects of the stream"""
+        if self._gap_end != self._gap_start:
+            del self._buffer[self._gap_start : self._gap_end]
+        self._gap_start = self._gap_end = 0
 
     def __len__(self) -> int:
         """returns the length of the objects currently in the stream"""
-        return len(self.objects)
+        return len(self._buffer) - (self._gap_end - self._gap_start)
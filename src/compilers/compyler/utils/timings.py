@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from contextlib import contextmanager
+import time
+import tracemalloc
+from typing import Generator
+
+
+class Timings:
+    """collects the wall time, cpu time and peak (python) memory usage of the phases of the compiler"""
+
+    def __init__(self, enabled: bool):
+        self._enabled: bool = enabled
+        # the measurements of the phases: name, wall time [s], cpu time [s], peak memory [bytes]
+        self._phases: list[tuple[str, float, float, int]] = []
+        # memory tracing slows down the compiler, so only start it when the timings are requested
+        if self._enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """measure the content of the 'with' statement as a phase with the provided name"""
+        if not self._enabled:
+            yield
+            return
+
+        # only measure the peak memory usage during this phase
+        tracemalloc.reset_peak()
+        wall_start: float = time.perf_counter()
+        cpu_start: float = time.process_time()
+        try:
+            yield
+        finally:
+            wall: float = time.perf_counter() - wall_start
+            cpu: float = time.process_time() - cpu_start
+            _, peak = tracemalloc.get_traced_memory()
+            self._phases.append((name, wall, cpu, peak))
+
+    def report(self) -> None:
+        """print a table with the measurements of all phases"""
+        if not self._enabled:
+            return
+
+        name_width: int = max([len(name) for name, *_ in self._phases] + [len("total")])
+        print(f"{'phase':<{name_width}} {'wall [ms]':>10} {'cpu [ms]':>10} {'peak [KiB]':>11}")
+        for name, wall, cpu, peak in self._phases:
+            print(f"{name:<{name_width}} {wall * 1000:>10.2f} {cpu * 1000:>10.2f} {peak / 1024:>11.1f}")
+
+        # add the total of all phases, where the peak memory is the maximum of all phases
+        total_wall: float = sum(wall for _, wall, _, _ in self._phases)
+        total_cpu: float = sum(cpu for _, _, cpu, _ in self._phases)
+        max_peak: int = max((peak for *_, peak in self._phases), default=0)
+        print(f"{'total':<{name_width}} {total_wall * 1000:>10.2f} {total_cpu * 1000:>10.2f} {max_peak / 1024:>11.1f}")
@@ -4,12 +4,8 @@
 #
 # This file is part of compyler, a TAPL compiler.
 
-from pathlib import Path
-
-from .colors import Colors
 from ..expressions.expression import Expression
 from ..expressions.identifier_expression import IdentifierExpression
-from .source_location import SourceLocation
 from ..types.character_type import CharacterType
 from ..types.numeric_type import NumericType
 from ..types.numeric_type_type import NumericTypeType
@@ -19,42 +15,6 @@ from ..types.type import Type
 class Utils:
     """Utility class with several class methods"""
 
-    @classmethod
-    def get_source_line_number(cls, filename: Path, source_location: SourceLocation | None) -> int:
-        # initial check if a valid SourceLocation is passed
-        if not source_location:
-            return -1
-
-        # read the entire file info a string
-        with open(filename) as f:
-            content: str = f.read()
-
-        # sanity check that the SourceLocation start is within the file
-        if source_location.start > len(content):
-            return -1
-
-        # return the number of newlines until the SourceLocation start
-        location_start: int = source_location.start
-        return content[:location_start].count("\n") + 1
-
-    @classmethod
-    def get_source_line(cls, filename: Path, line: int):
-        no_source: str = f"<no source code line available>"
-        # initial check if a valid line is passed
-        if line < 0:
-            return no_source
-
-        # read the file into lines
-        with open(filename) as f:
-            lines: list[str] = f.readlines()
-
-        # check if the line number exists in the file, return the correct line or error
-        if line <= len(lines):
-            return lines[line - 1].removesuffix("\n")
-        else:
-            error = f"[ internal compiler error! (line {line} not found in source) ]"
-            return f"{Colors.BOLD}{Colors.RED}{error}{Colors.RESET} {no_source}"
-
     @classmethod
     def get_expression_type(cls, expression: Expression) -> Type:
         # checks if the type has an inner type, then return the inner type
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.ast_checks.ast_check import AstCheck
+from compyler.ast_checks.check_pass import CheckPass
+from compyler.ast_generator import AstGenerator
+from compyler.errors.ast_error import AstError
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+from compyler.types.type_applier import TypeApplier
+from compyler.types.type_resolver import TypeResolver
+from compyler.types.types import Types
+from compyler.utils.ast import AST
+from compyler.utils.stream import Stream
+
+
+class TestAstCheck(unittest.TestCase):
+    def _generate_ast(self, file: Path) -> AST:
+        tokens: Stream[Token] = Tokenizer(file).tokenize()
+        types: Types = TypeResolver(tokens).resolve()
+        TypeApplier(file, types).apply(tokens)
+        return AstGenerator(file, tokens, types).generate()
+
+    def _check(self, file: Path, separate_passes: bool) -> tuple[list[str] | None, str]:
+        """returns the code of the checked statements of the file (None when the file has errors) and the output"""
+        output: io.StringIO = io.StringIO()
+        try:
+            with redirect_stdout(output):
+                ast: AST = self._generate_ast(file)
+                AstCheck(ast, separate_passes).run()
+        except (AstError, SystemExit):
+            return None, output.getvalue()
+        return [statement.c_code() for statement in ast.statements.objects], output.getvalue()
+
+    def test_separate_passes(self):
+        # the single walk should accept the same files, give the same types and report the same errors,
+        # as the separate passes
+        repo_root: Path = Path(__file__).parents[4].resolve()
+        for file in sorted(repo_root.glob("examples/*.tim")):
+            with self.subTest(file=file.name):
+                self.assertEqual(self._check(file, False), self._check(file, True))
+
+    def test_separate_passes_errors(self):
+        sources: list[str] = [
+            # a variable with an invalid initial value is still declared
+            'u32 x = y + 1\nprintln("{x}")\n',
+            'u32 x = "text" + 1\nprintln("{x}")\n',
+            "u8 a = unknown\nu8 b = 1\nu8 b = 2\nvoid f():\n    return 1\nu8 c = c\n",
+            "u32 value = 1\nu32 value = 2\nvalue = value + 1\n",
+        ]
+        for source in sources:
+            with self.subTest(source=source), tempfile.TemporaryDirectory() as folder:
+                file: Path = Path(folder) / "errors.tim"
+                file.write_text(source)
+                fused: tuple[list[str] | None, str] = self._check(file, False)
+                self.assertIsNone(fused[0])
+                self.assertEqual(fused, self._check(file, True))
+
+    def test_all_errors(self):
+        # the errors of the scoping and the typing are found in the same walk (only the scoping errors are reported)
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "errors.tim"
+            file.write_text("u8 a = unknown\nu8 b = 1\nu8 b = 2\nvoid f():\n    return 1\nu8 c = c\n")
+            check_pass: CheckPass = CheckPass(self._generate_ast(file))
+            with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+                check_pass.run()
+        messages: list[str] = [str(error) for error in check_pass._errors]
+        self.assertEqual(len(messages), 4)
+        self.assertIn("unknown identifier 'unknown'", messages[0])
+        self.assertIn("identifier 'b' already exists", messages[1])
+        self.assertIn("void function expects no return value", messages[2])
+        # like the scoping pass, a variable can't be used in its own initial value
+        self.assertIn("unknown identifier 'c'", messages[3])
@@ -35,6 +35,9 @@ class TestAstGenerator(unittest.TestCase):
     def test_ast_generator_functions(self):
         self._run_compilation_test("functions.tim", "result_functions.txt")
 
+    def test_ast_generator_expressions(self):
+        self._run_compilation_test("expressions.tim", "result_expressions.txt")
+
     def _run_compilation_test(self, tim_file: str, result_statements_file: str):
         # make sure to pass a resolved path to the tokenizer and ast generator
         this_folder: Path = Path(__file__).parent.resolve()
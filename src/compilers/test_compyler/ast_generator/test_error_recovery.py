@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.ast_generator import AstGenerator
+from compyler.errors.ast_error import AstError
+from compyler.errors.ast_errors import AstErrors
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+from compyler.types.type_applier import TypeApplier
+from compyler.types.type_resolver import TypeResolver
+from compyler.types.types import Types
+from compyler.utils.stream import Stream
+
+# a source with an error in every other statement, also in the (nested) blocks and the class body
+SOURCE: str = """u8 f(u8 a):
+    u8 b = )
+    if a:
+        u8 c = 1 +
+    else:
+        u8 d = (
+    return a
+class Foo:
+    u8 x = 1
+    garbage here
+    u8 y(:
+        u8 z = 1
+    u8 w = 2
+if 1 +:
+    u8 q = 1
+else:
+    u8 r = 1
+u8 ok = 1
+u8 bad = *
+"""
+
+
+class TestErrorRecovery(unittest.TestCase):
+    def _generate(self, source: str, streaming: bool = False) -> list[int]:
+        """generates the AST of the source, returns the line numbers of the errors"""
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "errors.tim"
+            file.write_text(source)
+            if streaming:
+                types: Types = TypeResolver(Tokenizer(file).iter_tokens()).resolve()
+                ast_generator = AstGenerator(
+                    file, TypeApplier(file, types).apply_iter(Tokenizer(file).iter_tokens()), types
+                )
+            else:
+                tokens: Stream[Token] = Tokenizer(file).tokenize()
+                types: Types = TypeResolver(tokens).resolve()
+                ast_generator = AstGenerator(file, TypeApplier(file, types).apply(tokens), types)
+            # the errors are printed, after which the generator exits
+            with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+                ast_generator.generate()
+            lines: list[int] = []
+            for error in ast_generator._errors:
+                assert isinstance(error, AstError)
+                errors: list[AstError] = error.errors if isinstance(error, AstErrors) else [error]
+                lines.extend(error._source_line()[0] for error in errors)
+            return lines
+
+    def test_all_errors(self):
+        # every error is reported once, the statements after an error are parsed as usual
+        for streaming in [False, True]:
+            with self.subTest(streaming=streaming):
+                self.assertListEqual(self._generate(SOURCE, streaming), [2, 4, 6, 10, 11, 14, 19])
+
+    def test_type_applier_errors_while_streaming(self):
+        # the invalid list types are only reported by the type applier, after the errors of the parser
+        self.assertListEqual(self._generate("list[u8 a\nu8 b = 1\nlist[x] c\nu8 d = )\n", True), [4, 1, 3])
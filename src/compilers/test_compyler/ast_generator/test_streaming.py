@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from collections.abc import Iterator
+from pathlib import Path
+import unittest
+
+from compyler.ast_generator import AstGenerator
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+from compyler.types.type_applier import TypeApplier
+from compyler.types.type_resolver import TypeResolver
+from compyler.types.types import Types
+from compyler.utils.ast import AST
+from compyler.utils.stream import Stream
+from compyler.ast_checks.ast_check import AstCheck
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.this_folder: Path = Path(__file__).parent.resolve()
+        self.files: list[Path] = sorted(self.this_folder.glob("*.tim"))
+        self.assertTrue(self.files)
+
+    def test_iter_tokens(self):
+        # the lazily tokenized tokens should be the same as the tokens of the token stream
+        for file in self.files:
+            with self.subTest(file=file.name):
+                tokens: list[Token] = Tokenizer(file).tokenize().objects
+                lazy_tokens: list[Token] = list(Tokenizer(file).iter_tokens())
+                self.assertListEqual([repr(token) for token in lazy_tokens], [repr(token) for token in tokens])
+
+    def test_streaming_ast(self):
+        # the AST generated from the lazy tokens should be the same as the AST generated from the token stream
+        for file in self.files:
+            with self.subTest(file=file.name):
+                tokens: Stream[Token] = Tokenizer(file).tokenize()
+                types: Types = TypeResolver(tokens).resolve()
+                TypeApplier(file, types).apply(tokens)
+                ast: AST = AstGenerator(file, tokens, types).generate()
+                AstCheck(ast).run()
+
+                streaming_types: Types = TypeResolver(Tokenizer(file).iter_tokens()).resolve()
+                streaming_tokens: Iterator[Token] = TypeApplier(file, streaming_types).apply_iter(Tokenizer(file).iter_tokens())
+                streaming_ast: AST = AstGenerator(file, streaming_tokens, streaming_types).generate()
+                AstCheck(streaming_ast).run()
+
+                code: list[str] = [statement.c_code() for statement in ast.statements.objects]
+                streaming_code: list[str] = [statement.c_code() for statement in streaming_ast.statements.objects]
+                self.assertListEqual(streaming_code, code)
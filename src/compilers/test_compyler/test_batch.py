@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+import io
+import multiprocessing
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from compyler.__main__ import argument_parser
+from compyler.batch import compile_batch
+
+
+class TestBatch(unittest.TestCase):
+    @unittest.skipIf(shutil.which("gcc") is None, "gcc is needed to compile the files")
+    def test_compile_batch(self):
+        repo_root: Path = Path(__file__).parents[3].resolve()
+        files: list[Path] = [repo_root / "examples" / "print_example.tim", repo_root / "examples" / "collections.tim"]
+        # the worker processes don't import the __main__ module with the forkserver start method (the default on
+        # linux since python 3.14), so run the pool with it to make sure the worker can be found by the processes
+        executor = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("forkserver"))
+        with tempfile.TemporaryDirectory() as folder:
+            # the build folders are created in the temporary folder, instead of in the build folder of the repo
+            with patch("compyler.batch.ProcessPoolExecutor", executor), patch("compyler.batch.repo_root", Path(folder)):
+                output: io.StringIO = io.StringIO()
+                with redirect_stdout(output):
+                    success: bool = compile_batch(files, argument_parser(["-q", *map(str, files)]))
+            self.assertTrue(success, output.getvalue())
+            self.assertIn("2 of 2 files compiled successfully", output.getvalue())
+            for name in ["print_example", "collections"]:
+                self.assertTrue((Path(folder) / "build" / "compyler" / "batch" / name / "main").is_file())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import argparse
+from contextlib import redirect_stderr
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.__main__ import argument_parser
+
+
+class TestArgumentParser(unittest.TestCase):
+    def test_pgo(self):
+        # the pgo switch doesn't take the file to compile as its training input
+        args: argparse.Namespace = argument_parser(["--pgo", "examples/hello_world.tim"])
+        self.assertTrue(args.pgo)
+        self.assertEqual(args.files, [Path("examples/hello_world.tim")])
+        self.assertEqual(args.pgo_input, Path("/dev/null"))
+
+        args = argument_parser(["--pgo", "--pgo-input", "input.txt", "examples/hello_world.tim"])
+        self.assertTrue(args.pgo)
+        self.assertEqual(args.files, [Path("examples/hello_world.tim")])
+        self.assertEqual(args.pgo_input, Path("input.txt"))
+
+        args = argument_parser(["examples/hello_world.tim"])
+        self.assertFalse(args.pgo)
+
+    def test_batch_options(self):
+        # the options of a single compilation are rejected for a batch, instead of being ignored
+        for option in ["--watch", "--profile", "--timings"]:
+            with self.subTest(option=option):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                    argument_parser([option, "a.tim", "b.tim"])
+                with tempfile.TemporaryDirectory() as folder:
+                    with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                        argument_parser([option, folder])
+                self.assertTrue(getattr(argument_parser([option, "a.tim"]), option[2:]))
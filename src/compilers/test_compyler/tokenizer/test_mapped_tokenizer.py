@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.build import create_tokenizer
+from compyler.mapped_tokenizer import MappedTokenizer
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+from compyler.tokens.token_type import TokenType
+from compyler.utils.source_location import SourceLocation
+
+
+class TestMappedTokenizer(unittest.TestCase):
+    def assert_same_tokens(self, file: Path):
+        tokenizer: Tokenizer = Tokenizer(file)
+        mapped_tokenizer: MappedTokenizer = MappedTokenizer(file)
+        tokens: list[Token] = tokenizer.tokenize().objects
+        mapped_tokens: list[Token] = mapped_tokenizer.tokenize().objects
+        # the repr contains the token type, source location and value of the token
+        self.assertListEqual([repr(token) for token in mapped_tokens], [repr(token) for token in tokens])
+        self.assertListEqual([type(token) for token in mapped_tokens], [type(token) for token in tokens])
+        # also the comments and additional newlines should be the same
+        discarded: list[Token] = tokenizer._discarded_tokens.objects
+        mapped_discarded: list[Token] = mapped_tokenizer._discarded_tokens.objects
+        self.assertListEqual([repr(token) for token in mapped_discarded], [repr(token) for token in discarded])
+
+    def tokenize_source(self, source: str) -> list[Token]:
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "source.tim"
+            file.write_text(source)
+            self.assert_same_tokens(file)
+            return MappedTokenizer(file).tokenize().objects
+
+    def test_tim_files(self):
+        # compare the token streams of all .tim files in the repo
+        repo_root: Path = Path(__file__).parents[4].resolve()
+        files: list[Path] = sorted(repo_root.glob("examples/*.tim")) + sorted(repo_root.glob("src/**/*.tim"))
+        self.assertTrue(files)
+        for file in files:
+            with self.subTest(file=file.name):
+                self.assert_same_tokens(file)
+
+    def test_edge_cases(self):
+        # numbers next to identifiers, 0b/0x numbers, keywords, comments, strings and errors
+        self.tokenize_source(
+            "u8 a = 0123 + 0b101 - 0x1F-- --=0b 0x 0\n"
+            "    if (a>=b&&c||!d): a/=2 // comment\n"
+            "  /* block\ncomment */ b = '\\n' + 12ab + whiles\n"
+            '\n\nprint("value {a + 1} {b}\\n")\n'
+            '\tx @ "unterminated\n'
+            "/* unterminated"
+        )
+        self.tokenize_source("// comment at the end of the file")
+        self.tokenize_source('"unterminated string at the end of the file')
+
+    def test_empty_file(self):
+        tokens: list[Token] = self.tokenize_source("")
+        self.assertListEqual([token.token_type for token in tokens], [TokenType.EOF])
+
+    def test_utf8(self):
+        # the strings are decoded, the source locations are byte offsets
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "utf8.tim"
+            file.write_text('println("héllo {a}")\n')
+            tokens: list[Token] = MappedTokenizer(file).tokenize().objects
+        string_token: Token = tokens[3]
+        self.assertEqual(string_token.token_type, TokenType.STRING_CHARS)
+        self.assertEqual(str(string_token), "héllo ")
+        self.assertEqual(string_token.source_location, SourceLocation(9, 7))
+        self.assertEqual(tokens[4].source_location, SourceLocation(16, 1))
+
+    def test_fallback(self):
+        # the byte offsets differ from the character offsets for '\r\n' line endings and non-ascii characters,
+        # those files are tokenized by the classic tokenizer, so the diagnostics find the correct lines
+        sources: dict[str, bytes] = {
+            "ascii.tim": b'u8 a = 1\nprintln("{a}")\n',
+            "crlf.tim": b'u8 a = 1\r\nprintln("{a}")\r\n',
+            "utf8.tim": 'u8 a = 1\nprintln("h\u00e9llo {a}")\n'.encode(),
+        }
+        with tempfile.TemporaryDirectory() as folder:
+            for name, source in sources.items():
+                with self.subTest(file=name):
+                    file: Path = Path(folder) / name
+                    file.write_bytes(source)
+                    tokenizer: Tokenizer = create_tokenizer(file, "mapped")
+                    self.assertIs(type(tokenizer), MappedTokenizer if name == "ascii.tim" else Tokenizer)
+                    tokens: list[Token] = tokenizer.tokenize().objects
+                    classic_tokens: list[Token] = Tokenizer(file).tokenize().objects
+                    self.assertListEqual([repr(token) for token in tokens], [repr(token) for token in classic_tokens])
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.regex_tokenizer import RegexTokenizer
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+
+
+class TestRegexTokenizer(unittest.TestCase):
+    def assert_same_tokens(self, file: Path):
+        tokenizer: Tokenizer = Tokenizer(file)
+        regex_tokenizer: RegexTokenizer = RegexTokenizer(file)
+        tokens: list[Token] = tokenizer.tokenize().objects
+        regex_tokens: list[Token] = regex_tokenizer.tokenize().objects
+        # the repr contains the token type, source location and value of the token
+        self.assertListEqual([repr(token) for token in regex_tokens], [repr(token) for token in tokens])
+        self.assertListEqual([type(token) for token in regex_tokens], [type(token) for token in tokens])
+        # also the comments and additional newlines should be the same
+        discarded: list[Token] = tokenizer._discarded_tokens.objects
+        regex_discarded: list[Token] = regex_tokenizer._discarded_tokens.objects
+        self.assertListEqual([repr(token) for token in regex_discarded], [repr(token) for token in discarded])
+
+    def test_tim_files(self):
+        # compare the token streams of all .tim files in the repo
+        repo_root: Path = Path(__file__).parents[4].resolve()
+        files: list[Path] = sorted(repo_root.glob("examples/*.tim")) + sorted(repo_root.glob("src/**/*.tim"))
+        self.assertTrue(files)
+        for file in files:
+            with self.subTest(file=file.name):
+                self.assert_same_tokens(file)
+
+    def test_edge_cases(self):
+        # numbers next to identifiers, 0b/0x numbers, longest operators, comments, strings and errors
+        source: str = (
+            "u8 a = 0123 + 0b101 - 0x1F-- --=0b 0x\n"
+            "    if (a>=b&&c||!d): a/=2 // comment\n"
+            "  /* block\ncomment */ b = '\\n' + 12ab\n"
+            '\n\nprint("value {a + 1} {b}\\n")\r\n'
+            "\tx @ 0"
+        )
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "edge_cases.tim"
+            file.write_text(source)
+            self.assert_same_tokens(file)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.errors.ast_error import AstError
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.compact_tokens import CompactTokens
+from compyler.tokens.token import Token
+from compyler.tokens.token_type import TokenType
+from compyler.types.type_applier import TypeApplier
+from compyler.types.type_resolver import TypeResolver
+from compyler.types.types import Types
+from compyler.utils.stream import Stream
+
+
+class TestCompactTokens(unittest.TestCase):
+    def setUp(self):
+        # all .tim files in the repo
+        repo_root: Path = Path(__file__).parents[4].resolve()
+        self.files: list[Path] = sorted(repo_root.glob("examples/*.tim")) + sorted(repo_root.glob("src/**/*.tim"))
+        self.assertTrue(self.files)
+
+    def test_round_trip(self):
+        # the tokens constructed from the compact tokens should be the same as the stored tokens
+        for file in self.files:
+            with self.subTest(file=file.name):
+                tokens: list[Token] = Tokenizer(file).tokenize().objects
+                compact_tokens: CompactTokens = CompactTokens.from_tokens(tokens)
+                self.assertEqual(len(compact_tokens), len(tokens))
+                compact_list: list[Token] = list(compact_tokens.iter())
+                self.assertListEqual([repr(token) for token in compact_list], [repr(token) for token in tokens])
+                self.assertListEqual([type(token) for token in compact_list], [type(token) for token in tokens])
+
+    def test_interned_values(self):
+        compact_tokens: CompactTokens = CompactTokens()
+        compact_tokens.append(TokenType.IDENTIFIER, 0, 1, "a")
+        compact_tokens.append(TokenType.NUMBER, 2, 1, 1)
+        compact_tokens.append(TokenType.IDENTIFIER, 4, 1, "a")
+        compact_tokens.append(TokenType.STRING_CHARS, 6, 1, "1")
+        compact_tokens.append(TokenType.NEWLINE, 7, 1)
+        # the same values share the same index in the value table
+        self.assertEqual(compact_tokens.value_index(0), compact_tokens.value_index(2))
+        self.assertNotEqual(compact_tokens.value_index(1), compact_tokens.value_index(3))
+        self.assertEqual(compact_tokens.value_index(4), 0)
+        self.assertEqual(compact_tokens.value(1), 1)
+        self.assertIsNone(compact_tokens.value(4))
+        with self.assertRaises(IndexError):
+            compact_tokens[5]
+
+    def test_typing_passes(self):
+        # the compact typing passes should give the same tokens and types as the typing passes of the token stream
+        for file in self.files:
+            with self.subTest(file=file.name):
+                tokens: Stream[Token] = Tokenizer(file).tokenize()
+                types: Types = TypeResolver(tokens).resolve()
+                compact_tokens: CompactTokens = CompactTokens.from_tokens(Tokenizer(file).iter_tokens())
+                compact_types: Types = TypeResolver(compact_tokens).resolve()
+                try:
+                    TypeApplier(file, types).apply(tokens)
+                except AstError:
+                    # files with invalid list types should also raise an error with the compact tokens
+                    with self.assertRaises(AstError):
+                        TypeApplier(file, compact_types).apply_compact(compact_tokens)
+                    continue
+                compact_tokens = TypeApplier(file, compact_types).apply_compact(compact_tokens)
+
+                compact_list: list[Token] = list(compact_tokens.iter())
+                self.assertListEqual([repr(token) for token in compact_list], [repr(token) for token in tokens.objects])
+                self.assertListEqual([str(token) for token in compact_list], [str(token) for token in tokens.objects])
+                self.assertListEqual(sorted(compact_types._types), sorted(types._types))
+
+    def test_invalid_list_type(self):
+        for source in ["list[u8 a\n", "list[unknown] a\n", "list["]:
+            with self.subTest(source=source), tempfile.TemporaryDirectory() as folder:
+                file: Path = Path(folder) / "invalid_list_type.tim"
+                file.write_text(source)
+                compact_tokens: CompactTokens = CompactTokens.from_tokens(Tokenizer(file).iter_tokens())
+                types: Types = TypeResolver(compact_tokens).resolve()
+                with self.assertRaises(AstError):
+                    TypeApplier(file, types).apply_compact(compact_tokens)
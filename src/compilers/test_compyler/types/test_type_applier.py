@@ -5,15 +5,19 @@
 # This file is part of compyler, a TAPL compiler.
 
 from pathlib import Path
+import tempfile
 import unittest
 
+from compyler.errors.ast_errors import AstErrors
 from compyler.tokenizer import Tokenizer
 from compyler.tokens.identifier_token import IdentifierToken
 from compyler.tokens.token import Token
+from compyler.tokens.token_type import TokenType
 from compyler.tokens.type_token import TypeToken
 from compyler.types.type_applier import TypeApplier
 from compyler.types.type_resolver import TypeResolver
 from compyler.types.types import Types
+from compyler.utils.source_location import SourceLocation
 from compyler.utils.stream import Stream
 
 
@@ -57,3 +61,34 @@ class TestTypeApplier(unittest.TestCase):
         self.assertNotIn("string", identifier_values)
         self.assertNotIn("bool", identifier_values)
         # ClassName and OtherClass also exist in the declarations, so don't check
+
+    def test_list_types(self):
+        # the list types are replaced by a single TypeToken, spanning from list to the closing bracket
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "list_types.tim"
+            file.write_text("class Item:\n    u8 value\nlist[u8] bytes\nlist[Item] items\n")
+            tokens: Stream[Token] = Tokenizer(file).tokenize()
+            types: Types = TypeResolver(tokens).resolve()
+            tokens = TypeApplier(file, types).apply(tokens)
+
+        type_tokens: list[TypeToken] = [token for token in tokens.objects if isinstance(token, TypeToken)]
+        self.assertListEqual([token.type_.keyword for token in type_tokens], ["Item", "u8", "list[u8]", "list[Item]"])
+        self.assertEqual(type_tokens[2].source_location, SourceLocation(25, 8))
+        self.assertEqual(type_tokens[3].source_location, SourceLocation(40, 10))
+        # the list tokens and brackets are replaced
+        token_types: list[TokenType] = [token.token_type for token in tokens.objects]
+        self.assertNotIn(TokenType.LIST, token_types)
+        self.assertNotIn(TokenType.BRACKET_OPEN, token_types)
+
+    def test_all_errors(self):
+        # the pass continues after an invalid list type, all errors are raised together
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "invalid_list_types.tim"
+            file.write_text("list[u8 a\nlist[u8] b\nlist[unknown] c\n")
+            tokens: Stream[Token] = Tokenizer(file).tokenize()
+            types: Types = TypeResolver(tokens).resolve()
+            with self.assertRaises(AstErrors) as context:
+                TypeApplier(file, types).apply(tokens)
+            self.assertListEqual([error.source_location.start for error in context.exception.errors], [8, 26])
+            # the valid list type is still applied
+            self.assertIsNotNone(types.get("list[u8]"))
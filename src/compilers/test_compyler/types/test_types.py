@@ -9,6 +9,7 @@
 
 import unittest
 
+from compyler.types.list_type import ListType
 from compyler.types.numeric_type import NumericType
 from compyler.types.type import Type
 from compyler.types.types import Types
@@ -91,3 +92,56 @@ class TestTypes(unittest.TestCase):
         self.assertTrue(u1.can_promote_to(u8))
         self.assertFalse(u1.can_promote_to(s8))
         self.assertFalse(u1.can_promote_to(f32))
+
+    def test_interned_types(self):
+        # test that the types are shared, and that the reference variant doesn't modify the shared type
+        types: Types = Types()
+        self.assertIs(types.get("u8"), types.get("u8"))
+        self.assertIs(types["bool"], types["u1"])
+        list_type: Type = types.add_list_type(types["u8"])
+        self.assertIs(types["list[u8]"], list_type)
+
+        reference_type: Type = list_type.as_reference()
+        self.assertIsInstance(reference_type, ListType)
+        self.assertTrue(reference_type.is_reference)
+        self.assertFalse(list_type.is_reference)
+        self.assertEqual(reference_type, list_type)
+        self.assertEqual(reference_type.c_code(), "list_u8*")
+        # the reference variant is created once
+        self.assertIs(list_type.as_reference(), reference_type)
+        self.assertIs(reference_type.as_reference(), reference_type)
+
+    def test_hashable_types(self):
+        # test that types can be used as dict and set keys, and have a unique type id
+        types: Types = Types()
+        class_type: Type = types.add_class_type("ClassName")
+        type_names: dict[Type, str] = {types["u8"]: "u8", class_type: "ClassName"}
+        self.assertEqual(type_names[types["u8"]], "u8")
+        self.assertEqual(type_names[class_type.as_reference()], "ClassName")
+        self.assertEqual(len({types["u1"], types["bool"], types["u8"]}), 2)
+        type_ids: set[int] = {type_.type_id for type_ in types._types.values()}
+        self.assertEqual(len(type_ids), len(set(map(id, types._types.values()))))
+        self.assertNotIn(-1, type_ids)
+
+    def test_common_type(self):
+        # test the combined types of the precomputed table, and of the added types
+        types: Types = Types()
+        u8: Type = types["u8"]
+        base: Type = types["base"]
+        self.assertIs(types.common_type(u8, u8), u8)
+        self.assertIs(types.common_type(u8, base), u8)
+        self.assertIs(types.common_type(base, u8), u8)
+        self.assertIs(types.common_type(base, base), base)
+        self.assertIsNone(types.common_type(u8, types["u16"]))
+        self.assertIsNone(types.common_type(u8, types["string"]))
+        self.assertIsNone(types.common_type(types["string"], base))
+        class_type: Type = types.add_class_type("ClassName")
+        self.assertIs(types.common_type(class_type, class_type.as_reference()), class_type)
+        self.assertIsNone(types.common_type(class_type, u8))
+
+    def test_value_range(self):
+        types: Types = Types()
+        for keyword, value_range in [("u1", (0, 1)), ("u8", (0, 255)), ("s8", (-128, 127)), ("f32", None)]:
+            numeric_type: Type = types[keyword]
+            assert type(numeric_type) == NumericType
+            self.assertEqual(numeric_type.value_range, value_range)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from contextlib import redirect_stdout
+import io
+import marshal
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.ast_checks.ast_check import AstCheck
+from compyler.ast_generator import AstGenerator
+from compyler.tokenizer import Tokenizer
+from compyler.tokens.token import Token
+from compyler.types.type_applier import TypeApplier
+from compyler.types.type_resolver import TypeResolver
+from compyler.types.types import Types
+from compyler.utils.ast import AST
+from compyler.utils.ast_cache import AstCache
+from compyler.utils.ast_serializer import AstSerializer
+from compyler.utils.stream import Stream
+
+
+class TestAstSerializer(unittest.TestCase):
+    def setUp(self):
+        # the checked ASTs of the .tim files in the repo without errors
+        repo_root: Path = Path(__file__).parents[4].resolve()
+        files: list[Path] = sorted(repo_root.glob("examples/*.tim")) + sorted(repo_root.glob("src/**/*.tim"))
+        self.asts: list[AST] = [ast for ast in map(self._checked_ast, files) if ast]
+        self.assertTrue(self.asts)
+
+    def _checked_ast(self, file: Path) -> AST | None:
+        """returns the checked AST of the file, None when the file has errors"""
+        try:
+            with redirect_stdout(io.StringIO()):
+                tokens: Stream[Token] = Tokenizer(file).tokenize()
+                types: Types = TypeResolver(tokens).resolve()
+                TypeApplier(file, types).apply(tokens)
+                ast: AST = AstGenerator(file, tokens, types).generate()
+                AstCheck(ast).run()
+            return ast
+        except BaseException:
+            return None
+
+    def test_round_trip(self):
+        # the loaded AST should generate the same code, with the same types
+        for ast in self.asts:
+            with self.subTest(file=ast.filename.name):
+                loaded: AST = AstSerializer().loads(AstSerializer().dumps(ast), ast.filename)
+                self.assertEqual(loaded.filename, ast.filename)
+                self.assertListEqual(
+                    [(type_.keyword, type_.type_id) for type_ in loaded.types.added_types()],
+                    [(type_.keyword, type_.type_id) for type_ in ast.types.added_types()],
+                )
+                self.assertListEqual(
+                    [repr(statement) for statement in loaded.statements.objects],
+                    [repr(statement) for statement in ast.statements.objects],
+                )
+                self.assertListEqual(
+                    [statement.c_code() for statement in loaded.statements.objects],
+                    [statement.c_code() for statement in ast.statements.objects],
+                )
+
+    def test_invalid_data(self):
+        serializer: AstSerializer = AstSerializer()
+        for data in [b"", b"invalid", marshal.dumps((AstSerializer.VERSION + 1, [], []))]:
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                serializer.loads(data, Path("invalid.tim"))
+
+    def test_ast_cache(self):
+        ast: AST = self.asts[0]
+        with tempfile.TemporaryDirectory() as folder:
+            ast_cache: AstCache = AstCache(Path(folder), "key")
+            self.assertIsNone(ast_cache.load(ast.filename))
+            ast_cache.store(ast)
+            loaded: AST | None = ast_cache.load(ast.filename)
+            assert loaded
+            self.assertListEqual([str(s) for s in loaded.statements.objects], [str(s) for s in ast.statements.objects])
+            # another key doesn't load the stored AST
+            self.assertIsNone(AstCache(Path(folder), "other_key").load(ast.filename))
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+import unittest
+
+from compyler.utils.c_emitter import CEmitter
+
+
+class TestCEmitter(unittest.TestCase):
+    def test_nested_blocks(self):
+        emitter = CEmitter()
+        emitter.emit("if (a) {\nfor (;;) {\nb++;\n}\n} else {\nc--;\n}")
+        expected = ["if (a) {\n", "    for (;;) {\n", "        b++;\n", "    }\n", "} else {\n", "    c--;\n", "}\n"]
+        self.assertListEqual(emitter.lines, expected)
+
+    def test_indent_level(self):
+        # the indentation level carries over to the next emitted code
+        emitter = CEmitter(indent_level=1)
+        emitter.emit("while (1) {").emit("break;").emit("}")
+        self.assertListEqual(emitter.lines, ["    while (1) {\n", "        break;\n", "    }\n"])
+
+    def test_ignored_braces(self):
+        # braces in literals and comments don't change the indentation
+        emitter = CEmitter()
+        emitter.emit('printf("{%c\\"{", \'}\'); // }\nx = 1;')
+        self.assertListEqual(emitter.lines, ['printf("{%c\\"{", \'}\'); // }\n', "x = 1;\n"])
+
+    def test_preprocessor_and_empty_lines(self):
+        emitter = CEmitter(indent_level=1)
+        emitter.emit("#include <stdio.h>\n\n  x = 1;")
+        self.assertListEqual(emitter.lines, ["#include <stdio.h>\n", "\n", "    x = 1;\n"])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+import unittest
+
+from compyler.utils.lookahead_buffer import LookaheadBuffer
+
+
+class TestLookaheadBuffer(unittest.TestCase):
+    def test_lazy(self):
+        taken: list[int] = []
+
+        def numbers():
+            for number in range(10):
+                taken.append(number)
+                yield number
+
+        buffer: LookaheadBuffer[int] = LookaheadBuffer(numbers())
+        # objects are only taken from the iterator when they're indexed
+        self.assertListEqual(taken, [])
+        self.assertEqual(buffer[2], 2)
+        self.assertListEqual(taken, [0, 1, 2])
+        self.assertEqual(buffer[0], 0)
+        self.assertListEqual(taken, [0, 1, 2])
+
+    def test_release(self):
+        buffer: LookaheadBuffer[int] = LookaheadBuffer(iter(range(10)))
+        self.assertEqual(buffer[5], 5)
+        buffer.release(4)
+        self.assertEqual(len(buffer._buffer), 2)
+        self.assertEqual(buffer[4], 4)
+        self.assertEqual(buffer[6], 6)
+        # released objects can't be indexed anymore
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+    def test_end(self):
+        buffer: LookaheadBuffer[int] = LookaheadBuffer(iter(range(3)))
+        self.assertEqual(buffer[2], 2)
+        with self.assertRaises(IndexError):
+            buffer[3]
+        # the end stays the end
+        with self.assertRaises(IndexError):
+            buffer[4]
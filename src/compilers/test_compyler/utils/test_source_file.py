@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from compyler.errors.ast_error import AstError
+from compyler.utils.source_file import SourceFile
+from compyler.utils.source_file import source_files
+from compyler.utils.source_location import SourceLocation
+
+
+class TestSourceFile(unittest.TestCase):
+    def test_line_number(self):
+        # the line numbers should be the same as counting the newlines before the offset
+        for text in ["", "\n", "a", "a\n", "ab\ncd\n\nef", "\n\nab\n"]:
+            source_file: SourceFile = SourceFile(Path("test.tim"), text)
+            for offset in range(len(text) + 1):
+                with self.subTest(text=text, offset=offset):
+                    self.assertEqual(source_file.line_number(offset), text[:offset].count("\n") + 1)
+            self.assertEqual(source_file.line_number(len(text) + 1), -1)
+
+    def test_line(self):
+        # the lines should be the same as the lines of the file
+        for text in ["", "\n", "a", "a\n", "ab\ncd\n\nef", "\n\nab\n"]:
+            source_file: SourceFile = SourceFile(Path("test.tim"), text)
+            lines: list[str] = text.splitlines()
+            self.assertEqual(source_file.num_lines, len(lines))
+            for line in range(1, len(lines) + 1):
+                self.assertEqual(source_file.line(line), lines[line - 1])
+            self.assertIsNone(source_file.line(0))
+            self.assertIsNone(source_file.line(len(lines) + 1))
+
+    def test_column(self):
+        source_file: SourceFile = SourceFile(Path("test.tim"), "ab\ncd\n")
+        self.assertEqual(source_file.column(0), 1)
+        self.assertEqual(source_file.column(2), 3)
+        self.assertEqual(source_file.column(4), 2)
+        self.assertEqual(source_file.column(7), -1)
+
+    def test_shared_source_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            file: Path = Path(folder) / "test.tim"
+            file.write_text("u8 a = 1\nu8 b = c\n")
+            source_file: SourceFile = source_files.get(file)
+            self.assertIs(source_files.get(file), source_file)
+            # the error is formatted when it's printed, with the line from the shared source file
+            error: AstError = AstError("unknown identifier", file, SourceLocation(16, 1))
+            self.assertIn(f"{file}:2:", str(error))
+            self.assertTrue(str(error).endswith("   2 | u8 b = c"))
+            # a changed file is read again
+            file.write_text("u8 a = 1\n")
+            self.assertIsNot(source_files.get(file), source_file)
@@ -36,3 +36,10 @@ class TestSourceLocation(unittest.TestCase):
         location = SourceLocation(2, 3) + SourceLocation(1, 3)
         self.assertEqual(location.start, 1)
         self.assertEqual(location.length, 4)
+
+    def test_immutable(self):
+        location = SourceLocation(1, 3)
+        with self.assertRaises(AttributeError):
+            location.start = 2  # type: ignore
+        # immutable source locations can be used as keys
+        self.assertEqual({SourceLocation(1, 3): "location"}[location], "location")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 Tim Klein Nijenhuis <tim@hetorus.nl>
+#
+# This file is part of compyler, a TAPL compiler.
+#
+# don't report this, as the unittests access private members:
+# pyright: reportPrivateUsage=false
+
+import random
+import unittest
+
+from compyler.utils.stream import Stream
+
+
+class TestStreamGapBuffer(unittest.TestCase):
+    def test_replacements_during_pass(self):
+        # replace objects while iterating, and compare the stream with the same replacements on a list
+        rng: random.Random = random.Random(1337)
+        stream: Stream[int] = Stream()
+        stream.add(*range(1000))
+        expected: list[int] = list(range(1000))
+        index: int = 0
+        for value in stream.iter():
+            self.assertEqual(value, expected[index])
+            count: int = rng.choice([0, 1, 2, 4])
+            count = min(count, len(expected) - index)
+            if rng.random() < 0.3:
+                stream.replace(count, -value)
+                expected[index : index + count] = [-value]
+            index = stream._index
+            self.assertEqual(len(stream), len(expected))
+        self.assertListEqual(stream.objects, expected)
+
+    def test_gap_moves_with_iterator(self):
+        stream: Stream[int] = Stream()
+        stream.add(*range(100))
+        iterator = stream.iter()
+        for _ in range(10):
+            next(iterator)
+        stream.replace(4, 1337)
+        # the gap is at the replacement, the objects after it are unaffected by the replacement
+        self.assertEqual(stream._gap_start, 10)
+        self.assertGreater(stream._gap_end, stream._gap_start)
+        self.assertEqual(stream.iter_next(), 13)
+        self.assertEqual(stream.last(), 99)
+        # adding objects appends them after the gap
+        stream.add(100)
+        self.assertEqual(stream.last(), 100)
+        self.assertEqual(len(stream), 98)
+        # accessing the objects closes the gap
+        self.assertListEqual(stream.objects, list(range(9)) + [1337] + list(range(13, 101)))
+        self.assertEqual(stream._gap_start, stream._gap_end)
+
+    def test_objects_assignment(self):
+        stream: Stream[int] = Stream()
+        stream.add(1, 2, 3)
+        next(stream.iter())
+        stream.replace(2, 4)
+        stream.objects = [5, 6]
+        self.assertEqual(len(stream), 2)
+        self.assertListEqual([5, 6], list(stream.iter()))